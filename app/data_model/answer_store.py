@@ -26,6 +26,7 @@ class AnswerStore:
         """
         self.answer_map = self._build_map(existing_answers or [])
         self._is_dirty = False
+        self._revision = 0
 
     def __iter__(self):
         return iter(self.answer_map.values())
@@ -55,6 +56,11 @@ class AnswerStore:
     def is_dirty(self):
         return self._is_dirty
 
+    @property
+    def revision(self):
+        """ A number that changes whenever an answer is added, updated or removed. """
+        return self._revision
+
     def add_or_update(self, answer: Answer):
         """
         Add a new answer into the answer store, or update if it exists.
@@ -66,6 +72,7 @@ class AnswerStore:
 
         if existing_answer != answer:
             self._is_dirty = True
+            self._revision += 1
             self.answer_map[key] = answer
 
     def get_answer(self, answer_id: str, list_item_id: str = None) -> Optional[Answer]:
@@ -106,6 +113,7 @@ class AnswerStore:
         Clears answers *in place*
         """
         self.answer_map.clear()
+        self._revision += 1
 
     def remove_answer(self, answer_id: str, list_item_id: str = None):
         """
@@ -115,6 +123,7 @@ class AnswerStore:
         if self.answer_map.get((answer_id, list_item_id)):
             del self.answer_map[(answer_id, list_item_id)]
             self._is_dirty = True
+            self._revision += 1
 
     def remove_all_answers_for_list_item_id(self, list_item_id: str):
         """Remove all answers associated with a particular list_item_id.
@@ -130,6 +139,7 @@ class AnswerStore:
         for key in keys_to_delete:
             del self.answer_map[key]
             self._is_dirty = True
+            self._revision += 1
 
     def serialise(self):
         return list(self.answer_map.values())
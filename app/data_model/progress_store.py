@@ -1,5 +1,5 @@
 from dataclasses import astuple, dataclass
-from typing import Iterable, List, Mapping, MutableMapping, Optional
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional
 
 from app.data_model.progress import Progress
 from app.questionnaire.location import Location
@@ -31,6 +31,12 @@ class ProgressStore:
         self._progress = self._build_map(
             in_progress_sections or []
         )  # type: MutableMapping
+        # The completed block ids of each section, as ordered sets, so that
+        # checking a block is complete doesn't search the section's list
+        self._completed_block_ids = {
+            section_key: dict.fromkeys(section_progress.block_ids)
+            for section_key, section_progress in self._progress.items()
+        }  # type: Dict[tuple, Dict[Optional[str], None]]
 
     def __contains__(self, section_key) -> bool:
         return section_key in self._progress
@@ -69,10 +75,17 @@ class ProgressStore:
     def is_section_complete(
         self, section_id: str, list_item_id: Optional[str] = None
     ) -> bool:
-        return (section_id, list_item_id) in self.section_keys(
-            statuses={CompletionStatus.COMPLETED}
+        section_progress = self._progress.get((section_id, list_item_id))
+        return (
+            section_progress is not None
+            and section_progress.status == CompletionStatus.COMPLETED
         )
 
+    def is_block_complete(
+        self, block_id: str, section_id: str, list_item_id: Optional[str] = None
+    ) -> bool:
+        return block_id in self._completed_block_ids.get((section_id, list_item_id), ())
+
     def section_keys(
         self, statuses: Iterable[str] = None, section_ids: Iterable[str] = None
     ):
@@ -122,39 +135,35 @@ class ProgressStore:
         return []
 
     def add_completed_location(self, location: Location) -> None:
-
-        section_id = location.section_id
-        list_item_id = location.list_item_id
-
-        completed_block_ids = self.get_completed_block_ids(section_id, list_item_id)
+        section_key = (location.section_id, location.list_item_id)
+        completed_block_ids = self._completed_block_ids.setdefault(section_key, {})
 
         if location.block_id not in completed_block_ids:
-            completed_block_ids.append(location.block_id)
-
-            section_key = (section_id, list_item_id)
+            completed_block_ids[location.block_id] = None
 
             if section_key in self._progress:
-                self._progress[section_key].block_ids = completed_block_ids
+                self._progress[section_key].block_ids.append(location.block_id)
             else:
                 self._progress[section_key] = Progress(
-                    section_id=section_id,
-                    list_item_id=list_item_id,
-                    block_ids=completed_block_ids,
+                    section_id=location.section_id,
+                    list_item_id=location.list_item_id,
+                    block_ids=[location.block_id],
                 )
 
             self._is_dirty = True
 
     def remove_completed_location(self, location: Location) -> None:
-
         section_key = (location.section_id, location.list_item_id)
-        if (
-            section_key in self._progress
-            and location.block_id in self._progress[section_key].block_ids
-        ):
-            self._progress[section_key].block_ids.remove(location.block_id)
+        completed_block_ids = self._completed_block_ids.get(section_key, {})
 
-            if not self._progress[section_key].block_ids:
+        if location.block_id in completed_block_ids:
+            del completed_block_ids[location.block_id]
+
+            if completed_block_ids:
+                self._progress[section_key].block_ids = list(completed_block_ids)
+            else:
                 del self._progress[section_key]
+                del self._completed_block_ids[section_key]
 
             self._is_dirty = True
 
@@ -173,6 +182,7 @@ class ProgressStore:
 
         for section_key in section_keys_to_delete:
             del self._progress[section_key]
+            del self._completed_block_ids[section_key]
 
             self._is_dirty = True
 
@@ -181,4 +191,5 @@ class ProgressStore:
 
     def clear(self) -> None:
         self._progress.clear()
+        self._completed_block_ids.clear()
         self._is_dirty = True
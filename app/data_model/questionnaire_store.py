@@ -1,3 +1,4 @@
+import hashlib
 from types import MappingProxyType
 
 import simplejson as json
@@ -22,10 +23,12 @@ class QuestionnaireStore:
         self.list_store = ListStore()
         self.answer_store = AnswerStore()
         self.progress_store = ProgressStore()
+        self._loaded_state_key = None
 
         raw_data, version = self._storage.get_user_data()
         if raw_data:
             self._deserialise(raw_data)
+            self._loaded_state_key = hashlib.sha256(raw_data.encode()).hexdigest()
         if version is not None:
             self.version = version
 
@@ -39,9 +42,25 @@ class QuestionnaireStore:
         """
         self._metadata = to_set
         self.metadata = MappingProxyType(self._metadata)
+        self._loaded_state_key = None
 
         return self
 
+    @property
+    def state_key(self):
+        """
+        Identifies the stored data the questionnaire was loaded from, so that what
+        is built from it can be cached. None if there was no stored data, or if
+        the metadata, answers, lists or progress have changed since it was loaded.
+        """
+        if any(
+            store.is_dirty
+            for store in (self.answer_store, self.list_store, self.progress_store)
+        ):
+            return None
+
+        return self._loaded_state_key
+
     def _deserialise(self, data):
         json_data = json.loads(data, use_decimal=True)
         self.progress_store = ProgressStore(json_data.get("PROGRESS"))
@@ -62,6 +81,7 @@ class QuestionnaireStore:
 
     def delete(self):
         self._storage.delete()
+        self._loaded_state_key = None
         self._metadata.clear()
         self.collection_metadata = {}
         self.answer_store.clear()
@@ -6,7 +6,7 @@ from app.forms.fields.integer_field_with_separator import IntegerFieldWithSepara
 class DurationForm(Form):
     def validate(self):
         if all(not field.raw_data[0] for field in self._fields.values()):
-            if self.mandatory:
+            if self.is_mandatory:
                 self._set_error("MANDATORY_DURATION")
                 return False
 
@@ -39,9 +39,12 @@ class DurationForm(Form):
         return data
 
 
-def get_duration_form(answer, error_messages):
-    class CustomDurationForm(DurationForm):
+def get_duration_form(answer, error_messages, mandatory=None):
+    if mandatory is None:
         mandatory = answer["mandatory"]
+
+    class CustomDurationForm(DurationForm):
+        is_mandatory = mandatory
         units = answer["units"]
         answer_errors = _get_answer_errors(answer, error_messages)
 
@@ -34,6 +34,9 @@ def get_field_handler(
     metadata=None,
     location=None,
     disable_validation=False,
+    disable_mandatory=False,
+    schema=None,
+    referenced_answers=None,
 ):
     return FIELD_HANDLER_MAPPINGS[answer.get("type")](
         answer,
@@ -42,4 +45,7 @@ def get_field_handler(
         metadata=metadata,
         location=location,
         disable_validation=disable_validation,
+        disable_mandatory=disable_mandatory,
+        schema=schema,
+        referenced_answers=referenced_answers,
     )
@@ -1,17 +1,15 @@
-from datetime import datetime
-
 from dateutil.relativedelta import relativedelta
 from werkzeug.utils import cached_property
 
 from app.forms.field_handlers.field_handler import FieldHandler
 from app.forms.fields.date_field import DateField
-from app.questionnaire.rules import convert_to_datetime
 from app.forms.validators import (
     SingleDatePeriodCheck,
     OptionalForm,
     DateCheck,
     DateRequired,
 )
+from app.utilities.dates import convert_to_datetime, get_today
 
 
 class DateHandler(FieldHandler):
@@ -23,7 +21,7 @@ class DateHandler(FieldHandler):
     def validators(self):
         validate_with = [OptionalForm()]
 
-        if self.answer_schema["mandatory"] is True:
+        if self.mandatory:
             validate_with = [
                 DateRequired(
                     message=self.get_validation_message(self.MANDATORY_MESSAGE_KEY)
@@ -66,7 +64,7 @@ class DateHandler(FieldHandler):
         value = self.get_schema_value(self.answer_schema[key])
 
         if value == "now":
-            value = datetime.utcnow().strftime("%Y-%m-%d")
+            value = get_today()
 
         return convert_to_datetime(value)
 
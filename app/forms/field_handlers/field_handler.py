@@ -6,8 +6,8 @@ from wtforms import validators, Field
 from app.data_model.answer_store import AnswerStore
 from app.questionnaire.location import Location
 from app.forms.validators import ResponseRequired
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.rules import get_answer_value
-from app.utilities.schema import load_schema_from_metadata
 
 
 class FieldHandler(ABC):
@@ -21,6 +21,9 @@ class FieldHandler(ABC):
         metadata: dict = None,
         location: Location = None,
         disable_validation: bool = False,
+        disable_mandatory: bool = False,
+        schema: QuestionnaireSchema = None,
+        referenced_answers: dict = None,
     ):
         self.answer_schema = answer_schema
         self.error_messages = error_messages or {}
@@ -28,6 +31,9 @@ class FieldHandler(ABC):
         self.metadata = metadata or {}
         self.location = location
         self.disable_validation = disable_validation
+        self.disable_mandatory = disable_mandatory
+        self.schema = schema
+        self.referenced_answers = referenced_answers or {}
 
     @cached_property
     def validators(self):
@@ -35,6 +41,10 @@ class FieldHandler(ABC):
             return [self.get_mandatory_validator()]
         return []
 
+    @cached_property
+    def mandatory(self):
+        return self.answer_schema["mandatory"] is True and not self.disable_mandatory
+
     @cached_property
     def label(self):
         return self.answer_schema.get("label")
@@ -50,7 +60,7 @@ class FieldHandler(ABC):
         return message
 
     def get_mandatory_validator(self):
-        if self.answer_schema["mandatory"] is True:
+        if self.mandatory:
             mandatory_message = self.get_validation_message(self.MANDATORY_MESSAGE_KEY)
 
             return ResponseRequired(message=mandatory_message)
@@ -63,12 +73,14 @@ class FieldHandler(ABC):
                 identifier = schema_element["value"].get("identifier")
                 return self.metadata.get(identifier)
             if schema_element["value"]["source"] == "answers":
-                schema = load_schema_from_metadata(self.metadata)
                 answer_id = schema_element["value"].get("identifier")
+                if answer_id in self.referenced_answers:
+                    return self.referenced_answers[answer_id]
+
                 list_item_id = self.location.list_item_id if self.location else None
 
                 return get_answer_value(
-                    answer_id, self.answer_store, schema, list_item_id=list_item_id
+                    answer_id, self.answer_store, self.schema, list_item_id=list_item_id
                 )
         return schema_element["value"]
 
@@ -9,6 +9,7 @@ from app.forms.fields.integer_field_with_separator import IntegerFieldWithSepara
 from app.forms.field_handlers.field_handler import FieldHandler
 from app.forms.validators import NumberCheck, NumberRange, DecimalPlaces
 from app.questionnaire.location import Location
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.settings import MAX_NUMBER
 
 
@@ -23,6 +24,9 @@ class NumberHandler(FieldHandler):
         metadata: dict = None,
         location: Location = None,
         disable_validation: bool = False,
+        disable_mandatory: bool = False,
+        schema: QuestionnaireSchema = None,
+        referenced_answers: dict = None,
     ):
         super().__init__(
             answer_schema,
@@ -31,6 +35,9 @@ class NumberHandler(FieldHandler):
             metadata,
             location,
             disable_validation,
+            disable_mandatory,
+            schema,
+            referenced_answers,
         )
         self.references = self.get_field_references()
 
@@ -1,9 +1,9 @@
 from decimal import Decimal, InvalidOperation
 
-from babel import numbers
 from wtforms import DecimalField
 
 from app.settings import DEFAULT_LOCALE
+from app.utilities.number_format import get_number_format
 
 
 class DecimalFieldWithSeparator(DecimalField):
@@ -25,7 +25,7 @@ class DecimalFieldWithSeparator(DecimalField):
         if valuelist:
             try:
                 self.data = Decimal(
-                    valuelist[0].replace(numbers.get_group_symbol(DEFAULT_LOCALE), "")
+                    get_number_format(DEFAULT_LOCALE).strip_group_symbols(valuelist[0])
                 )
             except (ValueError, TypeError, InvalidOperation):
                 pass
@@ -1,7 +1,7 @@
-from babel import numbers
 from wtforms import IntegerField
 
 from app.settings import DEFAULT_LOCALE
+from app.utilities.number_format import get_number_format
 
 
 class IntegerFieldWithSeparator(IntegerField):
@@ -23,7 +23,7 @@ class IntegerFieldWithSeparator(IntegerField):
         if valuelist:
             try:
                 self.data = int(
-                    valuelist[0].replace(numbers.get_group_symbol(DEFAULT_LOCALE), "")
+                    get_number_format(DEFAULT_LOCALE).strip_group_symbols(valuelist[0])
                 )
             except ValueError:
                 pass
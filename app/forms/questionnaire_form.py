@@ -1,19 +1,35 @@
 import itertools
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from decimal import Decimal
+from typing import Dict
 
 from dateutil.relativedelta import relativedelta
 from flask_wtf import FlaskForm
 from werkzeug.datastructures import MultiDict
+from werkzeug.utils import cached_property
 from wtforms import validators
 
 from app.forms.field_factory import get_field_handler
 from app.forms.field_handlers.date_handler import DateHandler
 from app.forms.validators import DateRangeCheck, SumCheck, MutuallyExclusiveCheck
+from app.instrumentation import timed
+from app.questionnaire.schema_utils import find_pointers_containing
 
 logger = logging.getLogger(__name__)
 
+# Answer types whose minimum and maximum are validated by a form within the field
+DATE_ANSWER_TYPES = ("Date", "MonthYearDate", "YearDate")
+
+# Form classes shared by every request, keyed by the schema name and language,
+# the question id and variant, the detail answers with validation disabled and
+# whether mandatory answers are disabled
+_form_classes: Dict[tuple, type] = {}
+
+# Whether the form classes of each question can be cached, keyed by the schema
+# name and language and the question id
+_cacheable_questions: Dict[tuple, bool] = {}
+
 
 class QuestionnaireForm(FlaskForm):
     def __init__(
@@ -29,6 +45,13 @@ class QuestionnaireForm(FlaskForm):
 
         super().__init__(**kwargs)
 
+    @cached_property
+    def referenced_answers(self):
+        return get_referenced_answers(
+            self.schema, self.question, self.answer_store, self.location
+        )
+
+    @timed("form_validate")
     def validate(self):
         """
         Validate this form as usual and check for any form-level validation errors based on question type
@@ -99,15 +122,11 @@ class QuestionnaireForm(FlaskForm):
         return True
 
     def validate_calculated_question(self, question):
-        for calculation in question["calculations"]:
-            target_total, currency = self._get_target_total_and_currency(
-                calculation, question
-            )
+        for calculation_schema in question["calculations"]:
+            calculation = self.schema.get_calculation(calculation_schema, question)
             if self.answers_all_valid(
-                calculation["answers_to_calculate"]
-            ) and self._validate_calculated_question(
-                calculation, question, target_total, currency
-            ):
+                calculation.answer_ids
+            ) and self._validate_calculated_question(calculation, question):
                 # Remove any previous question errors if it passes this OR before returning True
                 if question["id"] in self.question_errors:
                     self.question_errors.pop(question["id"])
@@ -132,18 +151,6 @@ class QuestionnaireForm(FlaskForm):
 
         return True
 
-    def _get_target_total_and_currency(self, calculation, question):
-        if "value" in calculation:
-            return calculation["value"], question.get("currency")
-
-        target_answer = self.schema.get_answers_by_answer_id(calculation["answer_id"])[
-            0
-        ]
-        return (
-            self.answer_store.get_answer(calculation["answer_id"]).value,
-            target_answer.get("currency"),
-        )
-
     def validate_date_range_with_period_limits_and_single_date_limits(
         self, question_id, period_limits, period_range
     ):
@@ -189,28 +196,25 @@ class QuestionnaireForm(FlaskForm):
 
         return True
 
-    def _validate_calculated_question(
-        self, calculation, question, target_total, currency
-    ):
+    def _validate_calculated_question(self, calculation, question):
         messages = None
         if "validation" in question:
             messages = question["validation"].get("messages")
 
-        validator = SumCheck(messages=messages, currency=currency)
+        validator = SumCheck(messages=messages, currency=calculation.currency)
 
-        calculation_type = self._get_calculation_type(calculation["calculation_type"])
-
-        formatted_values = self._get_formatted_calculation_values(
-            calculation["answers_to_calculate"]
-        )
-
-        calculation_total = self._get_calculation_total(
-            calculation_type, formatted_values
+        calculation_total = calculation.evaluate(
+            self._get_formatted_calculation_values(calculation.answer_ids)
         )
 
         # Validate grouped answers meet calculation_type criteria
         try:
-            validator(self, calculation["conditions"], calculation_total, target_total)
+            validator(
+                self,
+                list(calculation.conditions),
+                calculation_total,
+                calculation.get_target_total(self.answer_store),
+            )
         except validators.ValidationError as e:
             self.question_errors[question["id"]] = str(e)
             return False
@@ -219,7 +223,13 @@ class QuestionnaireForm(FlaskForm):
 
     def _get_period_range_for_single_date(self, date_from, date_to):
         handler = DateHandler(
-            date_from, {}, self.answer_store, self.metadata, location=self.location
+            date_from,
+            {},
+            self.answer_store,
+            self.metadata,
+            location=self.location,
+            schema=self.schema,
+            referenced_answers=self.referenced_answers,
         )
         from_min_period_date = handler.get_date_value("minimum")
         from_max_period_date = handler.get_date_value("maximum")
@@ -267,23 +277,12 @@ class QuestionnaireForm(FlaskForm):
                 maximum = limits["maximum"]
         return minimum, maximum
 
-    @staticmethod
-    def _get_calculation_type(calculation_type):
-        if calculation_type == "sum":
-            return sum
-
-        raise Exception("Invalid calculation_type: {}".format(calculation_type))
-
     def _get_formatted_calculation_values(self, answers_list):
         return [
             self.get_data(answer_id).replace(" ", "").replace(",", "")
             for answer_id in answers_list
         ]
 
-    @staticmethod
-    def _get_calculation_total(calculation_type, values):
-        return calculation_type(Decimal(value or 0) for value in values)
-
     def answers_all_valid(self, answer_id_list):
         return not set(answer_id_list) & set(self.errors)
 
@@ -318,7 +317,17 @@ def _option_value_in_data(answer, option, data):
     return option["value"] in dict(data_to_inspect).get(answer["id"], [])
 
 
-def get_answer_fields(question, data, error_messages, answer_store, metadata, location):
+def get_answer_fields(
+    question,
+    data,
+    error_messages,
+    answer_store,
+    metadata,
+    location,
+    disable_mandatory=False,
+    schema=None,
+    referenced_answers=None,
+):
     answer_fields = {}
     if not question:
         return answer_fields
@@ -335,10 +344,19 @@ def get_answer_fields(question, data, error_messages, answer_store, metadata, lo
                     metadata,
                     location,
                     disable_validation=disable_validation,
+                    schema=schema,
+                    referenced_answers=referenced_answers,
                 ).get_field()
 
         answer_fields[answer["id"]] = get_field_handler(
-            answer, error_messages, answer_store, metadata, location
+            answer,
+            error_messages,
+            answer_store,
+            metadata,
+            location,
+            disable_mandatory=disable_mandatory,
+            schema=schema,
+            referenced_answers=referenced_answers,
         ).get_field()
 
     return answer_fields
@@ -376,6 +394,228 @@ def _get_error_id(answer_id):
     return f"{answer_id}-error"
 
 
+def get_form_class(
+    schema,
+    question,
+    data,
+    answer_store,
+    metadata,
+    location,
+    disable_mandatory=False,
+    referenced_answers=None,
+):
+    """
+    Return the form class for a question, building it once per process for each
+    variant of a question in a schema loaded by name.
+
+    Field labels, choices and any validators that only depend on the schema are
+    fixed when the class is built. Validators that reference answers, metadata
+    or the current date are bound to each form by `generate_form`. The limits of
+    date answers are validated by a form built into the class, so they can't be
+    bound, and questions with such limits aren't cached. Nor are questions with
+    placeholders in their answers, which are rendered per request.
+
+    When `disable_mandatory` is set, as it is when saving and signing out, the
+    question's answers are built as optional. Those classes are cached separately
+    and the question schema itself is never modified.
+    """
+    if not question:
+        return QuestionnaireForm
+
+    form_class_key = _get_form_class_key(schema, question, data, disable_mandatory)
+    form_class = _form_classes.get(form_class_key) if form_class_key else None
+    if form_class:
+        return form_class
+
+    class DynamicForm(QuestionnaireForm):
+        pass
+
+    for answer_id, field in get_answer_fields(
+        question,
+        data,
+        schema.error_messages,
+        answer_store,
+        metadata,
+        location,
+        disable_mandatory,
+        schema,
+        referenced_answers,
+    ).items():
+        setattr(DynamicForm, answer_id, field)
+
+    if form_class_key:
+        _form_classes[form_class_key] = DynamicForm
+
+    return DynamicForm
+
+
+def _get_form_class_key(schema, question, data, disable_mandatory):
+    """
+    The key a question's form class is cached under, or None if it can't be.
+
+    Schemas are unpickled for each request, so the variant of the question is
+    found by the identity of its answers among the variants in this schema.
+    """
+    if not schema.schema_name:
+        return None
+
+    question_key = (schema.schema_name, schema.language_code, question["id"])
+    if question_key not in _cacheable_questions:
+        questions = schema.get_questions(question["id"]) or []
+        _cacheable_questions[question_key] = bool(questions) and not any(
+            _has_answer_placeholders(variant)
+            or _has_request_dependent_date_limits(variant)
+            for variant in questions
+        )
+
+    if not _cacheable_questions[question_key]:
+        return None
+
+    variant_index = next(
+        (
+            index
+            for index, variant in enumerate(schema.get_questions(question["id"]))
+            if variant["answers"] is question["answers"]
+        ),
+        None,
+    )
+    if variant_index is None:
+        return None
+
+    return (
+        *question_key,
+        variant_index,
+        _get_disabled_detail_answer_ids(question, data),
+        disable_mandatory,
+    )
+
+
+def _has_answer_placeholders(question):
+    return any(
+        True for _ in find_pointers_containing(question["answers"], "placeholders")
+    )
+
+
+def _has_request_dependent_date_limits(question):
+    return any(
+        answer_schema["type"] in DATE_ANSWER_TYPES
+        and _has_request_dependent_validators(answer_schema)
+        for answer in question["answers"]
+        for answer_schema in [answer] + _get_detail_answers(answer)
+    )
+
+
+def _get_detail_answers(answer):
+    return [
+        option["detail_answer"]
+        for option in answer.get("options", [])
+        if "detail_answer" in option
+    ]
+
+
+def _get_disabled_detail_answer_ids(question, data):
+    return frozenset(
+        option["detail_answer"]["id"]
+        for answer in question.get("answers", [])
+        for option in answer.get("options", [])
+        if "detail_answer" in option and not _option_value_in_data(answer, option, data)
+    )
+
+
+def _references_answer(limit):
+    value = limit.get("value") if limit else None
+    return isinstance(value, dict) and value["source"] == "answers"
+
+
+def get_referenced_answers(schema, question, answer_store, location):
+    """
+    Resolve every answer referenced by the minimum or maximum of a question's
+    answers, including detail answers, once for the whole form.
+
+    :return: referenced answer values keyed by answer id
+    """
+    answer_ids = set()
+    for answer in question.get("answers", []):
+        for answer_schema in [answer] + _get_detail_answers(answer):
+            for key in ("minimum", "maximum"):
+                if _references_answer(answer_schema.get(key)):
+                    answer_ids.add(answer_schema[key]["value"]["identifier"])
+
+    list_item_id = location.list_item_id if location else None
+
+    # Looked up together for each list item, as `get_answer_value` would find
+    # them, falling back to the schema's default answer
+    answer_ids_by_list_item_id = defaultdict(list)
+    for answer_id in answer_ids:
+        answer_list_item_id = schema.get_list_item_id_for_answer_id(
+            answer_id, list_item_id
+        )
+        answer_ids_by_list_item_id[answer_list_item_id].append(answer_id)
+
+    referenced_answers = {}
+    for answer_list_item_id, list_answer_ids in answer_ids_by_list_item_id.items():
+        for answer in answer_store.get_answers_by_answer_id(
+            list_answer_ids, list_item_id=answer_list_item_id
+        ):
+            referenced_answers[answer.answer_id] = answer.value
+
+    for answer_id in answer_ids - referenced_answers.keys():
+        default_answer = schema.get_default_answer(answer_id)
+        referenced_answers[answer_id] = default_answer.value if default_answer else None
+
+    return referenced_answers
+
+
+def _has_request_dependent_validators(answer):
+    for key in ("minimum", "maximum"):
+        value = answer.get(key, {}).get("value")
+        if isinstance(value, dict) or value == "now":
+            return True
+    return False
+
+
+def _has_bindable_validators(answer):
+    # The validators of a date answer are on a form within its field, which is
+    # built with them for the request as such questions aren't cached
+    return answer[
+        "type"
+    ] not in DATE_ANSWER_TYPES and _has_request_dependent_validators(answer)
+
+
+def _bind_request_dependent_validators(
+    form, data, answer_store, metadata, location, disable_mandatory
+):
+    disabled_detail_answer_ids = _get_disabled_detail_answer_ids(form.question, data)
+
+    for answer in form.question.get("answers", []):
+        if _has_bindable_validators(answer):
+            form[answer["id"]].validators = get_field_handler(
+                answer,
+                form.schema.error_messages,
+                answer_store,
+                metadata,
+                location,
+                disable_mandatory=disable_mandatory,
+                schema=form.schema,
+                referenced_answers=form.referenced_answers,
+            ).validators
+
+        for detail_answer in _get_detail_answers(answer):
+            if _has_bindable_validators(detail_answer):
+                form[detail_answer["id"]].validators = get_field_handler(
+                    detail_answer,
+                    form.schema.error_messages,
+                    answer_store,
+                    metadata,
+                    location,
+                    disable_validation=detail_answer["id"]
+                    in disabled_detail_answer_ids,
+                    schema=form.schema,
+                    referenced_answers=form.referenced_answers,
+                ).validators
+
+
+@timed("form_build")
 def generate_form(
     schema,
     question_schema,
@@ -384,26 +624,32 @@ def generate_form(
     location=None,
     data=None,
     formdata=None,
+    disable_mandatory=False,
 ):
-    class DynamicForm(QuestionnaireForm):
-        pass
+    form_data = formdata if formdata is not None else data
 
-    answer_fields = get_answer_fields(
+    # Resolved once for building the form class and binding its validators
+    referenced_answers = (
+        get_referenced_answers(schema, question_schema, answer_store, location)
+        if question_schema
+        else {}
+    )
+
+    form_class = get_form_class(
+        schema,
         question_schema,
-        formdata if formdata is not None else data,
-        schema.error_messages,
+        form_data,
         answer_store,
         metadata,
         location,
+        disable_mandatory,
+        referenced_answers,
     )
 
-    for answer_id, field in answer_fields.items():
-        setattr(DynamicForm, answer_id, field)
-
     if formdata:
         formdata = MultiDict(formdata)
 
-    return DynamicForm(
+    form = form_class(
         schema,
         question_schema,
         answer_store,
@@ -412,3 +658,11 @@ def generate_form(
         data=data,
         formdata=formdata,
     )
+    form.referenced_answers = referenced_answers
+
+    if question_schema:
+        _bind_request_dependent_validators(
+            form, form_data, answer_store, metadata, location, disable_mandatory
+        )
+
+    return form
@@ -1,18 +1,17 @@
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
-import re
 import flask_babel
 from flask_babel import ngettext
-from babel import numbers
 from dateutil.relativedelta import relativedelta
 from structlog import get_logger
 from wtforms import validators
 from wtforms.compat import string_types
 
 from app.jinja_filters import format_number, get_formatted_currency
-from app.questionnaire.rules import convert_to_datetime
+from app.utilities.dates import YEAR_PATTERN, convert_to_datetime
 from app.forms.error_messages import error_messages
+from app.utilities.number_format import get_locale_number_format
 
 logger = get_logger()
 
@@ -26,11 +25,7 @@ class NumberCheck:
 
     def __call__(self, form, field):
         try:
-            Decimal(
-                field.raw_data[0].replace(
-                    numbers.get_group_symbol(flask_babel.get_locale()), ""
-                )
-            )
+            Decimal(get_locale_number_format().strip_group_symbols(field.raw_data[0]))
         except (ValueError, TypeError, InvalidOperation, AttributeError):
             raise validators.StopValidation(self.message)
 
@@ -152,12 +147,9 @@ class DecimalPlaces:
         self.messages = messages or error_messages
 
     def __call__(self, form, field):
-        data = (
-            field.raw_data[0]
-            .replace(numbers.get_group_symbol(flask_babel.get_locale()), "")
-            .replace(" ", "")
-        )
-        decimal_symbol = numbers.get_decimal_symbol(flask_babel.get_locale())
+        number_format = get_locale_number_format()
+        data = number_format.strip_group_symbols(field.raw_data[0]).replace(" ", "")
+        decimal_symbol = number_format.decimal_symbol
         if data and decimal_symbol in data:
             if self.max_decimals == 0:
                 raise validators.ValidationError(self.messages["INVALID_INTEGER"])
@@ -225,7 +217,7 @@ class DateCheck:
 
     def __call__(self, form, field):
 
-        if not form.data or not re.match(r"\d{4}$", str(form.year.data)):
+        if not form.data or not YEAR_PATTERN.match(str(form.year.data)):
             raise validators.StopValidation(self.message)
 
         try:
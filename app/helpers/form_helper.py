@@ -24,9 +24,6 @@ def get_form_for_location(
     :param disable_mandatory: Make mandatory answers optional
     :return: form, template_args A tuple containing the form for this location and any additional template arguments
     """
-    if disable_mandatory:
-        block_json = disable_mandatory_answers(block_json)
-
     mapped_answers = get_mapped_answers(schema, answer_store, location=location)
 
     return generate_form(
@@ -36,6 +33,7 @@ def get_form_for_location(
         metadata,
         location=location,
         data=mapped_answers,
+        disable_mandatory=disable_mandatory,
     )
 
 
@@ -59,31 +57,21 @@ def post_form_for_block(
     :param location: The location in the survey this post is for
     :param disable_mandatory: Make mandatory answers optional
     """
-    if disable_mandatory:
-        block_json = disable_mandatory_answers(block_json)
-
     question = block_json.get("question")
 
     data = clear_detail_answer_field(request_form, question)
 
     return generate_form(
-        schema, question, answer_store, metadata, location, formdata=data
+        schema,
+        question,
+        answer_store,
+        metadata,
+        location,
+        formdata=data,
+        disable_mandatory=disable_mandatory,
     )
 
 
-def disable_mandatory_answers(block):
-    def set_mandatory_to_false(question):
-        # Here Be Dragons: This loop modifies the input in place.
-        for answer in question.get("answers", []):
-            if answer.get("mandatory", True) is True:
-                answer["mandatory"] = False
-
-    if block.get("question"):
-        set_mandatory_to_false(block["question"])
-
-    return block
-
-
 def clear_detail_answer_field(data, question):
     """
     Checks the submitted answers and in the case of both checkboxes and radios,
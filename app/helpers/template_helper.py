@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from flask import (
     current_app,
@@ -8,6 +9,7 @@ from flask import (
 )
 from flask_babel import get_locale, lazy_gettext
 
+from app.instrumentation import timed
 from app.setup import cache
 from app.helpers.language_helper import get_languages_context
 
@@ -50,6 +52,7 @@ def _map_theme(theme):
     return "census"
 
 
+@timed("template_render")
 def render_template(template, **kwargs):
     template = f"{template.lower()}.html"
 
@@ -89,17 +92,24 @@ def get_google_tag_mananger_context():
     return {}
 
 
+PIPING_PATTERN = re.compile(r"{.*?}")
+HTML_TAG_PATTERN = re.compile(r"</?[^>]+>")
+
+
+@lru_cache(maxsize=1024)
 def safe_content(content):
     """Make content safe.
 
-    Replaces variable with ellipsis and strips any HTML tags.
+    Replaces variable with ellipsis and strips any HTML tags. Page titles come
+    from the schema, so the same content is made safe again and again and the
+    results are cached.
 
     :param (str) content: Input string.
     :returns (str): Modified string.
     """
     if content is not None:
         # Replace piping with ellipsis
-        content = re.sub(r"{.*?}", "…", content)
+        content = PIPING_PATTERN.sub("…", content)
         # Strip HTML Tags
-        content = re.sub(r"</?[^>]+>", "", content)
+        content = HTML_TAG_PATTERN.sub("", content)
     return content
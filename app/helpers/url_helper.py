@@ -0,0 +1,90 @@
+from functools import lru_cache
+
+from flask import current_app, has_request_context, request, url_for
+from werkzeug.urls import url_quote, url_quote_plus
+
+
+def build_url(endpoint, **values):
+    """
+    Build the url for `endpoint`, as `url_for` does, without matching the values
+    against the url rules every time.
+
+    The first url built for an endpoint with a set of values is built by
+    `url_for`, with a marker for each value, and kept by the application as a
+    template. Later urls for the endpoint with the same values are formatted
+    from it. Values that are None are left out, as they are by `url_for`, and
+    values not in the rule are added as query arguments.
+    """
+    if not has_request_context():
+        return url_for(endpoint, **values)
+
+    values = {key: value for key, value in values.items() if value is not None}
+    url_templates = current_app.extensions.setdefault("url_templates", {})
+    key = (request.script_root, endpoint, tuple(values))
+
+    try:
+        template = url_templates[key]
+    except KeyError:
+        template = url_templates[key] = _compile_url_template(endpoint, key[-1])
+
+    if template is None:
+        return url_for(endpoint, **values)
+
+    path_template, path_names, query_names = template
+    url = path_template.format(
+        **{name: _quote_path_segment(str(values[name])) for name in path_names}
+    )
+
+    if query_names:
+        query_values = [values[name] for name in query_names]
+        if any(isinstance(value, (list, tuple)) for value in query_values):
+            return url_for(endpoint, **values)
+
+        url += "?" + "&".join(
+            f"{quoted_name}={_quote_query_value(str(value))}"
+            for quoted_name, value in zip(query_names.values(), query_values)
+        )
+
+    return url
+
+
+def _compile_url_template(endpoint, names):
+    """
+    Build the url for `endpoint` with a marker in place of each value, and find
+    where each one ends up. Returns None if `url_for` should always be used,
+    such as for a value the url rule has a default for.
+    """
+    if any(name.startswith("_") for name in names):
+        return None
+
+    url = url_for(endpoint, **{name: f"{{{name}}}" for name in names})
+    path, _, query = url.partition("?")
+
+    path_template = path.replace("{", "{{").replace("}", "}}")
+    path_names = []
+    query_names = {}
+
+    for name in names:
+        path_marker = _quote_path_segment(f"{{{name}}}")
+        query_marker = f"{_quote_query_value(name)}={_quote_query_value(f'{{{name}}}')}"
+
+        if path_marker in path:
+            path_template = path_template.replace(path_marker, f"{{{name}}}")
+            path_names.append(name)
+        elif query_marker in query:
+            query_names[name] = _quote_query_value(name)
+        else:
+            return None
+
+    return path_template, tuple(path_names), query_names
+
+
+@lru_cache(maxsize=4096)
+def _quote_path_segment(value):
+    # As werkzeug's default converter quotes values
+    return url_quote(value, safe="/:")
+
+
+@lru_cache(maxsize=4096)
+def _quote_query_value(value):
+    return url_quote_plus(value)
@@ -0,0 +1,189 @@
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Dict
+
+# Upper bounds, in seconds, of the histogram buckets durations are counted in
+DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class Histogram:
+    """ Counts of observed durations by bucket, exported as a Prometheus histogram. """
+
+    __slots__ = ("bucket_counts", "count", "sum", "_lock")
+
+    def __init__(self):
+        # With a last bucket for durations above the largest upper bound
+        self.bucket_counts = [0] * (len(DURATION_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration):
+        index = bisect_left(DURATION_BUCKETS, duration)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += duration
+
+    def snapshot(self):
+        """
+        The cumulative count of each bucket, ending with `+Inf`, with the sum and
+        count of the durations.
+        """
+        with self._lock:
+            bucket_counts, total, count = list(self.bucket_counts), self.sum, self.count
+
+        buckets = []
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(DURATION_BUCKETS, bucket_counts):
+            cumulative_count += bucket_count
+            buckets.append((str(upper_bound), cumulative_count))
+        buckets.append(("+Inf", count))
+
+        return buckets, total, count
+
+
+# The histograms of each metric, by the value of its label
+span_durations: Dict[str, Histogram] = {}
+request_durations: Dict[str, Histogram] = {}
+
+# The start time and span durations of each request being timed, by the thread
+# or, as gevent workers patch `threading`, the greenlet handling it. Looked up
+# directly rather than through `g`, which would cost more than timing a span.
+_request_timers: Dict[Any, "RequestTimer"] = {}
+
+
+class RequestTimer:
+    __slots__ = ("start", "span_durations")
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.span_durations = {}
+
+
+def _observe(histograms, label, duration):
+    histogram = histograms.get(label)
+    if histogram is None:
+        histogram = histograms.setdefault(label, Histogram())
+    histogram.observe(duration)
+
+
+def record_span(name, duration):
+    request_timer = _request_timers.get(threading.get_ident())
+    if request_timer is not None:
+        spans = request_timer.span_durations
+        spans[name] = spans.get(name, 0) + duration
+
+
+@contextmanager
+def span(name):
+    """
+    Time a named part of handling a request.
+
+    The durations of the spans with each name are totalled for the request, and
+    the totals are logged with its response and counted in the span histograms.
+    Spans can be nested, so a span includes the time of any spans inside it.
+    Spans outside of a request aren't recorded.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, perf_counter() - start)
+
+
+def timed(name):
+    """ Time every call of the decorated function as a span. """
+
+    def timed_decorator(func):
+        @wraps(func)
+        def timed_wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_span(name, perf_counter() - start)
+
+        return timed_wrapper
+
+    return timed_decorator
+
+
+def start_request_timer():
+    _request_timers[threading.get_ident()] = RequestTimer()
+
+
+def stop_request_timer():
+    return _request_timers.pop(threading.get_ident(), None)
+
+
+def get_request_durations(endpoint):
+    """
+    The request's duration and the total duration of each of its spans, in
+    milliseconds, counting them in the histograms.
+    """
+    request_timer = stop_request_timer()
+    if request_timer is None:
+        return {}
+
+    duration = perf_counter() - request_timer.start
+    _observe(request_durations, endpoint or "unknown", duration)
+    for name, span_duration in request_timer.span_durations.items():
+        _observe(span_durations, name, span_duration)
+
+    return {
+        "duration": _to_milliseconds(duration),
+        "span_durations": {
+            name: _to_milliseconds(span_duration)
+            for name, span_duration in request_timer.span_durations.items()
+        },
+    }
+
+
+def _to_milliseconds(seconds):
+    return round(seconds * 1000, 2)
+
+
+def _format_histograms(metric_name, label_name, histograms):
+    lines = [f"# TYPE {metric_name} histogram"]
+    for label, histogram in sorted(list(histograms.items())):
+        label_pair = f'{label_name}="{label}"'
+        buckets, total, count = histogram.snapshot()
+        lines += [
+            f'{metric_name}_bucket{{{label_pair},le="{upper_bound}"}} {bucket_count}'
+            for upper_bound, bucket_count in buckets
+        ]
+        lines.append(f"{metric_name}_sum{{{label_pair}}} {total}")
+        lines.append(f"{metric_name}_count{{{label_pair}}} {count}")
+    return lines
+
+
+def get_metrics():
+    """ All the histograms, in the Prometheus text exposition format. """
+    lines = [
+        "# HELP eq_request_duration_seconds The time taken to handle requests",
+        *_format_histograms(
+            "eq_request_duration_seconds", "endpoint", request_durations
+        ),
+        "# HELP eq_span_duration_seconds The time each request spent in each span",
+        *_format_histograms("eq_span_duration_seconds", "span", span_durations),
+    ]
+    return "\n".join(lines) + "\n"
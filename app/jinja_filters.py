@@ -4,11 +4,12 @@ from datetime import datetime
 
 import flask
 import flask_babel
-from babel import units, numbers
+from babel import units
 from jinja2 import Markup, escape, evalcontextfilter
 
-from app.questionnaire.rules import convert_to_datetime
+from app.utilities.dates import convert_to_datetime
 from app.settings import MAX_NUMBER
+from app.utilities.number_format import get_locale_number_format
 
 blueprint = flask.Blueprint("filters", __name__)
 
@@ -16,23 +17,21 @@ blueprint = flask.Blueprint("filters", __name__)
 @blueprint.app_template_filter()
 def format_number(value):
     if value or value == 0:
-        return numbers.format_decimal(value, locale=flask_babel.get_locale())
+        return get_locale_number_format().format_decimal(value)
 
     return ""
 
 
 def get_formatted_currency(value, currency="GBP"):
     if value or value == 0:
-        return numbers.format_currency(
-            number=value, currency=currency, locale=flask_babel.get_locale()
-        )
+        return get_locale_number_format().format_currency(value, currency)
 
     return ""
 
 
 @blueprint.app_template_filter()
 def get_currency_symbol(currency="GBP"):
-    return numbers.get_currency_symbol(currency, locale=flask_babel.get_locale())
+    return get_locale_number_format().get_currency_symbol(currency)
 
 
 @blueprint.app_template_filter()
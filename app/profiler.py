@@ -0,0 +1,167 @@
+import random
+import signal
+import sys
+import threading
+from collections import Counter
+
+from flask import request
+from structlog import get_logger
+
+logger = get_logger()
+
+# Stacks first seen once an endpoint already has its maximum number of stacks
+OTHER_STACKS = "[other]"
+
+# The number of outermost frames kept from each stack
+MAX_STACK_DEPTH = 100
+
+
+class EndpointProfile:
+    """ The stacks sampled while an endpoint was handling requests. """
+
+    __slots__ = ("requests", "samples", "stacks")
+
+    def __init__(self):
+        self.requests = 0
+        self.samples = 0
+        self.stacks = Counter()
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "samples": self.samples,
+            "stacks": dict(self.stacks.most_common()),
+        }
+
+
+class SamplingProfiler:
+    """
+    A statistical profiler for a sample of requests, cheap enough to run in
+    production.
+
+    Each request is profiled with probability `sample_rate`. While any profiled
+    request is in progress, the interval timer interrupts the process every
+    `interval_seconds` of CPU time, and the stack of each profiled request on
+    the CPU is recorded against its endpoint in the collapsed format used by
+    flame graph tools, `module:function;module:function`. No timer runs while
+    no request is being profiled.
+
+    Memory is bounded by keeping at most `max_stacks` distinct stacks for each
+    endpoint, later stacks being counted as `[other]`. Profiles are kept in the
+    memory of each worker process.
+    """
+
+    def __init__(self, sample_rate, interval_seconds, max_stacks):
+        self.sample_rate = sample_rate
+        self.interval_seconds = interval_seconds
+        self.max_stacks = max_stacks
+
+        self._profiles = {}
+        # The endpoint of each profiled request, by the id of the thread or, under
+        # gevent, the greenlet handling it
+        self._active = {}
+        self._timer_lock = threading.Lock()
+
+    @classmethod
+    def is_supported(cls):
+        return hasattr(signal, "setitimer")
+
+    def install(self):
+        """ Install the sample handler, must be called from the main thread. """
+        signal.signal(signal.SIGPROF, self._sample)
+
+    def start_request(self, endpoint):
+        if not endpoint or random.random() >= self.sample_rate:
+            return
+
+        self._get_profile(endpoint).requests += 1
+
+        with self._timer_lock:
+            self._active[threading.get_ident()] = endpoint
+            if len(self._active) == 1:
+                signal.setitimer(
+                    signal.ITIMER_PROF, self.interval_seconds, self.interval_seconds
+                )
+
+    def stop_request(self):
+        with self._timer_lock:
+            if self._active.pop(threading.get_ident(), None) and not self._active:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+
+    def get_profiles(self):
+        return {
+            endpoint: profile.to_dict()
+            for endpoint, profile in list(self._profiles.items())
+        }
+
+    def clear(self):
+        self._profiles = {}
+
+    def _get_profile(self, endpoint):
+        profile = self._profiles.get(endpoint)
+        if profile is None:
+            profile = self._profiles[endpoint] = EndpointProfile()
+        return profile
+
+    def _sample(self, _signum, interrupted_frame):
+        current_ident = threading.get_ident()
+        thread_frames = None
+
+        for ident, endpoint in list(self._active.items()):
+            if ident == current_ident:
+                frame = interrupted_frame
+            else:
+                # Requests in other threads; a greenlet which isn't running can't
+                # be on the CPU, and has no frame here
+                if thread_frames is None:
+                    # pylint: disable=protected-access
+                    thread_frames = sys._current_frames()
+                frame = thread_frames.get(ident)
+
+            if frame is not None:
+                self._record(endpoint, frame)
+
+    def _record(self, endpoint, frame):
+        profile = self._get_profile(endpoint)
+        stack = _collapse_stack(frame)
+
+        profile.samples += 1
+        if stack in profile.stacks or len(profile.stacks) < self.max_stacks:
+            profile.stacks[stack] += 1
+        else:
+            profile.stacks[OTHER_STACKS] += 1
+
+
+def _collapse_stack(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+        frame = frame.f_back
+
+    return ";".join(reversed(names[-MAX_STACK_DEPTH:]))
+
+
+def setup_profiler(application):
+    if not SamplingProfiler.is_supported():
+        logger.warning("sampling profiler is not supported on this platform")
+        return
+
+    profiler = SamplingProfiler(
+        sample_rate=application.config["EQ_PROFILING_SAMPLE_RATE"],
+        interval_seconds=application.config["EQ_PROFILING_INTERVAL_MILLISECONDS"]
+        / 1000,
+        max_stacks=application.config["EQ_PROFILING_MAX_STACKS"],
+    )
+    profiler.install()
+    application.eq["profiler"] = profiler
+
+    @application.before_request
+    def start_profiling():  # pylint: disable=unused-variable
+        profiler.start_request(request.endpoint)
+
+    @application.teardown_request
+    def stop_profiling(_exception):  # pylint: disable=unused-variable
+        profiler.stop_request()
+
+    logger.info("sampling profiler enabled", sample_rate=profiler.sample_rate)
@@ -0,0 +1,139 @@
+from decimal import Decimal
+from typing import Iterable, Mapping, Optional
+
+from app.jinja_filters import (
+    format_number,
+    format_percentage,
+    format_unit,
+    get_formatted_currency,
+)
+
+CALCULATION_OPERATORS = {"sum": sum}
+
+
+class Calculation:
+    """
+    A `calculation` from the schema, either the total of a calculated summary or
+    one of a calculated question's checks, compiled once.
+
+    Totals are worked out with Decimal arithmetic, counting an unanswered value
+    as 0, and formatted as the first answer to calculate is.
+    """
+
+    __slots__ = (
+        "answer_ids",
+        "block_ids",
+        "conditions",
+        "currency",
+        "target_answer_id",
+        "target_value",
+        "_operator",
+        "_answer_type",
+        "_unit",
+        "_unit_length",
+        "_answer_currency",
+        "_reduced_questions",
+    )
+
+    def __init__(
+        self, calculation: Mapping, schema, question: Optional[Mapping] = None
+    ):
+        calculation_type = calculation["calculation_type"]
+        if calculation_type not in CALCULATION_OPERATORS:
+            raise Exception("Invalid calculation_type: {}".format(calculation_type))
+
+        self._operator = CALCULATION_OPERATORS[calculation_type]
+        self.answer_ids = tuple(calculation["answers_to_calculate"])
+        # The blocks with the answers, in the order they are first calculated
+        self.block_ids = tuple(
+            dict.fromkeys(
+                schema.get_block_for_answer_id(answer_id)["id"]
+                for answer_id in self.answer_ids
+            )
+        )
+        # Each question in those blocks, reduced to just its answers to calculate
+        self._reduced_questions = {
+            block_id: tuple(
+                (block_question, _reduce_question(block_question, self.answer_ids))
+                for block_question in schema.get_all_questions_for_block(
+                    schema.get_block(block_id)
+                )
+            )
+            for block_id in self.block_ids
+        }
+        self.conditions = tuple(calculation.get("conditions", ()))
+        self.target_answer_id = calculation.get("answer_id")
+        self.target_value = calculation.get("value")
+
+        if self.target_answer_id:
+            target_answer = schema.get_answers_by_answer_id(self.target_answer_id)[0]
+            self.currency = target_answer.get("currency")
+        else:
+            self.currency = (question or {}).get("currency")
+
+        answer = schema.get_answers_by_answer_id(self.answer_ids[0])[0]
+        self._answer_type = answer["type"].lower()
+        self._unit = answer.get("unit")
+        self._unit_length = answer.get("unit_length")
+        self._answer_currency = answer.get("currency")
+
+    @property
+    def reduced_questions(self):
+        for reduced_questions in self._reduced_questions.values():
+            for _, reduced_question in reduced_questions:
+                if reduced_question:
+                    yield reduced_question
+
+    def get_reduced_question(self, block_id: str, question: Mapping):
+        """
+        The `question` shown for one of the blocks with answers to calculate,
+        with only those answers, or None if it has none of them.
+        """
+        for schema_question, reduced_question in self._reduced_questions.get(
+            block_id, ()
+        ):
+            if schema_question is question:
+                return reduced_question
+
+        return _reduce_question(question, self.answer_ids)
+
+    def evaluate(self, values: Iterable) -> Decimal:
+        """ The total of the values of the answers to calculate. """
+        return self._operator((_to_decimal(value) for value in values), Decimal(0))
+
+    def get_target_total(self, answer_store):
+        if self.target_answer_id:
+            return answer_store.get_answer(self.target_answer_id).value
+
+        return self.target_value
+
+    def format_total(self, total) -> str:
+        if self._answer_type == "currency":
+            return get_formatted_currency(total, self._answer_currency)
+
+        if self._answer_type == "unit":
+            return format_unit(self._unit, total, self._unit_length)
+
+        if self._answer_type == "percentage":
+            return format_percentage(total)
+
+        return format_number(total)
+
+
+def _reduce_question(question, answer_ids):
+    answers = [answer for answer in question["answers"] if answer["id"] in answer_ids]
+    if not answers:
+        return None
+
+    return {**question, "answers": answers}
+
+
+def _to_decimal(value) -> Decimal:
+    if not value:
+        return Decimal(0)
+
+    if isinstance(value, Decimal):
+        return value
+
+    # Floats are converted through their shortest repr, as they were entered
+    return Decimal(str(value))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Mapping, Optional
 
-from flask import url_for
+from app.helpers.url_helper import build_url
 
 
 class InvalidLocationException(Exception):
@@ -49,7 +49,7 @@ class Location:
         Any additional keyword arguments are parsed as query strings.
         :return:
         """
-        return url_for(
+        return build_url(
             "questionnaire.block",
             block_id=self.block_id,
             list_name=self.list_name,
@@ -3,6 +3,7 @@ from typing import List, Mapping, Optional
 from app.data_model.answer_store import AnswerStore
 from app.data_model.list_store import ListStore
 from app.data_model.progress_store import ProgressStore
+from app.instrumentation import timed
 from app.questionnaire.location import Location
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.routing_path import RoutingPath
@@ -28,6 +29,7 @@ class PathFinder:
         self.progress_store = progress_store
         self.list_store = list_store
 
+    @timed("routing")
     def routing_path(
         self, section_id: str, list_item_id: Optional[str] = None
     ) -> RoutingPath:
@@ -63,16 +65,15 @@ class PathFinder:
 
         return RoutingPath(routing_path_block_ids, section_id, list_item_id, list_name)
 
-    @staticmethod
-    def _block_index_for_block_id(blocks, block_id):
-        return next(
-            (index for (index, block) in enumerate(blocks) if block["id"] == block_id),
-            None,
-        )
-
     def _build_routing_path_block_ids(self, blocks, current_location):
         # Keep going unless we've hit the last block
         routing_path_block_ids = []
+        # Rules only check whether a block is on the path so far, so they are
+        # given the block ids as a set rather than scanning the path
+        block_ids_on_path = set()
+        block_indexes = {}
+        for index, block in enumerate(blocks):
+            block_indexes.setdefault(block["id"], index)
         block_index = 0
         repeating_list = self.schema.get_repeating_list_for_section(
             current_location.section_id
@@ -88,7 +89,7 @@ class PathFinder:
                 self.answer_store,
                 self.list_store,
                 current_location=current_location,
-                routing_path_block_ids=routing_path_block_ids,
+                routing_path_block_ids=block_ids_on_path,
             )
 
             if not is_skipping:
@@ -105,18 +106,20 @@ class PathFinder:
                         section_id=current_location.section_id, block_id=block_id
                     )
 
-                if block_id not in routing_path_block_ids:
+                if block_id not in block_ids_on_path:
                     routing_path_block_ids.append(block_id)
+                    block_ids_on_path.add(block_id)
 
                 # If routing rules exist then a rule must match (i.e. default goto)
                 routing_rules = block.get("routing_rules")
                 if routing_rules:
                     block_index = self._evaluate_routing_rules(
                         this_location,
-                        blocks,
+                        block_indexes,
                         routing_rules,
                         block_index,
                         routing_path_block_ids,
+                        block_ids_on_path,
                     )
                     if block_index:
                         continue
@@ -131,7 +134,13 @@ class PathFinder:
             block_index = block_index + 1
 
     def _evaluate_routing_rules(
-        self, this_location, blocks, routing_rules, block_index, routing_path_block_ids
+        self,
+        this_location,
+        block_indexes,
+        routing_rules,
+        block_index,
+        routing_path_block_ids,
+        block_ids_on_path,
     ):
         for rule in filter(is_goto_rule, routing_rules):
             should_goto = evaluate_goto(
@@ -141,14 +150,12 @@ class PathFinder:
                 self.answer_store,
                 self.list_store,
                 current_location=this_location,
-                routing_path_block_ids=routing_path_block_ids,
+                routing_path_block_ids=block_ids_on_path,
             )
 
             if should_goto:
                 next_block_id = self._get_next_block_id(rule)
-                next_block_index = PathFinder._block_index_for_block_id(
-                    blocks, next_block_id
-                )
+                next_block_index = block_indexes.get(next_block_id)
                 next_precedes_current = (
                     next_block_index is not None and next_block_index < block_index
                 )
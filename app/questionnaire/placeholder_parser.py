@@ -1,5 +1,6 @@
 from typing import Mapping, Sequence, Union
 
+from flask import g, has_request_context
 from jinja2 import escape, Markup
 
 from app.data_model.answer_store import AnswerStore
@@ -21,25 +22,48 @@ class PlaceholderParser:
         list_item_id=None,
         location=None,
         list_store=None,
+        transformer=None,
     ):
 
+        self._language = language
         self._schema = schema
         self._answer_store = answer_store or AnswerStore()
         self._metadata = metadata
         self._list_item_id = list_item_id
         self._list_store = list_store
         self._location = location
-        self._transformer = PlaceholderTransforms(language)
+        self._transformer = transformer or PlaceholderTransforms(language)
         self._placeholder_map = {}
+        self._request_values = get_request_placeholder_values(
+            self._answer_store, metadata
+        )
 
     def __call__(self, placeholder_list: Sequence[Mapping]) -> Mapping:
         for placeholder in placeholder_list:
             if placeholder["placeholder"] not in self._placeholder_map:
-                self._placeholder_map[
-                    placeholder["placeholder"]
-                ] = self._parse_placeholder(placeholder)
+                self._placeholder_map[placeholder["placeholder"]] = self._get_value(
+                    placeholder
+                )
         return self._placeholder_map
 
+    def _get_value(self, placeholder: Mapping):
+        if placeholder.get("value", {}).get("source") == "list":
+            return self._parse_placeholder(placeholder)
+
+        definition_id = (
+            self._schema.get_placeholder_definition_id(placeholder)
+            if self._schema
+            else id(placeholder)
+        )
+        key = (definition_id, self._language, self._list_item_id, self._location)
+        try:
+            return self._request_values[key][1]
+        except KeyError:
+            value = self._parse_placeholder(placeholder)
+            # The definition is kept with its value so its id cannot be reused
+            self._request_values[key] = (placeholder, value)
+            return value
+
     def _lookup_answer(
         self, answer_id: str, list_item_id: str = None
     ) -> Union[Markup, Sequence[Markup], None]:
@@ -115,3 +139,26 @@ class PlaceholderParser:
         if list_item_selector:
             return getattr(self._location, list_item_selector)
         return self._list_item_id
+
+
+def get_request_placeholder_values(answer_store, metadata) -> dict:
+    """
+    The placeholder values resolved so far in this request from `answer_store`
+    and `metadata`, keyed by placeholder definition, language, list item and
+    location. They are discarded as soon as an answer changes.
+
+    Definitions are identified by `QuestionnaireSchema.get_placeholder_definition_id`,
+    so a placeholder repeated through a block is only resolved once.
+
+    Values from a list's length are not included, as the list store does not
+    record when it changes.
+    """
+    if not has_request_context():
+        return {}
+
+    state = (id(answer_store), answer_store.revision, id(metadata))
+    cached = g.get("_placeholder_values")
+    if cached is None or cached[0] != state:
+        cached = g._placeholder_values = (state, answer_store, metadata, {})
+
+    return cached[-1]
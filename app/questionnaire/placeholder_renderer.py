@@ -1,12 +1,13 @@
-from copy import deepcopy
+from copy import copy
 
-from jsonpointer import set_pointer, resolve_pointer
+from jsonpointer import resolve_pointer
 
 from app.data_model.answer_store import AnswerStore
+from app.instrumentation import timed
 from app.questionnaire.placeholder_parser import PlaceholderParser
-
+from app.questionnaire.placeholder_transforms import PlaceholderTransforms
 from app.questionnaire.plural_forms import get_plural_form_key
-from app.questionnaire.schema_utils import find_pointers_containing
+from app.questionnaire.text_template import get_text_template
 
 
 class PlaceholderRenderer:
@@ -30,6 +31,7 @@ class PlaceholderRenderer:
         self._list_store = list_store
         self._metadata = metadata
         self._location = location
+        self._transformer = PlaceholderTransforms(language)
 
     def render_pointer(self, dict_to_render, pointer_to_render, list_item_id):
         pointer_data = resolve_pointer(dict_to_render, pointer_to_render)
@@ -46,6 +48,12 @@ class PlaceholderRenderer:
             return len(self._list_store[source_id].items)
         return self._metadata[source_id]
 
+    def render_title(self, title, list_item_id):
+        """ Render a title, which is either plain text or text with placeholders. """
+        if isinstance(title, dict):
+            return self.render_placeholder(title, list_item_id)
+        return title
+
     def render_placeholder(self, placeholder_data, list_item_id):
         placeholder_parser = PlaceholderParser(
             language=self._language,
@@ -55,6 +63,7 @@ class PlaceholderRenderer:
             list_item_id=list_item_id,
             location=self._location,
             list_store=self._list_store,
+            transformer=self._transformer,
         )
 
         if "text_plural" in placeholder_data:
@@ -62,24 +71,42 @@ class PlaceholderRenderer:
             count = self.get_plural_count(plural_schema["count"])
 
             plural_form_key = get_plural_form_key(count, self._language)
-            placeholder_data["text"] = plural_schema["forms"][plural_form_key]
-
-        if "text" not in placeholder_data and "placeholders" not in placeholder_data:
+            text = plural_schema["forms"][plural_form_key]
+        elif "text" in placeholder_data and "placeholders" in placeholder_data:
+            text = placeholder_data["text"]
+        else:
             raise ValueError("No placeholder found to render")
 
         transformed_values = placeholder_parser(placeholder_data["placeholders"])
 
-        return placeholder_data["text"].format(**transformed_values)
+        return get_text_template(text).format(transformed_values)
 
+    @timed("placeholder_render")
     def render(self, dict_to_render, list_item_id):
         """
-        Transform the current schema json to a fully rendered dictionary
-        """
-        rendered_data = deepcopy(dict_to_render)
-        pointers = find_pointers_containing(rendered_data, "placeholders")
+        Transform the current schema json to a fully rendered dictionary.
 
-        for pointer in pointers:
-            rendered_text = self.render_pointer(rendered_data, pointer, list_item_id)
-            set_pointer(rendered_data, pointer, rendered_text)
+        The schema is not modified. The dict returned is a copy, as is every dict
+        and list on the way to a rendered placeholder, but anything without
+        placeholders is shared with the schema and must not be changed. If
+        `dict_to_render` is itself placeholder text, its rendered text is returned.
+        """
+        rendered_data = copy(dict_to_render)
+        copied_ids = {id(rendered_data)}
+
+        for site in self._schema.get_placeholder_sites(dict_to_render):
+            # The empty path is the only site found in placeholder text
+            if not site:
+                return self.render_placeholder(dict_to_render, list_item_id)
+
+            parent = rendered_data
+            for key in site[:-1]:
+                child = parent[key]
+                if id(child) not in copied_ids:
+                    child = parent[key] = copy(child)
+                    copied_ids.add(id(child))
+                parent = child
+
+            parent[site[-1]] = self.render_placeholder(parent[site[-1]], list_item_id)
 
         return rendered_data
@@ -1,11 +1,12 @@
 from datetime import datetime
-from babel.numbers import format_currency, format_decimal
 from babel.dates import format_datetime
 from dateutil.tz import tzutc
 from dateutil.relativedelta import relativedelta
 from flask_babel import ngettext
+from werkzeug.utils import cached_property
 
 from app.settings import DEFAULT_LOCALE
+from app.utilities.number_format import get_number_format
 
 
 class PlaceholderTransforms:
@@ -20,8 +21,12 @@ class PlaceholderTransforms:
     input_date_format = "%Y-%m-%d"
     input_date_format_month_year_only = "%Y-%m"
 
+    @cached_property
+    def number_format(self):
+        return get_number_format(self.locale)
+
     def format_currency(self, number=None, currency="GBP"):
-        return format_currency(number, currency, locale=self.locale)
+        return self.number_format.format_currency(number, currency)
 
     def format_date(self, date_to_format, date_format):
         date_to_format = datetime.strptime(date_to_format, self.input_date_format)
@@ -75,7 +80,7 @@ class PlaceholderTransforms:
 
     def format_number(self, number):
         if number or number == 0:
-            return format_decimal(number, locale=self.locale)
+            return self.number_format.format_decimal(number)
 
         return ""
 
@@ -2,9 +2,9 @@ from babel.plural import PluralRule
 
 from app.questionnaire.questionnaire_schema import DEFAULT_LANGUAGE_CODE
 
-
-def get_plural_form_key(count, language=DEFAULT_LANGUAGE_CODE):
-    mappings = {
+PLURAL_RULES = {
+    language: PluralRule(mapping)
+    for language, mapping in {
         "en": {"one": "n is 1"},
         "cy": {
             "zero": "n is 0",
@@ -20,8 +20,9 @@ def get_plural_form_key(count, language=DEFAULT_LANGUAGE_CODE):
             "many": "n in 7..10",
         },
         "eo": {"one": "n is 1"},
-    }
+    }.items()
+}
 
-    plural_rule = PluralRule(mappings[language])
 
-    return plural_rule(count)
+def get_plural_form_key(count, language=DEFAULT_LANGUAGE_CODE):
+    return PLURAL_RULES[language](count)
@@ -2,10 +2,13 @@ from collections import OrderedDict, defaultdict
 
 from typing import List, Union
 
+import simplejson as json
 from flask_babel import force_locale
 
 from app.data_model.answer import Answer
 from app.forms.error_messages import error_messages
+from app.questionnaire.calculation import Calculation
+from app.questionnaire.text_template import get_text_template
 
 DEFAULT_LANGUAGE_CODE = "en"
 
@@ -16,14 +19,34 @@ LIST_COLLECTOR_CHILDREN = [
     "PrimaryPersonListAddOrEditQuestion",
 ]
 
+# Indexes of objects in the schema json, keyed by the ids of the objects
+OBJECT_INDEXES = ("_placeholder_sites", "_placeholder_definition_ids", "_calculations")
+
 
 class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
-    def __init__(self, questionnaire_json, language_code=DEFAULT_LANGUAGE_CODE):
+    def __init__(
+        self, questionnaire_json, language_code=DEFAULT_LANGUAGE_CODE, schema_name=None
+    ):
         self.json = questionnaire_json
         self.language_code = language_code
+        # The name the schema was loaded by, if it was loaded from a schema file
+        self.schema_name = schema_name
         self._parse_schema()
         self._list_name_to_section_map = {}
 
+    def __getstate__(self):
+        # Unpickled copies of the json's objects have new ids, so each index is
+        # pickled as its entries, which hold the objects themselves
+        state = self.__dict__.copy()
+        for index_name in OBJECT_INDEXES:
+            state[index_name] = list(state[index_name].values())
+        return state
+
+    def __setstate__(self, state):
+        for index_name in OBJECT_INDEXES:
+            state[index_name] = {id(entry[0]): entry for entry in state[index_name]}
+        self.__dict__.update(state)
+
     def is_hub_enabled(self):
         return self.json.get("hub", {}).get("enabled")
 
@@ -197,6 +220,49 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
         add_block = self.get_add_block_for_list_collector(list_collector_id)
         return self.get_answer_ids_for_block(add_block["id"])
 
+    def get_placeholder_sites(self, schema_object):
+        """
+        Return the placeholder definitions within part of the schema as a tuple of
+        paths, each a tuple of the keys and indexes leading to a definition.
+
+        Every dict in the schema is indexed when the schema is loaded. Anything
+        else, such as a copy made while choosing a variant, is searched each time.
+        """
+        indexed_object, sites = self._placeholder_sites.get(
+            id(schema_object), (None, None)
+        )
+        if indexed_object is schema_object:
+            return sites
+
+        return _index_placeholder_sites(schema_object, {})
+
+    def get_placeholder_definition_id(self, placeholder):
+        """
+        Return an id for a placeholder definition. Definitions in the schema with
+        the same content share an id, so the value of one can be used for the rest.
+        """
+        indexed_placeholder, definition_id = self._placeholder_definition_ids.get(
+            id(placeholder), (None, None)
+        )
+        if indexed_placeholder is placeholder:
+            return definition_id
+
+        return id(placeholder)
+
+    def get_calculation(self, calculation, question=None):
+        """
+        Return the compiled `calculation` of a calculated summary block or of a
+        calculated `question`. Calculations in the schema are compiled when it
+        is loaded, anything else is compiled each time.
+        """
+        indexed_calculation, compiled_calculation = self._calculations.get(
+            id(calculation), (None, None)
+        )
+        if indexed_calculation is calculation:
+            return compiled_calculation
+
+        return Calculation(calculation, self, question)
+
     def get_questions(self, question_id):
         """ Return a list of questions matching some question id
         This includes all questions inside variants
@@ -298,6 +364,63 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
         self._questions_by_id = self._get_questions_by_id()
         self._answers_by_id = self._get_answers_by_id()
         self.error_messages = self._get_error_messages()
+        self._placeholder_sites = {}
+        _index_placeholder_sites(self.json, self._placeholder_sites)
+        self._placeholder_definition_ids = self._get_placeholder_definition_ids()
+        self._compile_placeholder_texts()
+        self._calculations = self._compile_calculations()
+
+    def _get_placeholder_data(self):
+        for site in self.get_placeholder_sites(self.json):
+            placeholder_data = self.json
+            for key in site:
+                placeholder_data = placeholder_data[key]
+            yield placeholder_data
+
+    def _get_placeholder_definition_ids(self):
+        definition_ids = {}
+        shared_ids = {}
+
+        for placeholder_data in self._get_placeholder_data():
+            for placeholder in placeholder_data["placeholders"]:
+                definition_id = json.dumps(placeholder, sort_keys=True)
+                definition_ids[id(placeholder)] = (
+                    placeholder,
+                    shared_ids.setdefault(definition_id, definition_id),
+                )
+
+        return definition_ids
+
+    def _compile_placeholder_texts(self):
+        for placeholder_data in self._get_placeholder_data():
+            if "text_plural" in placeholder_data:
+                for text in placeholder_data["text_plural"]["forms"].values():
+                    get_text_template(text)
+            elif "text" in placeholder_data:
+                get_text_template(placeholder_data["text"])
+
+    def _compile_calculations(self):
+        calculations = {}
+
+        for block in self._blocks_by_id.values():
+            if "calculation" in block:
+                calculation = Calculation(block["calculation"], self)
+                calculations[id(block["calculation"])] = (
+                    block["calculation"],
+                    calculation,
+                )
+                # The reduced questions are shown as they are, so are indexed too
+                for question in calculation.reduced_questions:
+                    _index_placeholder_sites(question, self._placeholder_sites)
+
+            for question in self.get_all_questions_for_block(block):
+                for calculation in question.get("calculations", []):
+                    calculations[id(calculation)] = (
+                        calculation,
+                        Calculation(calculation, self, question),
+                    )
+
+        return calculations
 
     def _get_section_id_for_list_block(self, block):
         return self.get_group(self.get_block(block["parent_id"])["parent_id"])[
@@ -404,6 +527,33 @@ def get_nested_schema_objects(parent_object, list_key):
     return nested_objects
 
 
+def _index_placeholder_sites(schema_object, sites_by_id):
+    """
+    Find the paths to the placeholder definitions within `schema_object`,
+    recording each dict and the paths found within it against the dict's id.
+    """
+    if isinstance(schema_object, dict):
+        if "placeholders" in schema_object:
+            sites = ((),)
+        else:
+            sites = tuple(
+                (key,) + site
+                for key, value in schema_object.items()
+                for site in _index_placeholder_sites(value, sites_by_id)
+            )
+        sites_by_id[id(schema_object)] = (schema_object, sites)
+        return sites
+
+    if isinstance(schema_object, list):
+        return tuple(
+            (index,) + site
+            for index, item in enumerate(schema_object)
+            for site in _index_placeholder_sites(item, sites_by_id)
+        )
+
+    return ()
+
+
 def _get_values_for_key(block, key, ignore_keys=None):
     ignore_keys = ignore_keys or []
     for k, v in block.items():
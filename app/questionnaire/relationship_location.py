@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Mapping
 
-from flask import url_for
+from app.helpers.url_helper import build_url
 
 
 @dataclass
@@ -13,12 +13,15 @@ class RelationshipLocation:
     list_item_id: str
     to_list_item_id: str
 
+    def __hash__(self):
+        return hash(frozenset(self.__dict__.values()))
+
     def for_json(self) -> Mapping:
         attributes = vars(self)
         return {k: v for k, v in attributes.items() if v is not None}
 
     def url(self) -> str:
-        return url_for(
+        return build_url(
             "questionnaire.relationship",
             block_id=self.block_id,
             list_item_id=self.list_item_id,
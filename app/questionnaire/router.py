@@ -1,5 +1,7 @@
 from flask import url_for
 
+from app.helpers.url_helper import build_url
+
 from app.questionnaire.location import Location
 from app.questionnaire.path_finder import PathFinder
 from app.questionnaire.relationship_router import RelationshipRouter
@@ -44,8 +46,7 @@ class Router:
         ):
             return False
 
-        allowable_path = self._get_allowable_path(routing_path)
-        if location.block_id in allowable_path:
+        if self._is_on_allowable_path(location.block_id, routing_path):
             block = self._schema.get_block(location.block_id)
             if (
                 block["type"] in ["Confirmation", "Summary"]
@@ -57,10 +58,14 @@ class Router:
         return False
 
     def can_access_hub(self):
-        return self._schema.is_hub_enabled() and all(
+        if not self._schema.is_hub_enabled():
+            return False
+
+        enabled_section_ids = self.enabled_section_ids
+        return all(
             self._progress_store.is_section_complete(section_id)
             for section_id in self._schema.get_section_ids_required_for_hub()
-            if section_id in self.enabled_section_ids
+            if section_id in enabled_section_ids
         )
 
     def routing_path(self, section_id, list_item_id=None):
@@ -93,7 +98,7 @@ class Router:
                 location.section_id, location.list_item_id
             )
         ):
-            return url_for(
+            return build_url(
                 "questionnaire.block",
                 block_id=last_block_id,
                 list_name=routing_path.list_name,
@@ -112,7 +117,7 @@ class Router:
 
         next_block_id = routing_path[block_id_index + 1]
 
-        return url_for(
+        return build_url(
             "questionnaire.block",
             block_id=next_block_id,
             list_name=routing_path.list_name,
@@ -136,7 +141,7 @@ class Router:
                     list_item_ids=list_items,
                 )
                 return relationship_router.get_last_location_url()
-            return url_for(
+            return build_url(
                 "questionnaire.block",
                 block_id=previous_block_id,
                 list_name=routing_path.list_name,
@@ -173,7 +178,9 @@ class Router:
         section_key = (section_id, list_item_id)
         if section_key in self._progress_store:
             for block_id in routing_path:
-                if not self._is_block_complete(block_id, section_id, list_item_id):
+                if not self._progress_store.is_block_complete(
+                    block_id, section_id, list_item_id
+                ):
                     return Location(
                         block_id=block_id,
                         section_id=routing_path.section_id,
@@ -246,21 +253,15 @@ class Router:
                 )
         return full_routing_path
 
-    def _is_block_complete(self, block_id, section_id, list_item_id):
-        completed_block_ids = self._progress_store.get_completed_block_ids(
-            section_id, list_item_id
-        )
-
-        return block_id in completed_block_ids
-
     def _get_first_incomplete_location(self, routing_path):
         for block_id in routing_path:
-            block = self._schema.get_block(block_id)
-            block_type = block.get("type")
-
-            if not self._is_block_complete(
+            if self._progress_store.is_block_complete(
                 block_id, routing_path.section_id, routing_path.list_item_id
-            ) and block_type not in {"Summary", "Confirmation"}:
+            ):
+                continue
+
+            block_type = self._schema.get_block(block_id).get("type")
+            if block_type not in {"Summary", "Confirmation"}:
                 return Location(
                     block_id=block_id,
                     section_id=routing_path.section_id,
@@ -268,22 +269,19 @@ class Router:
                     list_name=routing_path.list_name,
                 )
 
-    def _get_allowable_path(self, routing_path):
+    def _is_on_allowable_path(self, block_id, routing_path):
         """
         The allowable path is the completed path plus the next location
         """
-        allowable_path = []
-
-        if routing_path:
-            for block_id in routing_path:
-                allowable_path.append(block_id)
-
-                if not self._is_block_complete(
-                    block_id, routing_path.section_id, routing_path.list_item_id
-                ):
-                    return allowable_path
+        if block_id not in routing_path:
+            return False
 
-        return allowable_path
+        return all(
+            self._progress_store.is_block_complete(
+                previous_block_id, routing_path.section_id, routing_path.list_item_id
+            )
+            for previous_block_id in routing_path[: routing_path.index(block_id)]
+        )
 
     def get_enabled_section_keys(self):
         enabled_section_keys = []
@@ -1,5 +1,8 @@
 class RoutingPath:
     """Holds a list of block_ids and has section_id, list_item_id and list_name attributes
+
+    The position of each block_id is indexed when the path is built, so checking
+    whether a block is on the path and finding its position do not scan the path.
     """
 
     def __init__(self, block_ids, section_id, list_item_id=None, list_name=None):
@@ -8,6 +11,10 @@ class RoutingPath:
         self.list_item_id = list_item_id
         self.list_name = list_name
 
+        self._block_id_positions = {}
+        for position, block_id in enumerate(self.block_ids):
+            self._block_id_positions.setdefault(block_id, position)
+
     def __len__(self):
         return len(self.block_ids)
 
@@ -20,6 +27,9 @@ class RoutingPath:
     def __reversed__(self):
         return reversed(self.block_ids)
 
+    def __contains__(self, block_id):
+        return block_id in self._block_id_positions
+
     def __eq__(self, other):
         if isinstance(other, RoutingPath):
             return (
@@ -34,5 +44,11 @@ class RoutingPath:
 
         return self.block_ids == other
 
-    def index(self, *args):
-        return self.block_ids.index(*args)
+    def index(self, block_id, *args):
+        if args:
+            return self.block_ids.index(block_id, *args)
+
+        try:
+            return self._block_id_positions[block_id]
+        except (KeyError, TypeError):
+            raise ValueError(f"{block_id!r} is not in routing path")
@@ -1,9 +1,8 @@
 import logging
-import re
-from datetime import datetime
 
 from dateutil.relativedelta import relativedelta
 
+from app.utilities.dates import convert_to_datetime, get_today
 
 MAX_REPEATS = 25
 
@@ -98,7 +97,7 @@ def get_date_match_value(date_comparison, answer_store, schema, metadata):
 
     if "value" in date_comparison:
         if date_comparison["value"] == "now":
-            match_value = datetime.utcnow().strftime("%Y-%m-%d")
+            match_value = get_today()
         else:
             match_value = date_comparison["value"]
     elif "id" in date_comparison:
@@ -119,16 +118,6 @@ def get_date_match_value(date_comparison, answer_store, schema, metadata):
     return match_value
 
 
-def convert_to_datetime(value):
-    date_format = "%Y-%m"
-    if value and re.match(r"\d{4}-\d{2}-\d{2}", value):
-        date_format = "%Y-%m-%d"
-    if value and re.match(r"\d{4}$", value):
-        date_format = "%Y"
-
-    return datetime.strptime(value, date_format) if value else None
-
-
 def evaluate_goto(
     goto_rule,
     schema,
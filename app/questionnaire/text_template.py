@@ -0,0 +1,65 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Mapping, Optional, Tuple
+
+
+class TextTemplate:
+    """
+    Placeholder text, such as `"{person_name} is {age}"`, split once into the
+    literal text and the names of the placeholders between it.
+
+    Formatting gives the same result as `str.format`. Text using anything other
+    than plain placeholder names, such as a format spec, is left to `str.format`.
+    """
+
+    __slots__ = ("text", "_parts", "_tail")
+
+    # The literal text before each placeholder with the placeholder's name, and
+    # the literal text after the last, or None to format with `str.format`
+    _parts: Optional[Tuple[Tuple[str, str], ...]]
+    _tail: Optional[str]
+
+    def __init__(self, text: str):
+        self.text = text
+
+        parsed = list(Formatter().parse(text))
+        if all(
+            not format_spec
+            and not conversion
+            and (field_name is None or field_name.isidentifier())
+            for _, field_name, format_spec, conversion in parsed
+        ):
+            parts = []
+            # Escaped braces split the literal text without a placeholder between
+            literal_text = ""
+            for text_before, field_name, _, _ in parsed:
+                literal_text += text_before
+                if field_name is not None:
+                    parts.append((literal_text, field_name))
+                    literal_text = ""
+
+            self._parts = tuple(parts)
+            self._tail = literal_text
+        else:
+            self._parts = None
+            self._tail = None
+
+    def format(self, values: Mapping) -> str:
+        if self._parts is None or self._tail is None:
+            return self.text.format(**values)
+
+        return (
+            "".join(
+                [
+                    literal_text + str(values[field_name])
+                    for literal_text, field_name in self._parts
+                ]
+            )
+            + self._tail
+        )
+
+
+@lru_cache(maxsize=4096)
+def get_text_template(text: str) -> TextTemplate:
+    """ The template for some placeholder text. Schemas compile theirs when loaded. """
+    return TextTemplate(text)
@@ -2,9 +2,12 @@ from functools import wraps
 
 import simplejson as json
 from flask import Blueprint
+from flask import current_app
 from flask import g
+from flask import request
 from flask_login import current_user
 from flask_login import login_required
+from werkzeug.exceptions import NotFound
 
 from app.authentication.roles import role_required
 from app.globals import get_questionnaire_store, get_session_store
@@ -85,3 +88,22 @@ def dump_submission(schema, questionnaire_store):
         "submission": convert_answers(schema, questionnaire_store, routing_path)
     }
     return json.dumps(response, for_json=True), 200
+
+
+@dump_blueprint.route("/dump/profile", methods=["GET"])
+@login_required
+@role_required("dumper")
+def dump_profile():
+    """
+    The stacks sampled by this worker's profiler for each endpoint, which are
+    cleared once dumped when `clear` is given.
+    """
+    profiler = current_app.eq.get("profiler")
+    if not profiler:
+        raise NotFound
+
+    response = profiler.get_profiles()
+    if "clear" in request.args:
+        profiler.clear()
+
+    return json.dumps(response, for_json=True), 200
@@ -1,14 +1,29 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import simplejson as json
-from flask import Blueprint, Response, request, session, current_app
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    session,
+    current_app,
+    stream_with_context,
+)
 from sdc.crypto.decrypter import decrypt
 from sdc.crypto.encrypter import encrypt
+from sdc.crypto.exceptions import InvalidTokenException
 from structlog import get_logger
 
 from app.authentication.user import User
+from app.data_model.app_models import QuestionnaireState
+from app.data_model.questionnaire_store import QuestionnaireStore
 from app.globals import get_answer_store, get_questionnaire_store, get_metadata
+from app.instrumentation import timed
 from app.keys import KEY_PURPOSE_AUTHENTICATION, KEY_PURPOSE_SUBMISSION
 from app.questionnaire.router import Router
-from app.submitter.converter import convert_answers
+from app.storage.encrypted_questionnaire_storage import EncryptedQuestionnaireStorage
+from app.submitter.converter import convert_answers_to_json
 from app.submitter.submission_failed import SubmissionFailedException
 from app.utilities.schema import load_schema_from_metadata
 
@@ -16,6 +31,9 @@ flush_blueprint = Blueprint("flush", __name__)
 
 logger = get_logger()
 
+# The number of tokens whose questionnaire states are read and deleted together
+BULK_FLUSH_CHUNK_SIZE = 100
+
 
 @flush_blueprint.route("/flush", methods=["POST"])
 def flush_data():
@@ -47,43 +65,240 @@ def flush_data():
     return Response(status=403)
 
 
-def _submit_data(user):
-    answer_store = get_answer_store(user)
+@flush_blueprint.route("/flush/bulk", methods=["POST"])
+def bulk_flush_data():
+    """
+    Flush a batch of questionnaires in one call.
+
+    The request body is a JSON object with a `tokens` list, each token being one
+    accepted by `/flush`. The response is streamed as newline delimited JSON with
+    one object per token, holding the token's `index` in the request and the
+    `status` `/flush` would have responded with for it. Tokens for the same
+    questionnaire are flushed once.
+
+    A 200 with `"deleted": false` means the answers were submitted but the
+    questionnaire couldn't be deleted, so it will be submitted again by the next
+    flush. If the questionnaires of a chunk of tokens can't be read, each token
+    in the chunk reports a 500 and the next chunk is flushed.
+    """
+    if session:
+        session.clear()
+
+    payload = request.get_json(silent=True)
+    tokens = payload.get("tokens") if isinstance(payload, dict) else None
+
+    if not tokens or not isinstance(tokens, list):
+        return Response(status=400)
+
+    if len(tokens) > current_app.config["EQ_BULK_FLUSH_MAX_BATCH_SIZE"]:
+        return Response(status=413)
+
+    # pylint: disable=protected-access
+    results = _bulk_flush(current_app._get_current_object(), tokens)
+
+    return Response(
+        stream_with_context(json.dumps(result) + "\n" for result in results),
+        mimetype="application/x-ndjson",
+    )
+
+
+def _bulk_flush(app, tokens):
+    with ThreadPoolExecutor(
+        max_workers=app.config["EQ_BULK_FLUSH_CONCURRENCY"]
+    ) as executor:
+        for start in range(0, len(tokens), BULK_FLUSH_CHUNK_SIZE):
+            chunk = dict(
+                enumerate(tokens[start : start + BULK_FLUSH_CHUNK_SIZE], start)
+            )
+            yield from _bulk_flush_chunk(app, executor, chunk)
 
-    if answer_store:
-        questionnaire_store = get_questionnaire_store(user.user_id, user.user_ik)
-        answer_store = questionnaire_store.answer_store
-        metadata = questionnaire_store.metadata
-        progress_store = questionnaire_store.progress_store
-        list_store = questionnaire_store.list_store
 
-        schema = load_schema_from_metadata(metadata)
+def _bulk_flush_chunk(app, executor, tokens_by_index):
+    users_by_index, statuses = _get_flush_users(app, executor, tokens_by_index)
 
-        router = Router(schema, answer_store, list_store, progress_store, metadata)
-        full_routing_path = router.full_routing_path()
+    flush_statuses, flushed_states = _flush_users(app, executor, users_by_index)
+    statuses.update(flush_statuses)
 
-        message = json.dumps(
-            convert_answers(
-                schema, questionnaire_store, full_routing_path, flushed=True
-            ),
-            for_json=True,
+    deleted = _delete_flushed_states(app, flushed_states) if flushed_states else True
+
+    logger.info(
+        "flushed answers in bulk",
+        requested=len(tokens_by_index),
+        flushed=len(flushed_states),
+        deleted=deleted,
+    )
+
+    results = []
+    for index, status in sorted(statuses.items()):
+        result = {"index": index, "status": status}
+        if status == 200 and not deleted:
+            result["deleted"] = False
+        results.append(result)
+    return results
+
+
+def _flush_users(app, executor, users_by_index):
+    """
+    Flush the questionnaire of each user, returning the status of each by the
+    index of its token, and the questionnaire states that were submitted.
+
+    Tokens for the same questionnaire are flushed once, and all report the status
+    of that flush.
+    """
+    indexes_by_user_id = defaultdict(list)
+    for index, user in sorted(users_by_index.items()):
+        indexes_by_user_id[user.user_id].append(index)
+
+    try:
+        questionnaire_states = app.eq["storage"].get_by_keys(
+            QuestionnaireState, list(indexes_by_user_id)
         )
+    except Exception as e:  # pylint:disable=broad-except
+        logger.error("unable to read questionnaires to flush", exc_info=e)
+        return dict.fromkeys(users_by_index, 500), []
+
+    flush_futures = {
+        executor.submit(
+            _with_app_context,
+            app,
+            _flush_questionnaire_state,
+            users_by_index[indexes[0]],
+            questionnaire_states.get(user_id),
+        ): user_id
+        for user_id, indexes in indexes_by_user_id.items()
+    }
+
+    statuses = {}
+    flushed_states = []
+    for user_id, status, failed in _get_completed_results(flush_futures):
+        if failed:
+            status = 500
+        elif status == 200:
+            flushed_states.append(questionnaire_states[user_id])
 
-        encrypted_message = encrypt(
-            message, current_app.eq["key_store"], KEY_PURPOSE_SUBMISSION
+        statuses.update(dict.fromkeys(indexes_by_user_id[user_id], status))
+
+    return statuses, flushed_states
+
+
+def _get_flush_users(app, executor, tokens_by_index):
+    """
+    Get the user each token is for, keyed by the token's index, and the status
+    of each token that isn't for a user that can be flushed.
+    """
+    users_by_index = {}
+    results = {}
+
+    user_futures = {
+        executor.submit(_with_app_context, app, _get_flush_user, token): index
+        for index, token in tokens_by_index.items()
+    }
+    for index, user, failed in _get_completed_results(user_futures):
+        if failed:
+            results[index] = 500
+        elif user:
+            users_by_index[index] = user
+        else:
+            results[index] = 403
+
+    return users_by_index, results
+
+
+def _delete_flushed_states(app, flushed_states):
+    """
+    Delete the questionnaire states of flushed questionnaires, returning whether
+    they were deleted. The answers have already been submitted, so a failure is
+    reported with the status of each item rather than losing it.
+    """
+    try:
+        app.eq["storage"].delete_many(flushed_states)
+    except Exception as e:  # pylint:disable=broad-except
+        logger.error(
+            "unable to delete flushed questionnaires",
+            count=len(flushed_states),
+            exc_info=e,
         )
+        return False
+
+    return True
 
-        sent = current_app.eq["submitter"].send_message(
-            encrypted_message,
-            tx_id=metadata.get("tx_id"),
-            questionnaire_id=metadata.get("questionnaire_id"),
-            case_id=metadata.get("case_id"),
+
+def _get_completed_results(futures):
+    """
+    Yield the key and result of each future as it completes, and whether it
+    raised an exception, so that one item failing doesn't fail the others.
+    """
+    for future in as_completed(futures):
+        try:
+            yield futures[future], future.result(), False
+        except Exception as e:  # pylint:disable=broad-except
+            logger.error("unable to flush item", exc_info=e)
+            yield futures[future], None, True
+
+
+def _with_app_context(app, func, *args):
+    # Each item gets its own application context and log context so state held
+    # on `g`, such as the questionnaire store, and a bound tx_id are not shared
+    # between items run on the same thread
+    with app.app_context():
+        logger.new()
+        return func(*args)
+
+
+def _get_flush_user(encrypted_token):
+    try:
+        decrypted_token = decrypt(
+            token=encrypted_token,
+            key_store=current_app.eq["key_store"],
+            key_purpose=KEY_PURPOSE_AUTHENTICATION,
+            leeway=current_app.config["EQ_JWT_LEEWAY_IN_SECONDS"],
         )
+    except InvalidTokenException as e:
+        logger.warning("invalid flush token", exc_info=e)
+        return None
+
+    roles = decrypted_token.get("roles")
+    if roles and "flusher" in roles:
+        return _get_user(decrypted_token["response_id"])
+
+    return None
+
+
+def _flush_questionnaire_state(user, questionnaire_state):
+    if not questionnaire_state:
+        return 404
+
+    pepper = current_app.eq["secret_store"].get_secret_by_name(
+        "EQ_SERVER_SIDE_STORAGE_ENCRYPTION_USER_PEPPER"
+    )
+    storage = EncryptedQuestionnaireStorage(
+        user.user_id, user.user_ik, pepper, questionnaire_state=questionnaire_state
+    )
+
+    try:
+        questionnaire_store = QuestionnaireStore(storage)
+        if not questionnaire_store.answer_store:
+            return 404
+
+        if "tx_id" in questionnaire_store.metadata:
+            logger.bind(tx_id=questionnaire_store.metadata["tx_id"])
+
+        _submit_questionnaire_store(questionnaire_store)
+    except Exception as e:  # pylint:disable=broad-except
+        logger.error("unable to flush answers", exc_info=e)
+        return 500
+
+    return 200
 
-        if not sent:
-            raise SubmissionFailedException()
 
-        get_questionnaire_store(user.user_id, user.user_ik).delete()
+def _submit_data(user):
+    answer_store = get_answer_store(user)
+
+    if answer_store:
+        questionnaire_store = get_questionnaire_store(user.user_id, user.user_ik)
+        _submit_questionnaire_store(questionnaire_store)
+
+        questionnaire_store.delete()
         logger.info("successfully flushed answers")
         return True
 
@@ -91,6 +306,37 @@ def _submit_data(user):
     return False
 
 
+@timed("submission")
+def _submit_questionnaire_store(questionnaire_store):
+    answer_store = questionnaire_store.answer_store
+    metadata = questionnaire_store.metadata
+    progress_store = questionnaire_store.progress_store
+    list_store = questionnaire_store.list_store
+
+    schema = load_schema_from_metadata(metadata)
+
+    router = Router(schema, answer_store, list_store, progress_store, metadata)
+    full_routing_path = router.full_routing_path()
+
+    message = convert_answers_to_json(
+        schema, questionnaire_store, full_routing_path, flushed=True
+    )
+
+    encrypted_message = encrypt(
+        message, current_app.eq["key_store"], KEY_PURPOSE_SUBMISSION
+    )
+
+    sent = current_app.eq["submitter"].send_message(
+        encrypted_message,
+        tx_id=metadata.get("tx_id"),
+        questionnaire_id=metadata.get("questionnaire_id"),
+        case_id=metadata.get("case_id"),
+    )
+
+    if not sent:
+        raise SubmissionFailedException()
+
+
 def _get_user(response_id):
     id_generator = current_app.eq["id_generator"]
     user_id = id_generator.generate_id(response_id)
@@ -0,0 +1,15 @@
+from flask import Blueprint, Response
+
+from app.instrumentation import get_metrics
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+
+@metrics_blueprint.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    This worker's request and span duration histograms, for Prometheus to scrape.
+    Only registered when the metrics endpoint is enabled, and not to be exposed
+    outside the cluster.
+    """
+    return Response(get_metrics(), mimetype="text/plain; version=0.0.4")
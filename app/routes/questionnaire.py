@@ -36,11 +36,13 @@ from app.helpers.language_helper import handle_language
 from app.helpers.schema_helpers import with_schema
 from app.helpers.session_helpers import with_questionnaire_store
 from app.helpers.template_helper import render_template
+from app.instrumentation import span
 from app.keys import KEY_PURPOSE_SUBMISSION
 from app.questionnaire.location import InvalidLocationException
 from app.questionnaire.router import Router
+from app.setup import hub_cache
 from app.storage.storage_encryption import StorageEncryption
-from app.submitter.converter import convert_answers
+from app.submitter.converter import convert_answers_to_json
 from app.submitter.submission_failed import SubmissionFailedException
 from app.utilities.schema import load_schema_from_session_data
 from app.views.contexts.hub_context import HubContext
@@ -110,34 +112,24 @@ def before_post_submission_request():
 @with_questionnaire_store
 @with_schema
 def get_questionnaire(schema, questionnaire_store):
-    router = Router(
-        schema,
-        questionnaire_store.answer_store,
-        questionnaire_store.list_store,
-        questionnaire_store.progress_store,
-        questionnaire_store.metadata,
-    )
-
-    if not router.can_access_hub():
-        redirect_location = router.get_first_incomplete_location_in_survey()
-        return redirect(redirect_location.url())
-
     language_code = get_session_store().session_data.language_code
 
-    hub = HubContext(
-        language=language_code,
-        schema=schema,
-        answer_store=questionnaire_store.answer_store,
-        list_store=questionnaire_store.list_store,
-        progress_store=questionnaire_store.progress_store,
-        metadata=questionnaire_store.metadata,
+    # The hub only changes when the questionnaire does, so a revisit is served
+    # from the cache without routing or rendering placeholders
+    cache_key = _get_hub_cache_key(
+        current_user.user_id, language_code, questionnaire_store
     )
+    hub = hub_cache.get(cache_key) if cache_key else None
 
-    hub_context = hub.get_context(
-        router.is_survey_complete(), router.enabled_section_ids
-    )
+    if hub is None:
+        hub = _build_hub(schema, questionnaire_store, language_code)
+        if cache_key:
+            hub_cache.set(cache_key, hub)
 
-    return render_template("hub", content=hub_context)
+    if hub["redirect_url"]:
+        return redirect(hub["redirect_url"])
+
+    return render_template("hub", content=hub["context"])
 
 
 @questionnaire_blueprint.route("/", methods=["POST"])
@@ -452,19 +444,20 @@ def submit_answers(schema, questionnaire_store, full_routing_path):
     list_store = questionnaire_store.list_store
     metadata = questionnaire_store.metadata
 
-    message = json.dumps(
-        convert_answers(schema, questionnaire_store, full_routing_path), for_json=True
-    )
+    with span("submission"):
+        message = convert_answers_to_json(
+            schema, questionnaire_store, full_routing_path
+        )
 
-    encrypted_message = encrypt(
-        message, current_app.eq["key_store"], KEY_PURPOSE_SUBMISSION
-    )
-    sent = current_app.eq["submitter"].send_message(
-        encrypted_message,
-        questionnaire_id=metadata.get("questionnaire_id"),
-        case_id=metadata.get("case_id"),
-        tx_id=metadata.get("tx_id"),
-    )
+        encrypted_message = encrypt(
+            message, current_app.eq["key_store"], KEY_PURPOSE_SUBMISSION
+        )
+        sent = current_app.eq["submitter"].send_message(
+            encrypted_message,
+            questionnaire_id=metadata.get("questionnaire_id"),
+            case_id=metadata.get("case_id"),
+            tx_id=metadata.get("tx_id"),
+        )
 
     if not sent:
         raise SubmissionFailedException()
@@ -556,3 +549,44 @@ def request_wants_json():
         best == "application/json"
         and request.accept_mimetypes[best] > request.accept_mimetypes["text/html"]
     )
+
+
+def _get_hub_cache_key(user_id, language_code, questionnaire_store):
+    state_key = questionnaire_store.state_key
+    if state_key is None:
+        return None
+
+    return f"hub:{user_id}:{language_code}:{state_key}"
+
+
+def _build_hub(schema, questionnaire_store, language_code):
+    """
+    Either the url to go to, if the hub can't be accessed yet, or the hub's
+    context.
+    """
+    router = Router(
+        schema,
+        questionnaire_store.answer_store,
+        questionnaire_store.list_store,
+        questionnaire_store.progress_store,
+        questionnaire_store.metadata,
+    )
+
+    if not router.can_access_hub():
+        redirect_location = router.get_first_incomplete_location_in_survey()
+        return {"redirect_url": redirect_location.url(), "context": None}
+
+    hub = HubContext(
+        language=language_code,
+        schema=schema,
+        answer_store=questionnaire_store.answer_store,
+        list_store=questionnaire_store.list_store,
+        progress_store=questionnaire_store.progress_store,
+        metadata=questionnaire_store.metadata,
+    )
+
+    hub_context = hub.get_context(
+        router.is_survey_complete(), router.enabled_section_ids
+    )
+
+    return {"redirect_url": None, "context": hub_context}
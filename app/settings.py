@@ -54,6 +54,25 @@ EQ_RABBITMQ_HOST = os.getenv("EQ_RABBITMQ_HOST")
 EQ_RABBITMQ_HOST_SECONDARY = os.getenv("EQ_RABBITMQ_HOST_SECONDARY")
 EQ_RABBITMQ_PORT = int(os.getenv("EQ_RABBITMQ_PORT", "5672"))
 EQ_RABBITMQ_QUEUE_NAME = os.getenv("EQ_RABBITMQ_QUEUE_NAME", "submit_q")
+EQ_RABBITMQ_CONNECTION_POOL_SIZE = int(
+    os.getenv("EQ_RABBITMQ_CONNECTION_POOL_SIZE", "5")
+)
+
+EQ_SUBMISSION_OUTBOX_ENABLED = parse_mode(
+    os.getenv("EQ_SUBMISSION_OUTBOX_ENABLED", "False")
+)
+EQ_SUBMISSION_OUTBOX_DIRECTORY = os.getenv(
+    "EQ_SUBMISSION_OUTBOX_DIRECTORY", "submission-outbox"
+)
+EQ_SUBMISSION_OUTBOX_BATCH_SIZE = int(
+    os.getenv("EQ_SUBMISSION_OUTBOX_BATCH_SIZE", "50")
+)
+EQ_SUBMISSION_OUTBOX_POLL_INTERVAL_SECONDS = float(
+    os.getenv("EQ_SUBMISSION_OUTBOX_POLL_INTERVAL_SECONDS", "1")
+)
+
+EQ_BULK_FLUSH_MAX_BATCH_SIZE = int(os.getenv("EQ_BULK_FLUSH_MAX_BATCH_SIZE", "1000"))
+EQ_BULK_FLUSH_CONCURRENCY = int(os.getenv("EQ_BULK_FLUSH_CONCURRENCY", "10"))
 
 EQ_SESSION_TIMEOUT_SECONDS = int(os.getenv("EQ_SESSION_TIMEOUT_SECONDS", str(45 * 60)))
 
@@ -88,6 +107,16 @@ EQ_REDIS_PORT = get_env_or_fail("EQ_REDIS_PORT")
 
 EQ_DEV_MODE = parse_mode(os.getenv("EQ_DEV_MODE", "False"))
 EQ_ENABLE_CACHE = parse_mode(os.getenv("EQ_ENABLE_CACHE", "True"))
+EQ_HUB_CACHE_THRESHOLD = int(os.getenv("EQ_HUB_CACHE_THRESHOLD", "1000"))
+EQ_PROFILING = parse_mode(os.getenv("EQ_PROFILING", "False"))
+EQ_PROFILING_SAMPLE_RATE = float(os.getenv("EQ_PROFILING_SAMPLE_RATE", "0.01"))
+EQ_PROFILING_INTERVAL_MILLISECONDS = int(
+    os.getenv("EQ_PROFILING_INTERVAL_MILLISECONDS", "10")
+)
+EQ_PROFILING_MAX_STACKS = int(os.getenv("EQ_PROFILING_MAX_STACKS", "1000"))
+EQ_ENABLE_METRICS_ENDPOINT = parse_mode(
+    os.getenv("EQ_ENABLE_METRICS_ENDPOINT", "False")
+)
 EQ_ENABLE_FLASK_DEBUG_TOOLBAR = parse_mode(
     os.getenv("EQ_ENABLE_FLASK_DEBUG_TOOLBAR", "False")
 )
@@ -97,6 +126,9 @@ EQ_ENABLE_SECURE_SESSION_COOKIE = parse_mode(
 
 EQ_ENABLE_HTML_MINIFY = parse_mode(os.getenv("EQ_ENABLE_HTML_MINIFY", "True"))
 
+EQ_JINJA_BYTECODE_CACHE_DIR = os.getenv("EQ_JINJA_BYTECODE_CACHE_DIR")
+EQ_WARM_UP_TEMPLATES = parse_mode(os.getenv("EQ_WARM_UP_TEMPLATES", "False"))
+
 EQ_JWT_LEEWAY_IN_SECONDS = 120
 DEFAULT_LOCALE = "en_GB"
 
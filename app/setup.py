@@ -1,8 +1,10 @@
 import copy
+import hashlib
 import json
 from uuid import uuid4
 
 import boto3
+import jinja2
 import redis
 import yaml
 from botocore.config import Config
@@ -15,6 +17,8 @@ from flask_wtf.csrf import CSRFProtect
 from google.auth import credentials
 from google.cloud import datastore
 from htmlmin.main import minify
+from jinja2 import FileSystemBytecodeCache, TemplateSyntaxError
+from jinja2.bccache import Bucket
 from sdc.crypto.key_store import KeyStore, validate_required_keys
 from structlog import get_logger
 from app import settings
@@ -23,11 +27,20 @@ from app.authentication.cookie_session import SHA256SecureCookieSessionInterface
 from app.authentication.user_id_generator import UserIDGenerator
 from app.globals import get_session_store
 from app.keys import KEY_PURPOSE_SUBMISSION
+from app.profiler import setup_profiler
 from app.helpers import get_span_and_trace
+from app.instrumentation import (
+    get_request_durations,
+    span as timing_span,
+    start_request_timer,
+    stop_request_timer,
+)
 from app.secrets import SecretStore, validate_required_secrets
 from app.storage.datastore import DatastoreStorage
 from app.storage.dynamodb import DynamodbStorage
 from app.storage.redis import RedisStorage
+from app.submitter.connection_pool import RabbitMQConnectionPool
+from app.submitter.outbox import FileSystemOutbox, OutboxSender, OutboxSubmitter
 from app.submitter.submitter import LogSubmitter, RabbitMQSubmitter, GCSSubmitter
 
 CACHE_HEADERS = {
@@ -74,6 +87,7 @@ CSP_POLICY = {
 }
 
 cache = Cache()
+hub_cache = Cache()
 compress = Compress()
 
 logger = get_logger()
@@ -97,6 +111,72 @@ class EmulatorCredentials(credentials.Credentials):
         raise RuntimeError("Should never be refreshed.")
 
 
+# The environment settings a template's compiled code depends on
+TEMPLATE_COMPILE_SETTINGS = (
+    "block_start_string",
+    "block_end_string",
+    "variable_start_string",
+    "variable_end_string",
+    "comment_start_string",
+    "comment_end_string",
+    "line_statement_prefix",
+    "line_comment_prefix",
+    "trim_blocks",
+    "lstrip_blocks",
+    "newline_sequence",
+    "keep_trailing_newline",
+    "optimized",
+    "autoescape",
+)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Templates compiled when the image is built are read from the cache directory.
+    Templates compiled later are only cached if the directory can be written to.
+
+    Jinja only checks a template's source, so each key is prefixed with a hash of
+    the Jinja version and the environment the template is compiled in. A template
+    compiled with a different version, setting, extension, filter or test is
+    compiled again rather than read from the cache.
+    """
+
+    def get_bucket(self, environment, name, filename, source):
+        key = self.get_cache_key(name, filename)
+        bucket = Bucket(
+            environment,
+            f"{self.get_environment_key(environment)}-{key}",
+            self.get_source_checksum(source),
+        )
+        self.load_bytecode(bucket)
+        return bucket
+
+    @staticmethod
+    def get_environment_key(environment):
+        settings_values = []
+        for setting in TEMPLATE_COMPILE_SETTINGS:
+            value = getattr(environment, setting)
+            # Autoescaping can be chosen by a function, whose repr differs by process
+            settings_values.append(getattr(value, "__qualname__", value))
+
+        environment_version = repr(
+            (
+                jinja2.__version__,
+                settings_values,
+                sorted(environment.extensions),
+                sorted(environment.filters),
+                sorted(environment.tests),
+            )
+        )
+        return hashlib.sha256(environment_version.encode()).hexdigest()
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            logger.warning("unable to cache compiled template", template=bucket.key)
+
+
 class AWSReverseProxied:
     def __init__(self, app):
         self.app = app
@@ -141,6 +221,7 @@ def create_app(  # noqa: C901  pylint: disable=too-complex, too-many-statements
     # request will use the logger context of the previous request.
     @application.before_request
     def before_request():  # pylint: disable=unused-variable
+        start_request_timer()
         request_id = str(uuid4())
         logger.new(request_id=request_id)
 
@@ -192,17 +273,36 @@ def create_app(  # noqa: C901  pylint: disable=too-complex, too-many-statements
     if application.config["EQ_DEV_MODE"]:
         start_dev_mode(application)
 
-    if application.config["EQ_ENABLE_CACHE"]:
-        cache.init_app(application, config={"CACHE_TYPE": "simple"})
-    else:
-        # no cache and silence warning
-        cache.init_app(application, config={"CACHE_NO_NULL_WARNING": True})
+    if application.config["EQ_PROFILING"]:
+        setup_profiler(application)
 
-    # Switch off flask default autoescaping as schema content can contain html
-    application.jinja_env.autoescape = False
+    setup_cache(application)
 
-    # pylint: disable=no-member
-    application.jinja_env.add_extension("jinja2.ext.do")
+    setup_jinja_env(application)
+
+    if application.config["EQ_WARM_UP_TEMPLATES"]:
+        warm_up_templates(application)
+
+    @application.after_request
+    def after_request(response):  # pylint: disable=unused-variable
+        # After request functions run in the reverse of the order they're added,
+        # so this is added first, to log the response once it's been minified.
+
+        # We're using the stringified version of the Flask session to get a rough
+        # length for the cookie. The real length won't be known yet as Flask
+        # serialises and adds the cookie header after this method is called.
+        logger.info(
+            "response",
+            status_code=response.status_code,
+            session_modified=cookie_session.modified,
+            **get_request_durations(flask_request.endpoint),
+        )
+        return response
+
+    @application.teardown_request
+    def discard_request_timer(_exception):  # pylint: disable=unused-variable
+        # A request that fails without a response is never logged
+        stop_request_timer()
 
     @application.after_request
     def apply_caching(response):  # pylint: disable=unused-variable
@@ -223,30 +323,19 @@ def create_app(  # noqa: C901  pylint: disable=too-complex, too-many-statements
             application.config["EQ_ENABLE_HTML_MINIFY"]
             and response.content_type == "text/html; charset=utf-8"
         ):
-            response.set_data(
-                minify(
-                    response.get_data(as_text=True),
-                    remove_comments=True,
-                    remove_empty_space=True,
-                    remove_optional_attribute_quotes=False,
+            with timing_span("minify"):
+                response.set_data(
+                    minify(
+                        response.get_data(as_text=True),
+                        remove_comments=True,
+                        remove_empty_space=True,
+                        remove_optional_attribute_quotes=False,
+                    )
                 )
-            )
 
             return response
         return response
 
-    @application.after_request
-    def after_request(response):  # pylint: disable=unused-variable
-        # We're using the stringified version of the Flask session to get a rough
-        # length for the cookie. The real length won't be known yet as Flask
-        # serialises and adds the cookie header after this method is called.
-        logger.info(
-            "response",
-            status_code=response.status_code,
-            session_modified=cookie_session.modified,
-        )
-        return response
-
     return application
 
 
@@ -334,7 +423,7 @@ def setup_submitter(application):
         if not secondary_host:
             raise Exception("Setting EQ_RABBITMQ_HOST_SECONDARY Missing")
 
-        application.eq["submitter"] = RabbitMQSubmitter(
+        rabbitmq_submitter = RabbitMQSubmitter(
             host=host,
             secondary_host=secondary_host,
             port=application.config["EQ_RABBITMQ_PORT"],
@@ -345,8 +434,14 @@ def setup_submitter(application):
             password=application.eq["secret_store"].get_secret_by_name(
                 "EQ_RABBITMQ_PASSWORD"
             ),
+            pool_size=application.config["EQ_RABBITMQ_CONNECTION_POOL_SIZE"],
         )
 
+        if application.config["EQ_SUBMISSION_OUTBOX_ENABLED"]:
+            setup_submission_outbox(application, rabbitmq_submitter)
+        else:
+            application.eq["submitter"] = rabbitmq_submitter
+
     elif application.config["EQ_SUBMISSION_BACKEND"] == "log":
         application.eq["submitter"] = LogSubmitter()
 
@@ -354,6 +449,28 @@ def setup_submitter(application):
         raise Exception("Unknown EQ_SUBMISSION_BACKEND")
 
 
+def setup_submission_outbox(application, rabbitmq_submitter):
+    outbox = FileSystemOutbox(application.config["EQ_SUBMISSION_OUTBOX_DIRECTORY"])
+
+    # The sender publishes from a single greenlet so only needs one connection
+    pool = RabbitMQConnectionPool(
+        rabbitmq_submitter.pool.urls, rabbitmq_submitter.queue, size=1
+    )
+
+    sender = OutboxSender(
+        outbox,
+        pool,
+        batch_size=application.config["EQ_SUBMISSION_OUTBOX_BATCH_SIZE"],
+        poll_interval=application.config["EQ_SUBMISSION_OUTBOX_POLL_INTERVAL_SECONDS"],
+    )
+    # Started by each worker rather than here, as the app may be created before
+    # the workers are forked
+    application.before_request(sender.ensure_started)
+
+    application.eq["submitter"] = OutboxSubmitter(outbox)
+    application.eq["submission_outbox_sender"] = sender
+
+
 def start_dev_mode(application):
     if application.config["EQ_ENABLE_FLASK_DEBUG_TOOLBAR"]:
         application.config["DEBUG_TB_PROFILER_ENABLED"] = True
@@ -398,15 +515,17 @@ def add_blueprints(application):
     application.register_blueprint(dump_blueprint)
     dump_blueprint.config = application.config.copy()
 
+    if application.config["EQ_ENABLE_METRICS_ENDPOINT"]:
+        from app.routes.metrics import metrics_blueprint
+
+        application.register_blueprint(metrics_blueprint)
+        metrics_blueprint.config = application.config.copy()
+
     from app.routes.errors import errors_blueprint
 
     application.register_blueprint(errors_blueprint)
     errors_blueprint.config = application.config.copy()
 
-    from app.jinja_filters import blueprint as filter_blueprint
-
-    application.register_blueprint(filter_blueprint)
-
     from app.routes.static import static_blueprint
 
     application.register_blueprint(static_blueprint)
@@ -418,6 +537,61 @@ def add_blueprints(application):
     schema_blueprint.config = application.config.copy()
 
 
+def setup_cache(application):
+    """ Set up the caches, which also adds the cache extension to templates. """
+    if application.config["EQ_ENABLE_CACHE"]:
+        cache.init_app(application, config={"CACHE_TYPE": "simple"})
+        # Hub pages are kept apart, so that they can't push schemas out
+        hub_cache.init_app(
+            application,
+            config={
+                "CACHE_TYPE": "simple",
+                "CACHE_THRESHOLD": application.config["EQ_HUB_CACHE_THRESHOLD"],
+            },
+        )
+    else:
+        # no cache and silence warning
+        cache.init_app(application, config={"CACHE_NO_NULL_WARNING": True})
+        hub_cache.init_app(application, config={"CACHE_NO_NULL_WARNING": True})
+
+
+def setup_jinja_env(application):
+    """
+    Configure how templates are compiled. Compiled templates can be cached by the
+    image build, so this is shared with `scripts.precompile_templates`. They are
+    cached for the environment they were compiled in, so a template compiled by
+    the build is only used if the environment is set up the same way, including
+    the extensions added by `setup_babel` and `setup_cache`.
+    """
+    # Switch off flask default autoescaping as schema content can contain html
+    application.jinja_env.autoescape = False
+
+    # pylint: disable=no-member
+    application.jinja_env.add_extension("jinja2.ext.do")
+
+    from app.jinja_filters import blueprint as filter_blueprint
+
+    application.register_blueprint(filter_blueprint)
+
+    if application.config["EQ_JINJA_BYTECODE_CACHE_DIR"]:
+        application.jinja_env.bytecode_cache = TemplateBytecodeCache(
+            application.config["EQ_JINJA_BYTECODE_CACHE_DIR"]
+        )
+
+
+def warm_up_templates(application):
+    """ Load every template, so no request has to wait for one to be compiled. """
+    template_names = application.jinja_env.list_templates()
+
+    for template_name in template_names:
+        try:
+            application.jinja_env.get_template(template_name)
+        except TemplateSyntaxError:
+            logger.exception("unable to compile template", template=template_name)
+
+    logger.info("templates loaded", count=len(template_names))
+
+
 def setup_secure_cookies(application):
     application.secret_key = application.eq["secret_store"].get_secret_by_name(
         "EQ_SECRET_KEY"
@@ -4,9 +4,13 @@ from google.cloud import datastore
 from structlog import get_logger
 
 from app.data_model import app_models
+from app.instrumentation import timed
 
 logger = get_logger()
 
+# Datastore limits the number of keys in a single lookup or commit
+MAX_BATCH_SIZE = 500
+
 TABLE_CONFIG = {
     app_models.SubmittedResponse: {
         "key_field": "tx_id",
@@ -35,6 +39,7 @@ class DatastoreStorage:
     def __init__(self, client):
         self.client = client
 
+    @timed("storage")
     @Retry()
     def put(self, model, overwrite=True):
         if not overwrite:
@@ -53,6 +58,7 @@ class DatastoreStorage:
         entity.update(item)
         self.client.put(entity)
 
+    @timed("storage")
     @Retry()
     def get_by_key(self, model_type, key_value):
         config = TABLE_CONFIG[model_type]
@@ -66,6 +72,42 @@ class DatastoreStorage:
         if item:
             return schema.load(item)
 
+    @timed("storage")
+    @Retry()
+    def get_by_keys(self, model_type, key_values):
+        """
+        Fetch several items in a single round trip.
+        :return: a dict of key value to model for the items that were found
+        """
+        config = TABLE_CONFIG[model_type]
+        table_name = current_app.config[config["table_name_key"]]
+        keys = [self.client.key(table_name, key_value) for key_value in key_values]
+
+        schema = config["schema"]()
+
+        models = {}
+        for start in range(0, len(keys), MAX_BATCH_SIZE):
+            for item in self.client.get_multi(keys[start : start + MAX_BATCH_SIZE]):
+                model = schema.load(item)
+                models[getattr(model, config["key_field"])] = model
+
+        return models
+
+    @timed("storage")
+    @Retry()
+    def delete_many(self, models):
+        keys = []
+        for model in models:
+            config = TABLE_CONFIG[type(model)]
+            table_name = current_app.config[config["table_name_key"]]
+            keys.append(
+                self.client.key(table_name, getattr(model, config["key_field"]))
+            )
+
+        for start in range(0, len(keys), MAX_BATCH_SIZE):
+            self.client.delete_multi(keys[start : start + MAX_BATCH_SIZE])
+
+    @timed("storage")
     @Retry()
     def delete(self, model):
         config = TABLE_CONFIG[type(model)]
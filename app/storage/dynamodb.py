@@ -1,9 +1,14 @@
+from collections import defaultdict
+
 from botocore.exceptions import ClientError
 from flask import current_app
 
 from app.data_model import app_models
+from app.instrumentation import timed
 from app.storage.errors import ItemAlreadyExistsError
 
+# DynamoDB limits the number of keys in a single BatchGetItem request
+MAX_BATCH_GET_SIZE = 100
 
 TABLE_CONFIG = {
     app_models.SubmittedResponse: {
@@ -33,6 +38,7 @@ class DynamodbStorage:
     def __init__(self, dynamodb):
         self.dynamodb = dynamodb
 
+    @timed("storage")
     def put(self, model, overwrite=True):
         config = TABLE_CONFIG[type(model)]
         schema = config["schema"]()
@@ -57,6 +63,7 @@ class DynamodbStorage:
 
             raise  # pragma: no cover
 
+    @timed("storage")
     def get_by_key(self, model_type, key_value):
         config = TABLE_CONFIG[model_type]
         schema = config["schema"]()
@@ -69,6 +76,49 @@ class DynamodbStorage:
         if item:
             return schema.load(item)
 
+    @timed("storage")
+    def get_by_keys(self, model_type, key_values):
+        """
+        Fetch several items using BatchGetItem.
+        :return: a dict of key value to model for the items that were found
+        """
+        config = TABLE_CONFIG[model_type]
+        schema = config["schema"]()
+        table_name = current_app.config[config["table_name_key"]]
+        key_field = config["key_field"]
+        keys = [{key_field: key_value} for key_value in key_values]
+
+        models = {}
+        for start in range(0, len(keys), MAX_BATCH_GET_SIZE):
+            request_items = {
+                table_name: {
+                    "Keys": keys[start : start + MAX_BATCH_GET_SIZE],
+                    "ConsistentRead": True,
+                }
+            }
+            while request_items:
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response["Responses"].get(table_name, []):
+                    models[item[key_field]] = schema.load(item)
+                request_items = response.get("UnprocessedKeys")
+
+        return models
+
+    @timed("storage")
+    def delete_many(self, models):
+        models_by_type = defaultdict(list)
+        for model in models:
+            models_by_type[type(model)].append(model)
+
+        for model_type, typed_models in models_by_type.items():
+            config = TABLE_CONFIG[model_type]
+            key_field = config["key_field"]
+            # The batch writer sends BatchWriteItem requests of up to 25 deletes
+            with self.get_table(config).batch_writer() as batch:
+                for model in typed_models:
+                    batch.delete_item(Key={key_field: getattr(model, key_field)})
+
+    @timed("storage")
     def delete(self, model):
         config = TABLE_CONFIG[type(model)]
         table = self.get_table(config)
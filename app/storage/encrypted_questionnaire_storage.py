@@ -4,19 +4,26 @@ from structlog import get_logger
 
 from app.data_model.app_models import QuestionnaireState
 from app.data_model.questionnaire_store import QuestionnaireStore
+from app.instrumentation import timed
 from app.storage.storage_encryption import StorageEncryption
 
 logger = get_logger()
 
 
 class EncryptedQuestionnaireStorage:
-    def __init__(self, user_id, user_ik, pepper):
+    def __init__(self, user_id, user_ik, pepper, questionnaire_state=None):
+        """
+        :param questionnaire_state: an already fetched `QuestionnaireState` for the
+        user, such as one from a batched read, to avoid fetching it again
+        """
         if user_id is None:
             raise ValueError("User id must be set")
 
         self._user_id = user_id
+        self._questionnaire_state = questionnaire_state
         self.encrypter = StorageEncryption(user_id, user_ik, pepper)
 
+    @timed("state_save")
     def save(self, data):
         compressed_data = snappy.compress(data)
         encrypted_data = self.encrypter.encrypt_data(compressed_data)
@@ -26,6 +33,7 @@ class EncryptedQuestionnaireStorage:
 
         current_app.eq["storage"].put(questionnaire_state)
 
+    @timed("state_load")
     def get_user_data(self):
         questionnaire_state = self._find_questionnaire_state()
         if questionnaire_state and questionnaire_state.state_data:
@@ -44,6 +52,9 @@ class EncryptedQuestionnaireStorage:
             current_app.eq["storage"].delete(questionnaire_state)
 
     def _find_questionnaire_state(self):
+        if self._questionnaire_state:
+            return self._questionnaire_state
+
         logger.debug("getting questionnaire data", user_id=self._user_id)
         return current_app.eq["storage"].get_by_key(QuestionnaireState, self._user_id)
 
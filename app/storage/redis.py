@@ -1,3 +1,4 @@
+from app.instrumentation import timed
 from app.storage.errors import ItemAlreadyExistsError
 
 
@@ -5,6 +6,7 @@ class RedisStorage:
     def __init__(self, redis):
         self.redis = redis
 
+    @timed("storage")
     def put_jti(self, jti):
         record_created = self.redis.set(
             name=jti.jti_claim,
@@ -5,6 +5,7 @@ from jwcrypto import jwe, jwk
 from jwcrypto.common import base64url_encode
 from structlog import get_logger
 
+from app.instrumentation import timed
 from app.utilities.strings import to_bytes, to_str
 
 logger = get_logger()
@@ -35,6 +36,7 @@ class StorageEncryption:
 
         return jwk.JWK(**password)
 
+    @timed("encrypt")
     def encrypt_data(self, data):
         if isinstance(data, dict):
             data = json.dumps(data, for_json=True)
@@ -47,6 +49,7 @@ class StorageEncryption:
 
         return jwe_token.serialize(compact=True)
 
+    @timed("decrypt")
     def decrypt_data(self, encrypted_token):
         jwe_token = jwe.JWE(algs=["dir", "A256GCM"])
         jwe_token.deserialize(encrypted_token, self.key)
@@ -0,0 +1,188 @@
+import time
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from threading import BoundedSemaphore, Lock
+
+from pika import BlockingConnection
+from pika import URLParameters
+from pika.exceptions import AMQPConnectionError, AMQPError
+from structlog import get_logger
+
+logger = get_logger()
+
+SERVER_NAMES = ("primary", "secondary")
+
+
+class ConnectionPoolExhaustedError(AMQPConnectionError):
+    pass
+
+
+class PooledChannel:
+    def __init__(self, connection, channel, server):
+        self.connection = connection
+        self.channel = channel
+        self.server = server
+
+    def is_healthy(self):
+        """
+        Service any pending heartbeats and close frames so a connection the broker
+        has dropped while idle is detected before it is handed out.
+        """
+        try:
+            if not (self.connection.is_open and self.channel.is_open):
+                return False
+            self.connection.process_data_events(time_limit=0)
+            return self.channel.is_open
+        except AMQPError:
+            return False
+
+    def close(self):
+        try:
+            if self.connection.is_open:
+                logger.info("attempt to close connection", category="rabbitmq")
+                self.connection.close()
+        except AMQPError as e:
+            logger.error("unable to close connection", exc_info=e, category="rabbitmq")
+
+
+class RabbitMQConnectionPool:
+    """
+    A per-worker pool of long lived RabbitMQ connections, each with a single
+    channel in publisher confirm mode.
+
+    A channel is checked out exclusively for the duration of the `channel()`
+    context, as a BlockingConnection must not be used by two greenlets at once.
+    The pool only uses `threading` and `queue` primitives so it cooperates with
+    gevent when the gunicorn gevent worker has monkey patched them.
+
+    New connections are tried against each url in order, so the secondary is
+    only used when the primary is unavailable. When every url fails further
+    attempts are refused until an exponentially increasing backoff has passed.
+    """
+
+    def __init__(
+        self,
+        urls,
+        queue,
+        size=5,
+        checkout_timeout=10.0,
+        initial_backoff=0.5,
+        max_backoff=30.0,
+    ):
+        self.urls = list(urls)
+        self.queue = queue
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self._idle = LifoQueue()
+        self._slots = BoundedSemaphore(size)
+        self._declared_urls = set()
+        self._backoff_lock = Lock()
+        self._backoff = 0
+        self._next_attempt_at = 0
+
+    @contextmanager
+    def channel(self):
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise ConnectionPoolExhaustedError(
+                "no rabbitmq channel available within {} seconds".format(
+                    self.checkout_timeout
+                )
+            )
+
+        pooled = None
+        try:
+            pooled = self._checkout()
+            yield pooled.channel
+        except Exception:
+            if pooled:
+                pooled.close()
+                pooled = None
+            raise
+        finally:
+            if pooled:
+                self._idle.put(pooled)
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
+
+    def _checkout(self):
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except Empty:
+                return self._connect()
+
+            if pooled.is_healthy():
+                return pooled
+
+            logger.info(
+                "discarding unhealthy connection",
+                server=pooled.server,
+                category="rabbitmq",
+            )
+            pooled.close()
+
+    def _connect(self):
+        self._check_backoff()
+
+        error = None
+        for url, server in zip(self.urls, SERVER_NAMES):
+            try:
+                logger.info(
+                    "attempt to open connection", server=server, category="rabbitmq"
+                )
+                connection = BlockingConnection(URLParameters(url))
+            except AMQPError as e:
+                logger.error(
+                    "unable to open connection",
+                    exc_info=e,
+                    server=server,
+                    category="rabbitmq",
+                )
+                error = e
+                continue
+
+            try:
+                channel = connection.channel()
+                channel.confirm_delivery()
+                if url not in self._declared_urls:
+                    channel.queue_declare(queue=self.queue, durable=True)
+                    self._declared_urls.add(url)
+            except AMQPError as e:
+                PooledChannel(connection, None, server).close()
+                error = e
+                continue
+
+            self._reset_backoff()
+            return PooledChannel(connection, channel, server)
+
+        self._increase_backoff()
+        raise error
+
+    def _check_backoff(self):
+        with self._backoff_lock:
+            remaining = self._next_attempt_at - time.monotonic()
+        if remaining > 0:
+            raise AMQPConnectionError(
+                "not reconnecting for another {:.1f} seconds".format(remaining)
+            )
+
+    def _increase_backoff(self):
+        with self._backoff_lock:
+            self._backoff = min(
+                max(self._backoff * 2, self.initial_backoff), self.max_backoff
+            )
+            self._next_attempt_at = time.monotonic() + self._backoff
+
+    def _reset_backoff(self):
+        with self._backoff_lock:
+            self._backoff = 0
+            self._next_attempt_at = 0
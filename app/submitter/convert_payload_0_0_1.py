@@ -5,7 +5,6 @@ from app.questionnaire.location import Location
 from app.questionnaire.schema_utils import choose_question_to_display
 
 
-# pylint: disable=too-many-locals
 def convert_answers_to_payload_0_0_1(
     metadata, answer_store, list_store, schema, routing_path
 ):
@@ -21,7 +20,26 @@ def convert_answers_to_payload_0_0_1(
     :param routing_path: the path followed in the questionnaire
     :return: data in a formatted form
     """
-    data = OrderedDict()
+    return OrderedDict(
+        iter_answers_for_payload_0_0_1(
+            metadata, answer_store, list_store, schema, routing_path
+        )
+    )
+
+
+# pylint: disable=too-many-locals
+def iter_answers_for_payload_0_0_1(
+    metadata, answer_store, list_store, schema, routing_path
+):
+    """
+    Yield the `(q_code, value)` pairs for `convert_answers_to_payload_0_0_1` in
+    routing path order. A q_code can be yielded more than once, the last value wins.
+
+    The question variant to display is chosen once per block and list item, and
+    its answers mapped by id, rather than evaluated again for every answer.
+    """
+    answer_schemas_by_block = {}
+
     for block_id in routing_path:
         answer_ids = schema.get_answer_ids_for_block(block_id)
         answers_in_block = answer_store.get_answers_by_answer_id(
@@ -29,42 +47,44 @@ def convert_answers_to_payload_0_0_1(
         )
 
         for answer_in_block in answers_in_block:
-            answer_schema = None
-
             block = schema.get_block_for_answer_id(answer_in_block.answer_id)
-            current_location = Location(
-                block_id=block_id,
-                section_id=routing_path.section_id,
-                list_item_id=routing_path.list_item_id,
+            cache_key = (block["id"], routing_path.list_item_id)
+
+            if cache_key not in answer_schemas_by_block:
+                current_location = Location(
+                    block_id=block_id,
+                    section_id=routing_path.section_id,
+                    list_item_id=routing_path.list_item_id,
+                )
+                question = choose_question_to_display(
+                    block,
+                    schema,
+                    metadata,
+                    answer_store,
+                    list_store,
+                    current_location=current_location,
+                )
+                answer_schemas_by_block[cache_key] = {
+                    answer["id"]: answer for answer in question["answers"]
+                }
+
+            answer_schema = answer_schemas_by_block[cache_key].get(
+                answer_in_block.answer_id
             )
-            question = choose_question_to_display(
-                block,
-                schema,
-                metadata,
-                answer_store,
-                list_store,
-                current_location=current_location,
-            )
-            for answer in question["answers"]:
-                if answer["id"] == answer_in_block.answer_id:
-                    answer_schema = answer
-
             value = answer_in_block.value
 
             if answer_schema is not None and value is not None:
                 if answer_schema["type"] == "Checkbox":
-                    data.update(
-                        _get_checkbox_answer_data(answer_store, answer_schema, value)
-                    )
+                    yield from _get_checkbox_answer_data(
+                        answer_store, answer_schema, value
+                    ).items()
                 elif "q_code" in answer_schema:
                     answer_data = _encode_value(value)
                     if answer_data is not None:
-                        data[answer_schema["q_code"]] = _format_downstream_answer(
+                        yield answer_schema["q_code"], _format_downstream_answer(
                             answer_schema["type"], answer_in_block.value, answer_data
                         )
 
-    return data
-
 
 def _format_downstream_answer(answer_type, answer_value, answer_data):
     if answer_type == "Date":
@@ -1,11 +1,12 @@
-from typing import List, Dict
+from itertools import chain
+from typing import Iterator, List, Optional, Set, Tuple
 
-from app.data_model.answer_store import AnswerStore
+from app.data_model.answer import Answer
 
 
 def convert_answers_to_payload_0_0_3(
     answer_store, list_store, schema, full_routing_path
-) -> List[Dict]:
+) -> List[Answer]:
     """
     Convert answers into the data format below
     'data': [
@@ -30,31 +31,49 @@ def convert_answers_to_payload_0_0_3(
     the same answer_ids, and will not be duplicated.
 
     Returns:
-        A list of answer dictionaries.
+        A list of answers, which serialise to the dictionaries above.
     """
-    answers_payload = AnswerStore()
+    return list(
+        iter_answers_for_payload_0_0_3(
+            answer_store, list_store, schema, full_routing_path
+        )
+    )
+
+
+def iter_answers_for_payload_0_0_3(
+    answer_store, list_store, schema, full_routing_path
+) -> Iterator[Answer]:
+    """
+    Yield the answers for `convert_answers_to_payload_0_0_3` in the same order,
+    as they are found along the routing path.
+
+    Only the keys of answers already yielded are kept, so the payload can be
+    serialised without holding a second copy of the answers.
+    """
+    yielded_keys: Set[Tuple[str, Optional[str]]] = set()
 
     for routing_path in full_routing_path:
         for block_id in routing_path:
-            add_list_collector_answers(
-                answer_store, list_store, schema, block_id, answers_payload
-            )
-
-            answer_ids = schema.get_answer_ids_for_block(block_id)
-            answers_in_block = answer_store.get_answers_by_answer_id(
-                answer_ids, list_item_id=routing_path.list_item_id
+            answers_in_block = chain(
+                iter_list_collector_answers(answer_store, list_store, schema, block_id),
+                answer_store.get_answers_by_answer_id(
+                    schema.get_answer_ids_for_block(block_id),
+                    list_item_id=routing_path.list_item_id,
+                ),
             )
-            for answer_in_block in answers_in_block:
-                answers_payload.add_or_update(answer_in_block)
 
-    return list(answers_payload.answer_map.values())
+            for answer in answers_in_block:
+                key = (answer.answer_id, answer.list_item_id)
+                if key not in yielded_keys:
+                    yielded_keys.add(key)
+                    yield answer
 
 
-def add_list_collector_answers(
-    answer_store, list_store, schema, block_id, answers_payload
-):
-    """ Add answers from list_collector for a specific block_id.
-    Output is added to the `answers_payload` argument."""
+def iter_list_collector_answers(
+    answer_store, list_store, schema, block_id
+) -> Iterator[Answer]:
+    """ Yield the answers from the add block of a list collector for each of
+    the items in its list. Yields nothing for any other type of block."""
 
     list_collector_block = schema.get_block(block_id)
     block_type = list_collector_block["type"]
@@ -72,4 +91,4 @@ def add_list_collector_answers(
             for answer_id in answers_ids_in_add_block:
                 answer = answer_store.get_answer(answer_id, list_item_id)
                 if answer:
-                    answers_payload.add_or_update(answer)
+                    yield answer
@@ -1,10 +1,21 @@
 from datetime import datetime
+from itertools import islice
+
+import simplejson as json
 from structlog import get_logger
+
 from app.submitter.convert_payload_0_0_1 import convert_answers_to_payload_0_0_1
-from app.submitter.convert_payload_0_0_3 import convert_answers_to_payload_0_0_3
+from app.submitter.convert_payload_0_0_3 import (
+    convert_answers_to_payload_0_0_3,
+    iter_answers_for_payload_0_0_3,
+)
 
 logger = get_logger()
 
+ANSWERS_PER_JSON_CHUNK = 100
+
+_answer_encoder = json.JSONEncoder(for_json=True)
+
 
 class DataVersionError(Exception):
     def __init__(self, version):
@@ -54,22 +65,91 @@ def convert_answers(schema, questionnaire_store, routing_path, flushed=False):
     Returns:
         Data payload
     """
-    metadata = questionnaire_store.metadata
-    collection_metadata = questionnaire_store.collection_metadata
+    payload = _build_payload(schema, questionnaire_store, flushed)
     answer_store = questionnaire_store.answer_store
     list_store = questionnaire_store.list_store
 
-    survey_id = schema.json["survey_id"]
-    submitted_at = datetime.utcnow()
+    if schema.json["data_version"] == "0.0.3":
+        payload["data"] = {
+            "answers": convert_answers_to_payload_0_0_3(
+                answer_store, list_store, schema, routing_path
+            ),
+            "lists": list_store.serialise(),
+        }
+    elif schema.json["data_version"] == "0.0.1":
+        payload["data"] = convert_answers_to_payload_0_0_1(
+            questionnaire_store.metadata, answer_store, list_store, schema, routing_path
+        )
+    else:
+        raise DataVersionError(schema.json["data_version"])
+
+    logger.info("converted answer ready for submission")
+    return payload
+
+
+def convert_answers_to_json(schema, questionnaire_store, routing_path, flushed=False):
+    """
+    Serialise the payload `convert_answers` would return to the same JSON string,
+    without building the payload for the whole questionnaire first.
+
+    0.0.3 answers are taken from the routing path and encoded a chunk at a time,
+    so only the encoded message, rather than every answer's dict and the
+    encoder's intermediate strings for all of them, is held in memory. 0.0.1 data
+    is keyed by q_code, where a later answer replaces an earlier one, so it is
+    still collected into a dict before it is encoded.
+    """
+    if schema.json["data_version"] != "0.0.3":
+        return json.dumps(
+            convert_answers(schema, questionnaire_store, routing_path, flushed),
+            for_json=True,
+        )
+
+    message = "".join(
+        _iter_json_0_0_3(schema, questionnaire_store, routing_path, flushed)
+    )
+
+    logger.info("converted answer ready for submission")
+    return message
+
+
+def _iter_json_0_0_3(schema, questionnaire_store, routing_path, flushed):
+    payload = _build_payload(schema, questionnaire_store, flushed)
+    answers = iter_answers_for_payload_0_0_3(
+        questionnaire_store.answer_store,
+        questionnaire_store.list_store,
+        schema,
+        routing_path,
+    )
+
+    yield json.dumps(payload, for_json=True)[:-1]
+    yield ', "data": {"answers": ['
+
+    separator = ""
+    while True:
+        chunk = list(islice(answers, ANSWERS_PER_JSON_CHUNK))
+        if not chunk:
+            break
+        yield separator
+        yield _answer_encoder.encode(chunk)[1:-1]
+        separator = ", "
+
+    yield '], "lists": '
+    yield json.dumps(questionnaire_store.list_store.serialise())
+    yield "}}"
+
+
+def _build_payload(schema, questionnaire_store, flushed):
+    metadata = questionnaire_store.metadata
+    collection_metadata = questionnaire_store.collection_metadata
 
     payload = {
         "tx_id": metadata["tx_id"],
         "type": "uk.gov.ons.edc.eq:surveyresponse",
         "version": schema.json["data_version"],
         "origin": "uk.gov.ons.edc.eq",
-        "survey_id": survey_id,
+        "survey_id": schema.json["survey_id"],
         "flushed": flushed,
-        "submitted_at": submitted_at.isoformat(),
+        "submitted_at": datetime.utcnow().isoformat(),
         "collection": _build_collection(metadata),
         "metadata": _build_metadata(metadata),
         "response_id": metadata["response_id"],
@@ -91,21 +171,6 @@ def convert_answers(schema, questionnaire_store, routing_path, flushed=False):
     if metadata.get("case_ref"):
         payload["case_ref"] = metadata["case_ref"]
 
-    if schema.json["data_version"] == "0.0.3":
-        payload["data"] = {
-            "answers": convert_answers_to_payload_0_0_3(
-                answer_store, list_store, schema, routing_path
-            ),
-            "lists": list_store.serialise(),
-        }
-    elif schema.json["data_version"] == "0.0.1":
-        payload["data"] = convert_answers_to_payload_0_0_1(
-            metadata, answer_store, list_store, schema, routing_path
-        )
-    else:
-        raise DataVersionError(schema.json["data_version"])
-
-    logger.info("converted answer ready for submission")
     return payload
 
 
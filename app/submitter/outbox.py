@@ -0,0 +1,328 @@
+import json
+import os
+import threading
+import time
+from uuid import uuid4
+
+from pika import BasicProperties
+from pika.exceptions import AMQPError
+from structlog import get_logger
+
+logger = get_logger()
+
+PENDING_DIRECTORY = "pending"
+INFLIGHT_DIRECTORY = "inflight"
+FAILED_DIRECTORY = "failed"
+RECORD_SUFFIX = ".json"
+
+
+class OutboxEntry:
+    def __init__(self, path, message, headers):
+        self.path = path
+        self.message = message
+        self.headers = headers
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+
+class FileSystemOutbox:
+    """
+    A durable, at-least-once queue of encrypted submissions held on local disk.
+
+    Records are written to a temporary file, fsynced and renamed into the
+    `pending` directory so a record is either fully present or absent. A sender
+    claims records by renaming them into `inflight/<pid>/`, which lets several
+    workers share one outbox directory without publishing the same record twice.
+    Records claimed by a process that is no longer running are returned to
+    `pending` by `recover`. Records that can't be read are moved to `failed`,
+    so one bad record can't stop the rest being sent.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.pending_directory = os.path.join(directory, PENDING_DIRECTORY)
+        self.inflight_directory = os.path.join(directory, INFLIGHT_DIRECTORY)
+        self.failed_directory = os.path.join(directory, FAILED_DIRECTORY)
+
+        os.makedirs(self.pending_directory, exist_ok=True)
+        os.makedirs(self.inflight_directory, exist_ok=True)
+
+    @property
+    def claim_directory(self):
+        # Found from the current process, as workers forked after the outbox was
+        # created each claim records for themselves
+        return os.path.join(self.inflight_directory, str(os.getpid()))
+
+    def put(self, message, tx_id, questionnaire_id, case_id=None):
+        headers = {"tx_id": tx_id, "questionnaire_id": questionnaire_id}
+        if case_id:
+            headers["case_id"] = case_id
+
+        # Zero padded nanosecond prefix keeps a directory listing in enqueue order
+        name = f"{time.time_ns():020d}-{uuid4().hex}{RECORD_SUFFIX}"
+        temporary_path = os.path.join(self.directory, f".{name}.tmp")
+
+        with open(temporary_path, "w") as record_file:
+            json.dump({"message": str(message), "headers": headers}, record_file)
+            record_file.flush()
+            os.fsync(record_file.fileno())
+
+        os.rename(temporary_path, os.path.join(self.pending_directory, name))
+        self._fsync_directory(self.pending_directory)
+
+    def claim(self, limit):
+        """
+        Claim up to `limit` of the oldest pending records for this process.
+        Records claimed by a previous drain of this process that were not
+        acknowledged are returned first.
+        """
+        claim_directory = self.claim_directory
+        os.makedirs(claim_directory, exist_ok=True)
+        entries = self._read_entries(claim_directory, limit)
+
+        for name in sorted(os.listdir(self.pending_directory)):
+            if len(entries) >= limit:
+                break
+            if not name.endswith(RECORD_SUFFIX):
+                continue
+
+            claimed_path = os.path.join(claim_directory, name)
+            try:
+                os.rename(os.path.join(self.pending_directory, name), claimed_path)
+            except FileNotFoundError:
+                # Claimed by another worker
+                continue
+
+            entry = self._read_entry(claimed_path)
+            if entry:
+                entries.append(entry)
+
+        return entries
+
+    @staticmethod
+    def acknowledge(entries):
+        for entry in entries:
+            os.remove(entry.path)
+
+    def recover(self):
+        """
+        Return records claimed by processes that are no longer running to the
+        pending directory.
+        """
+        recovered = 0
+        for pid in os.listdir(self.inflight_directory):
+            claim_directory = os.path.join(self.inflight_directory, pid)
+            if claim_directory == self.claim_directory or _is_process_running(pid):
+                continue
+
+            for name in os.listdir(claim_directory):
+                os.rename(
+                    os.path.join(claim_directory, name),
+                    os.path.join(self.pending_directory, name),
+                )
+                recovered += 1
+            os.rmdir(claim_directory)
+
+        if recovered:
+            logger.info("recovered outbox records", count=recovered, category="outbox")
+
+        return recovered
+
+    def __len__(self):
+        return len(
+            [
+                name
+                for name in os.listdir(self.pending_directory)
+                if name.endswith(RECORD_SUFFIX)
+            ]
+        )
+
+    def _read_entries(self, directory, limit):
+        entries = (
+            self._read_entry(os.path.join(directory, name))
+            for name in sorted(os.listdir(directory))[:limit]
+        )
+        return [entry for entry in entries if entry]
+
+    def _read_entry(self, path):
+        try:
+            with open(path) as record_file:
+                record = json.load(record_file)
+            return OutboxEntry(path, record["message"], record["headers"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(
+                "unable to read outbox record",
+                exc_info=e,
+                record=os.path.basename(path),
+                category="outbox",
+            )
+
+        os.makedirs(self.failed_directory, exist_ok=True)
+        os.rename(path, os.path.join(self.failed_directory, os.path.basename(path)))
+        return None
+
+    @staticmethod
+    def _fsync_directory(directory):
+        directory_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+
+def _is_process_running(pid):
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except ValueError:
+        return False
+    return True
+
+
+class OutboxSubmitter:
+    """
+    Submitter that durably records the encrypted submission in the outbox and
+    returns without contacting RabbitMQ. Publishing is done by `OutboxSender`.
+    """
+
+    def __init__(self, outbox):
+        self.outbox = outbox
+
+    def send_message(self, message, tx_id, questionnaire_id, case_id=None):
+        logger.info("queueing message", category="outbox")
+        try:
+            self.outbox.put(message, tx_id, questionnaire_id, case_id)
+        except OSError as e:
+            logger.error("unable to queue message", exc_info=e, category="outbox")
+            return False
+
+        logger.info("queued message", category="outbox")
+        return True
+
+
+class OutboxSender:
+    """
+    Drains the outbox to RabbitMQ from a background thread, which is a greenlet
+    when running under the gunicorn gevent worker.
+
+    Records are published over a channel from a `RabbitMQConnectionPool`, which
+    keeps the connection open between drains, fails over to the secondary host
+    and uses publisher confirms, so a record is only removed from the outbox
+    once the broker has taken responsibility for it.
+
+    The thread is started by `ensure_started` in each process that handles a
+    request, so every worker has its own sender even when the app was created
+    before the workers were forked, and scripts that create the app don't
+    start one.
+    """
+
+    def __init__(
+        self, outbox, pool, batch_size=50, poll_interval=1.0, max_backoff=30.0
+    ):
+        self.outbox = outbox
+        self.pool = pool
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+
+        self._stopped = threading.Event()
+        self._thread = None
+        self._started_pid = None
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self):
+        """ Start the sender in this process, if it hasn't been already. """
+        if self._started_pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._started_pid != os.getpid():
+                self._started_pid = os.getpid()
+                self.start()
+
+    def start(self):
+        self.outbox.recover()
+        self._thread = threading.Thread(
+            target=self._run, name="submission-outbox-sender", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.pool.close()
+
+    def drain(self):
+        """
+        Publish outbox records until the outbox is empty.
+        :return: the number of records published
+        """
+        published = 0
+        while not self._stopped.is_set():
+            entries = self.outbox.claim(self.batch_size)
+            if not entries:
+                break
+
+            confirmed = self._publish_batch(entries)
+            self.outbox.acknowledge(confirmed)
+            published += len(confirmed)
+
+            if len(confirmed) < len(entries):
+                break
+
+        return published
+
+    def _run(self):
+        backoff = self.poll_interval
+        while not self._stopped.is_set():
+            # Any error is retried after a backoff, as the thread stopping would
+            # leave records queued without anything to send them
+            try:
+                published = self.drain()
+                caught_up = published or not self.outbox
+            except Exception as e:  # pylint:disable=broad-except
+                logger.error("unable to drain outbox", exc_info=e, category="outbox")
+                caught_up = False
+
+            if caught_up:
+                backoff = self.poll_interval
+            else:
+                backoff = min(backoff * 2, self.max_backoff)
+
+            self._stopped.wait(backoff)
+
+    def _publish_batch(self, entries):
+        confirmed = []
+        try:
+            with self.pool.channel() as channel:
+                for entry in entries:
+                    channel.basic_publish(
+                        exchange="",
+                        routing_key=self.pool.queue,
+                        body=entry.message,
+                        mandatory=True,
+                        properties=BasicProperties(
+                            headers=dict(entry.headers), delivery_mode=2
+                        ),
+                    )
+                    confirmed.append(entry)
+        except AMQPError as e:
+            logger.error(
+                "unable to publish outbox batch",
+                exc_info=e,
+                published=len(confirmed),
+                remaining=len(entries) - len(confirmed),
+                category="outbox",
+            )
+
+        if confirmed:
+            logger.info(
+                "published outbox batch", count=len(confirmed), category="outbox"
+            )
+        return confirmed
@@ -1,10 +1,10 @@
 from google.cloud import storage
 from pika import BasicProperties
-from pika import BlockingConnection
-from pika import URLParameters
 from pika.exceptions import AMQPError
 from structlog import get_logger
 
+from app.submitter.connection_pool import RabbitMQConnectionPool
+
 logger = get_logger()
 
 
@@ -44,7 +44,16 @@ class GCSSubmitter:
 
 
 class RabbitMQSubmitter:
-    def __init__(self, host, secondary_host, port, queue, username=None, password=None):
+    def __init__(
+        self,
+        host,
+        secondary_host,
+        port,
+        queue,
+        username=None,
+        password=None,
+        pool_size=5,
+    ):
         self.queue = queue
         if username and password:
             self.rabbitmq_url = "amqp://{username}:{password}@{host}:{port}/%2F".format(
@@ -59,43 +68,9 @@ class RabbitMQSubmitter:
                 host=secondary_host, port=port
             )
 
-    def _connect(self):
-        try:
-            logger.info(
-                "attempt to open connection", server="primary", category="rabbitmq"
-            )
-            return BlockingConnection(URLParameters(self.rabbitmq_url))
-        except AMQPError as e:
-            logger.error(
-                "unable to open connection",
-                exc_info=e,
-                server="primary",
-                category="rabbitmq",
-            )
-            try:
-                logger.info(
-                    "attempt to open connection",
-                    server="secondary",
-                    category="rabbitmq",
-                )
-                return BlockingConnection(URLParameters(self.rabbitmq_secondary_url))
-            except AMQPError as err:
-                logger.error(
-                    "unable to open connection",
-                    exc_info=e,
-                    server="secondary",
-                    category="rabbitmq",
-                )
-                raise err
-
-    @staticmethod
-    def _disconnect(connection):
-        try:
-            if connection:
-                logger.info("attempt to close connection", category="rabbitmq")
-                connection.close()
-        except AMQPError as e:
-            logger.error("unable to close connection", exc_info=e, category="rabbitmq")
+        self.pool = RabbitMQConnectionPool(
+            [self.rabbitmq_url, self.rabbitmq_secondary_url], queue, size=pool_size
+        )
 
     def send_message(self, message, tx_id, questionnaire_id, case_id=None):
         """
@@ -109,35 +84,29 @@ class RabbitMQSubmitter:
         message_as_string = str(message)
         logger.info("sending message", category="rabbitmq")
         logger.info("message payload", message=message_as_string, category="rabbitmq")
-        connection = None
-        try:
-            connection = self._connect()
-            channel = connection.channel()
 
-            channel.queue_declare(queue=self.queue, durable=True)
-            properties = BasicProperties(headers={}, delivery_mode=2)
+        properties = BasicProperties(headers={}, delivery_mode=2)
 
-            properties.headers["tx_id"] = tx_id
-            properties.headers["questionnaire_id"] = questionnaire_id
+        properties.headers["tx_id"] = tx_id
+        properties.headers["questionnaire_id"] = questionnaire_id
 
-            if case_id:
-                properties.headers["case_id"] = case_id
+        if case_id:
+            properties.headers["case_id"] = case_id
 
-            published = channel.basic_publish(
-                exchange="",
-                routing_key=self.queue,
-                body=message_as_string,
-                mandatory=True,
-                properties=properties,
-            )
-            if published:
-                logger.info("sent message", category="rabbitmq")
-            else:
-                logger.error("unable to send message", category="rabbitmq")
-            return published
+        try:
+            with self.pool.channel() as channel:
+                # The pooled channel is in confirm mode so this raises if the
+                # message is returned or nacked by the broker
+                channel.basic_publish(
+                    exchange="",
+                    routing_key=self.queue,
+                    body=message_as_string,
+                    mandatory=True,
+                    properties=properties,
+                )
         except AMQPError as e:
             logger.error("unable to send message", exc_info=e, category="rabbitmq")
             return False
-        finally:
-            if connection:
-                self._disconnect(connection)
+
+        logger.info("sent message", category="rabbitmq")
+        return True
@@ -0,0 +1,42 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+
+from flask import g, has_request_context
+
+FULL_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+YEAR_PATTERN = re.compile(r"\d{4}$")
+
+
+@lru_cache(maxsize=1024)
+def parse_date(value):
+    """
+    Parse a `YYYY-MM-DD`, `YYYY-MM` or `YYYY` date. The same answers and metadata
+    dates are compared again and again while routing, so parsed dates are cached.
+    """
+    date_format = "%Y-%m"
+    if FULL_DATE_PATTERN.match(value):
+        date_format = "%Y-%m-%d"
+    if YEAR_PATTERN.match(value):
+        date_format = "%Y"
+
+    return datetime.strptime(value, date_format)
+
+
+def convert_to_datetime(value):
+    return parse_date(value) if value else None
+
+
+def get_today():
+    """
+    Today's UTC date as `YYYY-MM-DD`. Within a request it is resolved once, so
+    every comparison with "now" in that request uses the same date.
+    """
+    if not has_request_context():
+        return datetime.utcnow().strftime("%Y-%m-%d")
+
+    today = g.get("_today")
+    if today is None:
+        today = g._today = datetime.utcnow().strftime("%Y-%m-%d")
+
+    return today
@@ -0,0 +1,45 @@
+from functools import lru_cache
+
+import flask_babel
+from babel import Locale, numbers
+
+from app.settings import DEFAULT_LOCALE
+
+
+class NumberFormat:
+    """
+    The symbols and patterns used to parse and format numbers in a locale.
+
+    Babel parses the locale and looks these up in its locale data on every call,
+    so they are resolved once per locale and shared by the number fields,
+    validators, template filters and placeholder transforms.
+    """
+
+    def __init__(self, locale):
+        self.locale = Locale.parse(locale)
+        self.group_symbol = numbers.get_group_symbol(self.locale)
+        self.decimal_symbol = numbers.get_decimal_symbol(self.locale)
+        self.decimal_pattern = self.locale.decimal_formats.get(None)
+        self.currency_pattern = self.locale.currency_formats["standard"]
+
+    def strip_group_symbols(self, value):
+        return value.replace(self.group_symbol, "")
+
+    def format_decimal(self, number):
+        return self.decimal_pattern.apply(number, self.locale)
+
+    def format_currency(self, number, currency):
+        return self.currency_pattern.apply(number, self.locale, currency=currency)
+
+    def get_currency_symbol(self, currency):
+        return self.locale.currency_symbols.get(currency, currency)
+
+
+@lru_cache(maxsize=None)
+def get_number_format(locale):
+    return NumberFormat(locale)
+
+
+def get_locale_number_format():
+    """ The number format for the locale of the current request. """
+    return get_number_format(flask_babel.get_locale() or DEFAULT_LOCALE)
@@ -6,6 +6,7 @@ import simplejson as json
 from structlog import get_logger
 from werkzeug.exceptions import NotFound
 
+from app.instrumentation import timed
 from app.questionnaire.questionnaire_schema import (
     QuestionnaireSchema,
     DEFAULT_LANGUAGE_CODE,
@@ -65,6 +66,7 @@ def get_allowed_languages(schema_name, launch_language):
     return [DEFAULT_LANGUAGE_CODE]
 
 
+@timed("schema_load")
 def load_schema_from_metadata(metadata):
     if metadata.get("survey_url"):
         return load_schema_from_url(
@@ -85,7 +87,7 @@ def load_schema_from_name(schema_name, language_code=None):
     language_code = language_code or DEFAULT_LANGUAGE_CODE
     schema_json = _load_schema_file(schema_name, language_code)
 
-    return QuestionnaireSchema(schema_json, language_code)
+    return QuestionnaireSchema(schema_json, language_code, schema_name)
 
 
 def transform_form_type(form_type):
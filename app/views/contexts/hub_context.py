@@ -1,9 +1,9 @@
 from typing import List, Mapping, Union
 
-from flask import url_for
 from flask_babel import lazy_gettext
 
 from app.data_model.progress_store import CompletionStatus
+from app.helpers.url_helper import build_url
 
 from app.views.contexts.context import Context
 
@@ -88,13 +88,13 @@ class HubContext(Context):
     @staticmethod
     def get_section_url(section_id, list_item_id) -> str:
         if list_item_id:
-            return url_for(
+            return build_url(
                 "questionnaire.get_section",
                 section_id=section_id,
                 list_item_id=list_item_id,
             )
 
-        return url_for("questionnaire.get_section", section_id=section_id)
+        return build_url("questionnaire.get_section", section_id=section_id)
 
     def _get_row_for_repeating_section(self, section_id, list_item_id):
         repeating_title = self._schema.get_repeating_title_for_section(section_id)
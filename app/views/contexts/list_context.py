@@ -1,8 +1,8 @@
 from functools import partial
 
-from flask import url_for
 from flask_babel import lazy_gettext
 
+from app.helpers.url_helper import build_url
 from . import Context
 
 
@@ -43,8 +43,8 @@ class ListContext(Context):
         primary_person = self._list_store[for_list].primary_person
 
         for list_item_id in list_item_ids:
-            partial_url_for = partial(
-                url_for,
+            partial_build_url = partial(
+                build_url,
                 "questionnaire.block",
                 list_name=for_list,
                 list_item_id=list_item_id,
@@ -61,10 +61,12 @@ class ListContext(Context):
             }
 
             if edit_block_id:
-                list_item_context["edit_link"] = partial_url_for(block_id=edit_block_id)
+                list_item_context["edit_link"] = partial_build_url(
+                    block_id=edit_block_id
+                )
 
             if remove_block_id:
-                list_item_context["remove_link"] = partial_url_for(
+                list_item_context["remove_link"] = partial_build_url(
                     block_id=remove_block_id
                 )
 
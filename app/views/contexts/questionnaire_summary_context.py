@@ -1,9 +1,14 @@
 from app.questionnaire.location import Location
-from .context import Context
 from .section_summary_context import SectionSummaryContext
 
 
-class QuestionnaireSummaryContext(Context):
+class QuestionnaireSummaryContext(SectionSummaryContext):
+    """
+    The summary of every enabled section. Each section's summary is built the
+    same way as its section summary page, with one router and placeholder
+    renderer shared by them all.
+    """
+
     def __call__(self, collapsible=True, answers_are_editable=True):
         groups = list(self._build_all_groups())
 
@@ -19,17 +24,5 @@ class QuestionnaireSummaryContext(Context):
 
     def _build_all_groups(self):
         """ NB: Does not support repeating sections """
-        section_summary_context = SectionSummaryContext(
-            self._language,
-            self._schema,
-            self._answer_store,
-            self._list_store,
-            self._progress_store,
-            self._metadata,
-        )
-
         for section_id in self._router.enabled_section_ids:
-            for group in section_summary_context(Location(section_id=section_id))[
-                "summary"
-            ]["groups"]:
-                yield group
+            yield from self._build_summary(Location(section_id=section_id))["groups"]
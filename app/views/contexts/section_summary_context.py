@@ -1,7 +1,6 @@
 from typing import Mapping
 
-from flask import url_for
-
+from app.helpers.url_helper import build_url
 from app.questionnaire import QuestionnaireSchema
 from .context import Context
 from .list_context import ListContext
@@ -58,7 +57,7 @@ class SectionSummaryContext(Context):
                     self._metadata,
                     self._schema,
                     location,
-                    self._language,
+                    self._placeholder_renderer,
                 ).serialize()
                 for group in section["groups"]
             ],
@@ -134,7 +133,7 @@ class SectionSummaryContext(Context):
         )
 
         if list_collector_block["id"] in routing_path:
-            return url_for(
+            return build_url(
                 "questionnaire.block",
                 list_name=summary["for_list"],
                 block_id=list_collector_block["add_block"]["id"],
@@ -146,7 +145,7 @@ class SectionSummaryContext(Context):
         )
 
         if driving_question_block:
-            return url_for(
+            return build_url(
                 "questionnaire.block",
                 block_id=driving_question_block["id"],
                 return_to=current_location.block_id,
@@ -1,16 +1,25 @@
-from flask import url_for
-
-from app.questionnaire.rules import evaluate_when_rules
+from app.helpers.url_helper import build_url
+from app.questionnaire.schema_utils import choose_question_to_display
 from app.views.contexts.summary.question import Question
 
 
 class Block:
     def __init__(
-        self, block_schema, answer_store, list_store, metadata, schema, location
+        self,
+        block_schema,
+        answer_store,
+        list_store,
+        metadata,
+        schema,
+        location,
+        placeholder_renderer,
     ):
         self.id = block_schema["id"]
         self.location = location
-        self.title = block_schema.get("title")
+        self.placeholder_renderer = placeholder_renderer
+        self.title = placeholder_renderer.render_title(
+            block_schema.get("title"), location.list_item_id
+        )
         self.number = block_schema.get("number")
         self.link = self._build_link(block_schema["id"])
         self.question = self.get_question(
@@ -18,35 +27,28 @@ class Block:
         )
 
     def _build_link(self, block_id):
-        return url_for(
+        return build_url(
             "questionnaire.block",
             list_name=self.location.list_name,
             block_id=block_id,
             list_item_id=self.location.list_item_id,
         )
 
-    @staticmethod
     def get_question(
-        block_schema, answer_store, list_store, metadata, schema, location
+        self, block_schema, answer_store, list_store, metadata, schema, location
     ):
         """ Taking question variants into account, return the question which was displayed to the user """
         list_item_id = location.list_item_id
-        for variant in block_schema.get("question_variants", []):
-            display_variant = evaluate_when_rules(
-                variant.get("when"),
-                schema,
-                metadata,
-                answer_store,
-                list_store,
-                location,
-            )
-            if display_variant:
-                return Question(
-                    variant["question"], answer_store, schema, list_item_id
-                ).serialize()
+        question_schema = choose_question_to_display(
+            block_schema, schema, metadata, answer_store, list_store, location
+        )
+        # Only the question shown is rendered, rather than the whole block
+        rendered_question_schema = self.placeholder_renderer.render(
+            question_schema, list_item_id
+        )
 
         return Question(
-            block_schema["question"], answer_store, schema, list_item_id
+            rendered_question_schema, answer_store, schema, list_item_id
         ).serialize()
 
     def serialize(self):
@@ -1,4 +1,3 @@
-from app.questionnaire.placeholder_renderer import PlaceholderRenderer
 from app.views.contexts.summary.block import Block
 
 
@@ -12,14 +11,18 @@ class Group:
         metadata,
         schema,
         location,
-        language,
+        placeholder_renderer,
     ):
         self.id = group_schema["id"]
 
-        self.title = group_schema.get("title")
-
         self.location = location
 
+        self.placeholder_renderer = placeholder_renderer
+
+        self.title = placeholder_renderer.render_title(
+            group_schema.get("title"), location.list_item_id
+        )
+
         self.blocks = self._build_blocks(
             group_schema,
             routing_path,
@@ -29,16 +32,16 @@ class Group:
             schema,
             location,
         )
-        self.placeholder_renderer = PlaceholderRenderer(
-            language=language,
-            schema=schema,
-            answer_store=answer_store,
-            metadata=metadata,
-        )
 
-    @staticmethod
     def _build_blocks(
-        group_schema, routing_path, answer_store, list_store, metadata, schema, location
+        self,
+        group_schema,
+        routing_path,
+        answer_store,
+        list_store,
+        metadata,
+        schema,
+        location,
     ):
         blocks = []
 
@@ -51,7 +54,13 @@ class Group:
                 blocks.extend(
                     [
                         Block(
-                            block, answer_store, list_store, metadata, schema, location
+                            block,
+                            answer_store,
+                            list_store,
+                            metadata,
+                            schema,
+                            location,
+                            self.placeholder_renderer,
                         ).serialize()
                     ]
                 )
@@ -59,7 +68,4 @@ class Group:
         return blocks
 
     def serialize(self):
-        return self.placeholder_renderer.render(
-            {"id": self.id, "title": self.title, "blocks": self.blocks},
-            self.location.list_item_id,
-        )
+        return {"id": self.id, "title": self.title, "blocks": self.blocks}
@@ -1,5 +1,4 @@
-from flask import url_for
-
+from app.helpers.url_helper import build_url
 from app.views.handlers.question import Question
 from app.views.contexts import ListContext
 from app.views.contexts.question import build_question_context
@@ -12,7 +11,7 @@ class ListCollector(Question):
 
     def get_next_location_url(self):
         if self._is_adding:
-            add_url = url_for(
+            add_url = build_url(
                 "questionnaire.block",
                 list_name=self.rendered_block["for_list"],
                 block_id=self.rendered_block["add_block"]["id"],
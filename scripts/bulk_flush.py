@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Flush questionnaires in bulk through a runner's `/flush/bulk` endpoint.
+
+Reads flush tokens, one per line, from a file or stdin and posts them in
+batches, writing each streamed result as a line of JSON to stdout with the
+token's position in the input. Exits non-zero if any token failed to flush.
+
+    pipenv run python -m scripts.bulk_flush --url http://localhost:5000 tokens.txt
+"""
+import argparse
+import json
+import logging
+import sys
+
+import coloredlogs
+import requests
+
+logger = logging.getLogger(__name__)
+
+coloredlogs.install(level="INFO", logger=logger, fmt="%(message)s")
+
+
+def read_batches(token_file, batch_size):
+    batch = []
+    for token in token_file:
+        token = token.strip()
+        if token:
+            batch.append(token)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def flush_batch(session, url, tokens, timeout):
+    response = session.post(
+        f"{url}/flush/bulk", json={"tokens": tokens}, stream=True, timeout=timeout
+    )
+    response.raise_for_status()
+
+    for line in response.iter_lines():
+        if line:
+            yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Flush questionnaires in bulk using a file of flush tokens"
+    )
+    parser.add_argument("--url", required=True, help="the runner's base url")
+    parser.add_argument(
+        "tokens",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="a file of flush tokens, one per line (default: stdin)",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    counts = {}
+    offset = 0
+    with requests.Session() as session:
+        for batch in read_batches(args.tokens, args.batch_size):
+            for result in flush_batch(
+                session, args.url.rstrip("/"), batch, args.timeout
+            ):
+                result["index"] += offset
+                sys.stdout.write(json.dumps(result) + "\n")
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+            offset += len(batch)
+            logger.info("processed %d tokens %s", offset, counts)
+
+    if any(status >= 500 for status in counts):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
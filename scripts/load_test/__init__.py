@@ -0,0 +1,6 @@
+"""
+A load test of the runner, served as it is in production with local stand-ins
+for its supporting services.
+
+Run with `pipenv run python -m scripts.load_test`.
+"""
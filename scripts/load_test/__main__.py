@@ -0,0 +1,344 @@
+"""
+Load test the runner, reporting the throughput and latency of each endpoint.
+
+Serves the application under gunicorn with gevent workers and local stand-ins
+for the datastore, Redis and RabbitMQ, then has `--users` concurrent virtual
+users make a journey over and over for `--duration` seconds, launching each
+with a new token. Reports the requests per second and the 50th, 95th and 99th
+percentile times of each endpoint, for example:
+
+    pipenv run python -m scripts.load_test --journey household --people 5
+
+A report can be saved as a baseline with `--save-baseline`. A later run given
+the baseline with `--baseline` fails if throughput drops, or any endpoint's
+median or 95th percentile time rises, by more than `--tolerance`. Results are
+only comparable between runs on the same machine.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import coloredlogs
+import fakeredis
+import requests
+import structlog
+from mock import patch
+from sdc.crypto.key_store import KeyStore
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RequestRedirect
+
+from app.keys import KEY_PURPOSE_AUTHENTICATION
+from app.setup import create_app
+from scripts.load_test.journeys import JOURNEYS, JourneyFailed, VirtualUser
+from tests.app.app_context_test_case import MockDatastore
+from tests.integration.create_token import TokenGenerator
+from tests.integration.integration_test_case import (
+    EQ_USER_AUTHENTICATION_RRM_PRIVATE_KEY_KID,
+    SR_USER_AUTHENTICATION_PUBLIC_KEY_KID,
+    get_file_contents,
+)
+
+logger = logging.getLogger("load_test")
+
+coloredlogs.install(level="INFO", logger=logger, fmt="%(message)s")
+
+PERCENTILES = (50, 95, 99)
+
+# The percentiles a baseline fails on, as the 99th is too noisy to compare
+COMPARED_PERCENTILES = (50, 95)
+
+
+def _drop_event(*_):
+    raise structlog.DropEvent
+
+
+def silence_application_logging():
+    structlog.configure(processors=[_drop_event])
+
+
+def get_token_generator():
+    key_store = KeyStore(
+        {
+            "keys": {
+                EQ_USER_AUTHENTICATION_RRM_PRIVATE_KEY_KID: {
+                    "purpose": KEY_PURPOSE_AUTHENTICATION,
+                    "type": "private",
+                    "value": get_file_contents(
+                        "sdc-rrm-authentication-signing-private-v1.pem"
+                    ),
+                },
+                SR_USER_AUTHENTICATION_PUBLIC_KEY_KID: {
+                    "purpose": KEY_PURPOSE_AUTHENTICATION,
+                    "type": "public",
+                    "value": get_file_contents(
+                        "sdc-sr-authentication-encryption-public-v1.pem"
+                    ),
+                },
+            }
+        }
+    )
+    return TokenGenerator(
+        key_store,
+        EQ_USER_AUTHENTICATION_RRM_PRIVATE_KEY_KID,
+        SR_USER_AUTHENTICATION_PUBLIC_KEY_KID,
+    )
+
+
+def get_endpoint_matcher():
+    """ Names the endpoint of each request from the application's url map. """
+    with patch("app.setup.datastore.Client", MockDatastore), patch(
+        "app.setup.redis.Redis", fakeredis.FakeStrictRedis
+    ):
+        url_adapter = create_app().url_map.bind("localhost")
+
+    def get_endpoint(method, path):
+        try:
+            endpoint, _ = url_adapter.match(path, method)
+        except RequestRedirect as redirect:
+            return get_endpoint(method, urlsplit(redirect.new_url).path)
+        except HTTPException:
+            endpoint = "unmatched"
+        return f"{method} {endpoint}"
+
+    return get_endpoint
+
+
+def start_server(port):
+    env = {**os.environ, "FLASK_ENV": "production"}
+    # The gunicorn config binds to port 5000, which the command line would override
+    env.pop("GUNICORN_CMD_ARGS", None)
+
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--worker-class",
+            "gevent",
+            # Each worker would have its own stand-in storage
+            "--workers",
+            "1",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "scripts.load_test.wsgi:application",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/status", timeout=5).ok:
+                return server, base_url
+        except requests.ConnectionError:
+            pass
+        if server.poll() is not None:
+            break
+        time.sleep(0.5)
+
+    server.terminate()
+    raise RuntimeError("The application didn't start")
+
+
+class LoadTest:
+    def __init__(self, base_url, journey, people, get_endpoint):
+        self._base_url = base_url
+        self._journey = journey
+        self._people = people
+        self._get_endpoint = get_endpoint
+        self._token_generator = get_token_generator()
+        self._record_from = None
+        self._durations = defaultdict(list)
+        self._errors = defaultdict(int)
+        self._journeys = {"completed": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    def _launch_url(self, schema_name):
+        return "/session?token=" + self._token_generator.create_token(schema_name)
+
+    def _record(self, endpoint, duration, status_code):
+        if time.monotonic() < self._record_from:
+            return
+
+        with self._lock:
+            self._durations[endpoint].append(duration)
+            if status_code >= 400:
+                self._errors[endpoint] += 1
+
+    def _run_user(self, deadline):
+        while time.monotonic() < deadline:
+            user = VirtualUser(self._base_url, self._get_endpoint, self._record)
+            try:
+                self._journey(user, self._launch_url, self._people)
+                outcome = "completed"
+            except (JourneyFailed, requests.RequestException) as exception:
+                logger.warning("journey failed: %s", exception)
+                outcome = "failed"
+
+            if time.monotonic() < deadline:
+                with self._lock:
+                    self._journeys[outcome] += 1
+
+    def run(self, users, duration, warm_up):
+        self._record_from = time.monotonic() + warm_up
+        deadline = self._record_from + duration
+
+        with ThreadPoolExecutor(max_workers=users) as executor:
+            for future in [
+                executor.submit(self._run_user, deadline) for _ in range(users)
+            ]:
+                future.result()
+
+        return self._get_report(duration)
+
+    def _get_report(self, duration):
+        endpoints = {}
+        for endpoint, durations in sorted(self._durations.items()):
+            durations.sort()
+            endpoints[endpoint] = {
+                "requests": len(durations),
+                "errors": self._errors[endpoint],
+                **{
+                    f"p{percentile}": round(
+                        get_percentile(durations, percentile) * 1000, 2
+                    )
+                    for percentile in PERCENTILES
+                },
+            }
+
+        request_count = sum(len(durations) for durations in self._durations.values())
+        return {
+            "requests_per_second": round(request_count / duration, 1),
+            "journeys": dict(self._journeys),
+            "endpoints": endpoints,
+        }
+
+
+def get_percentile(sorted_values, percentile):
+    """ The nearest-rank percentile of some sorted values. """
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def log_report(report):
+    logger.info(
+        "%.1f requests/s, %d journeys completed, %d failed",
+        report["requests_per_second"],
+        report["journeys"]["completed"],
+        report["journeys"]["failed"],
+    )
+    logger.info(
+        "%-45s %8s %6s %9s %9s %9s", "endpoint", "requests", "errors", *PERCENTILES
+    )
+    for endpoint, result in report["endpoints"].items():
+        logger.info(
+            "%-45s %8d %6d %7.2fms %7.2fms %7.2fms",
+            endpoint,
+            result["requests"],
+            result["errors"],
+            *(result[f"p{percentile}"] for percentile in PERCENTILES),
+        )
+
+
+def get_regressions(report, baseline, tolerance):
+    regressions = []
+    if report["settings"] != baseline["settings"]:
+        return [f"the baseline is for {baseline['settings']}"]
+
+    minimum_throughput = baseline["requests_per_second"] * (1 - tolerance)
+    if report["requests_per_second"] < minimum_throughput:
+        regressions.append(
+            f"{report['requests_per_second']} requests/s, "
+            f"below the baseline's {baseline['requests_per_second']}"
+        )
+
+    if report["journeys"]["failed"]:
+        regressions.append(f"{report['journeys']['failed']} journeys failed")
+
+    for endpoint, baseline_result in baseline["endpoints"].items():
+        result = report["endpoints"].get(endpoint)
+        if not result:
+            continue
+
+        for percentile in COMPARED_PERCENTILES:
+            key = f"p{percentile}"
+            if result[key] > baseline_result[key] * (1 + tolerance):
+                regressions.append(
+                    f"{endpoint} {key} {result[key]}ms, "
+                    f"above the baseline's {baseline_result[key]}ms"
+                )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--journey", choices=sorted(JOURNEYS), default="household")
+    parser.add_argument("--people", type=int, default=5)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--warm-up", type=int, default=10)
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument(
+        "--url", help="Load test an application that's already running at this url"
+    )
+    parser.add_argument("--baseline", help="A saved report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", help="Save the report as a baseline here")
+    args = parser.parse_args()
+
+    silence_application_logging()
+    get_endpoint = get_endpoint_matcher()
+
+    server = None
+    if args.url:
+        base_url = args.url
+    else:
+        server, base_url = start_server(args.port)
+
+    try:
+        report = LoadTest(
+            base_url, JOURNEYS[args.journey], args.people, get_endpoint
+        ).run(args.users, args.duration, args.warm_up)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    report["settings"] = {
+        "journey": args.journey,
+        "people": args.people,
+        "users": args.users,
+    }
+    log_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = get_regressions(
+                report, json.load(baseline_file), args.tolerance
+            )
+
+        for regression in regressions:
+            logger.error("regression: %s", regression)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Journeys through the test schemas, as a respondent makes them in a browser.
+
+Each journey launches a survey with a new token, answers it and submits it,
+recording the time of every request, including each redirect, against the
+endpoint that handled it.
+"""
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+THANK_YOU_PATH = "/submitted/thank-you/"
+
+CSRF_TOKEN_PATTERN = re.compile(
+    r'<input id="csrf_token" name="csrf_token" type="hidden" value="(.+?)"/>'
+)
+
+
+class JourneyFailed(Exception):
+    pass
+
+
+class VirtualUser:
+    """
+    A respondent's browser, which follows redirects and posts each form with the
+    CSRF token of the page it was on, as the integration tests do.
+    """
+
+    def __init__(self, base_url, get_endpoint, record):
+        """
+        :param get_endpoint: a function of the method and path of a request, which
+        returns the name of the endpoint that handles it
+        :param record: a function of the endpoint, duration in seconds and status
+        code of each request, to record it
+        """
+        self._base_url = base_url
+        self._get_endpoint = get_endpoint
+        self._record = record
+        self._session = requests.Session()
+        self.last_url = None
+        self._csrf_token = None
+
+    def get(self, url):
+        self._request("GET", url)
+
+    def post(self, post_data=None, action=None):
+        data = dict(post_data or {})
+        if self._csrf_token:
+            data["csrf_token"] = self._csrf_token
+        if action:
+            data[f"action[{action}]"] = ""
+
+        self._request("POST", self.last_url, data)
+
+    def _request(self, method, url, data=None):
+        while True:
+            url = urljoin(self._base_url, url)
+            path = urlsplit(url).path
+
+            start = time.perf_counter()
+            response = self._session.request(
+                method, url, data=data, allow_redirects=False
+            )
+            duration = time.perf_counter() - start
+
+            self._record(
+                self._get_endpoint(method, path), duration, response.status_code
+            )
+
+            if response.status_code >= 400:
+                raise JourneyFailed(f"{method} {path} {response.status_code}")
+
+            if not response.is_redirect:
+                break
+
+            method, url, data = "GET", response.headers["Location"], None
+
+        self.last_url = url
+        match = CSRF_TOKEN_PATTERN.search(response.text)
+        self._csrf_token = match.group(1) if match else None
+
+    def assert_at(self, path):
+        if urlsplit(self.last_url).path != path:
+            raise JourneyFailed(f"Expected to be at {path}, not {self.last_url}")
+
+
+def household(user, launch_url, people):
+    """
+    The repeating sections with hub and spoke test schema, for a household of
+    `people` people who each answer their own personal details section.
+    """
+    user.get(launch_url("test_repeating_sections_with_hub_and_spoke"))
+    user.post(action="submit")
+
+    user.post({"you-live-here": "Yes"})
+    user.post({"first-name": "Person", "last-name": "0"})
+    for index in range(1, people):
+        user.post({"anyone-else": "Yes"})
+        user.post({"first-name": "Person", "last-name": str(index)})
+    user.post({"anyone-else": "No"})
+    user.post(action="submit")
+    user.post({"another-anyone-else": "No"})
+    user.post({"visitors-anyone-else": "No"})
+
+    for _ in range(people):
+        # Continuing from the hub goes to the first incomplete section
+        user.post(action="submit")
+        user.post({"proxy-answer": "Yes"})
+        user.post(
+            {
+                "date-of-birth-answer-day": "1",
+                "date-of-birth-answer-month": "1",
+                "date-of-birth-answer-year": "1990",
+            }
+        )
+        user.post({"confirm-date-of-birth-answer": "Yes, {person_name} is {age} old"})
+        user.post({"sex-answer": "Female"})
+        user.post(action="submit")
+
+    user.post(action="submit")
+    user.assert_at(THANK_YOU_PATH)
+
+
+def hub_and_spoke(user, launch_url, _people):
+    """ The hub and spoke test schema, completing every section from the hub. """
+    user.get(launch_url("test_hub_and_spoke"))
+
+    user.post(action="submit")
+    user.post({"employment-status-answer": "Working as an employee"})
+    user.post(action="submit")
+    user.post()
+    user.post(action="submit")
+    user.post(action="submit")
+    user.post({"does-anyone-live-here-answer": "No"})
+    user.post(action="submit")
+    user.post(action="submit")
+    user.post({"relationships-answer": "No"})
+    user.post(action="submit")
+    user.post(action="submit")
+    user.assert_at(THANK_YOU_PATH)
+
+
+def relationships(user, launch_url, people):
+    """
+    The relationships test schema, for a household of `people` people, answering
+    the relationship between every pair of them.
+    """
+    user.get(launch_url("test_relationships"))
+
+    for index in range(people):
+        user.post({"anyone-else": "Yes"})
+        user.post({"first-name": "Person", "last-name": str(index)})
+    user.post({"anyone-else": "No"})
+
+    for _ in range(people * (people - 1) // 2):
+        user.post({"relationship-answer": "Husband or Wife"})
+
+    user.post()
+    user.assert_at(THANK_YOU_PATH)
+
+
+JOURNEYS = {
+    "household": household,
+    "hub-and-spoke": hub_and_spoke,
+    "relationships": relationships,
+}
@@ -0,0 +1,20 @@
+"""
+The application as the load test serves it, under gunicorn with gevent workers.
+
+The datastore and Redis are replaced with the in-memory stand-ins the tests use,
+so each worker has its own storage and a journey has to stay on one worker.
+Submissions are sent with the log submitter in place of RabbitMQ.
+"""
+import os
+
+import fakeredis
+from mock import patch
+
+from tests.app.app_context_test_case import MockDatastore
+
+os.environ["EQ_SUBMISSION_BACKEND"] = "log"
+
+with patch("app.setup.datastore.Client", MockDatastore), patch(
+    "app.setup.redis.Redis", fakeredis.FakeStrictRedis
+):
+    from application import application  # NOQA pylint: disable=unused-import
@@ -0,0 +1,73 @@
+"""
+Compile every template into the Jinja bytecode cache.
+
+Run when building the image, so that workers read compiled templates from
+`EQ_JINJA_BYTECODE_CACHE_DIR` rather than compiling them after every deploy:
+
+    EQ_JINJA_BYTECODE_CACHE_DIR=.jinja-cache pipenv run python -m scripts.precompile_templates
+"""
+import os
+import sys
+
+from structlog import get_logger
+
+logger = get_logger()
+
+# Settings the app can't be imported without, which are only set where the
+# runner is deployed. Compiling templates doesn't use them, so they are given
+# placeholder values when the image is built.
+DEPLOYMENT_SETTINGS = (
+    "EQ_SUBMITTED_RESPONSES_TABLE_NAME",
+    "EQ_QUESTIONNAIRE_STATE_TABLE_NAME",
+    "EQ_SESSION_TABLE_NAME",
+    "EQ_USED_JTI_CLAIM_TABLE_NAME",
+    "EQ_REDIS_HOST",
+    "EQ_REDIS_PORT",
+)
+
+
+def create_template_app():
+    """
+    An application whose templates are compiled as they are by `create_app`.
+
+    The cache is keyed on each template's filename and the environment it is
+    compiled in, so the templates are found, and the environment set up, the
+    same way as they are by `create_app`.
+    """
+    for setting in DEPLOYMENT_SETTINGS:
+        os.environ.setdefault(setting, "")
+
+    # pylint: disable=import-outside-toplevel
+    from flask import Flask
+
+    from app import settings, setup
+    from app.setup import setup_babel, setup_cache, setup_jinja_env
+
+    application = Flask(setup.__name__, template_folder="../templates")
+    application.config.from_object(settings)
+
+    setup_babel(application)
+    setup_cache(application)
+    setup_jinja_env(application)
+
+    return application
+
+
+def main():
+    application = create_template_app()
+
+    cache_dir = application.config["EQ_JINJA_BYTECODE_CACHE_DIR"]
+    if not cache_dir:
+        logger.error("EQ_JINJA_BYTECODE_CACHE_DIR is not set")
+        sys.exit(1)
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # pylint: disable=import-outside-toplevel
+    from app.setup import warm_up_templates
+
+    warm_up_templates(application)
+
+
+if __name__ == "__main__":
+    main()
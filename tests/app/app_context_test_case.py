@@ -29,6 +29,13 @@ class MockDatastore:
         self.delete_call_count += 1
         del self.storage[key]
 
+    def get_multi(self, keys):
+        return [self.storage[key] for key in keys if key in self.storage]
+
+    def delete_multi(self, keys):
+        for key in keys:
+            self.delete(key)
+
     # pylint: disable=no-self-use
     def key(self, *path_args, **kwargs):
         return Key(*path_args, project="local", **kwargs)
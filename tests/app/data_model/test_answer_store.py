@@ -86,6 +86,20 @@ def test_adding_new_answer(empty_answer_store):
     assert len(empty_answer_store) == 1
 
 
+def test_revision_changes_with_answers(empty_answer_store):
+    revision = empty_answer_store.revision
+
+    empty_answer_store.add_or_update(Answer(answer_id="4", value=25))
+    assert empty_answer_store.revision != revision
+
+    revision = empty_answer_store.revision
+    empty_answer_store.add_or_update(Answer(answer_id="4", value=25))
+    assert empty_answer_store.revision == revision
+
+    empty_answer_store.remove_answer("4")
+    assert empty_answer_store.revision != revision
+
+
 def test_raises_error_on_invalid_answer(empty_answer_store):
 
     with pytest.raises(TypeError) as e:
@@ -432,6 +432,47 @@ def test_is_section_complete():
     assert store.is_section_complete(section_id="s4", list_item_id="123abc") is True
 
 
+def test_is_block_complete():
+    completed = [
+        {
+            "section_id": "s1",
+            "list_item_id": None,
+            "status": CompletionStatus.IN_PROGRESS,
+            "block_ids": ["one"],
+        },
+        {
+            "section_id": "s2",
+            "list_item_id": "abc123",
+            "status": CompletionStatus.COMPLETED,
+            "block_ids": ["three"],
+        },
+    ]
+    store = ProgressStore(completed)
+
+    store.add_completed_location(Location(section_id="s1", block_id="two"))
+    store.remove_completed_location(Location(section_id="s1", block_id="one"))
+
+    assert not store.is_block_complete(block_id="one", section_id="s1")
+    assert store.is_block_complete(block_id="two", section_id="s1")
+    assert store.is_block_complete(
+        block_id="three", section_id="s2", list_item_id="abc123"
+    )
+    assert not store.is_block_complete(block_id="three", section_id="s2")
+    assert not store.is_block_complete(block_id="one", section_id="s3")
+
+
+def test_completed_block_ids_keep_their_order():
+    store = ProgressStore()
+
+    for block_id in ["one", "two", "three", "two"]:
+        store.add_completed_location(Location(section_id="s1", block_id=block_id))
+    store.remove_completed_location(Location(section_id="s1", block_id="two"))
+    store.add_completed_location(Location(section_id="s1", block_id="two"))
+
+    assert store.get_completed_block_ids(section_id="s1") == ["one", "three", "two"]
+    assert store.serialise()[0].block_ids == ["one", "three", "two"]
+
+
 def test_remove_progress_for_list_item_id():
     completed = [
         {
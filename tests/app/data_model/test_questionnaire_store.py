@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import simplejson as json
 
+from app.data_model.answer import Answer
 from app.data_model.answer_store import AnswerStore
 from app.data_model.progress_store import ProgressStore, CompletionStatus
 from app.data_model.questionnaire_store import QuestionnaireStore
@@ -178,3 +179,39 @@ class TestQuestionnaireStore(TestCase):
 
         with self.assertRaises(TypeError):
             store.metadata["no"] = "writing"
+
+    def test_state_key_identifies_stored_data(self):
+        self.input_data = json.dumps(get_basic_input())
+        store = QuestionnaireStore(self.storage)
+        same_store = QuestionnaireStore(self.storage)
+
+        other_input = get_basic_input()
+        other_input["ANSWERS"][0]["value"] = "other"
+        self.input_data = json.dumps(other_input)
+        other_store = QuestionnaireStore(self.storage)
+
+        self.assertIsNotNone(store.state_key)
+        self.assertEqual(store.state_key, same_store.state_key)
+        self.assertNotEqual(store.state_key, other_store.state_key)
+
+    def test_state_key_is_none_after_changes(self):
+        self.input_data = json.dumps(get_basic_input())
+
+        store = QuestionnaireStore(self.storage)
+        store.answer_store.add_or_update(Answer("test", "changed"))
+        self.assertIsNone(store.state_key)
+
+        store = QuestionnaireStore(self.storage)
+        store.list_store.add_list_item("people")
+        self.assertIsNone(store.state_key)
+
+        store = QuestionnaireStore(self.storage)
+        store.progress_store.update_section_status(
+            CompletionStatus.IN_PROGRESS, "a-test-section", "abc123"
+        )
+        self.assertIsNone(store.state_key)
+
+    def test_state_key_is_none_without_stored_data(self):
+        self.input_data = None
+
+        self.assertIsNone(QuestionnaireStore(self.storage).state_key)
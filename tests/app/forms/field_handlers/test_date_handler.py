@@ -13,7 +13,7 @@ from app.forms.field_handlers.date_handler import DateHandler
 from app.forms.fields import date_field
 from app.questionnaire.location import Location
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
-from app.questionnaire.rules import convert_to_datetime
+from app.utilities.dates import convert_to_datetime
 from app.utilities.schema import load_schema_from_name
 
 
@@ -111,9 +111,6 @@ def test_get_referenced_offset_value_for_meta(app):
     assert minimum_date == convert_to_datetime("2018-02-10")
 
 
-@patch(
-    "app.utilities.schema.load_schema_from_name", return_value=QuestionnaireSchema({})
-)
 def test_get_referenced_offset_value_for_answer_id(app):
     answer_store = AnswerStore()
 
@@ -122,7 +119,9 @@ def test_get_referenced_offset_value_for_answer_id(app):
 
     answer = {"maximum": {"value": {"identifier": "date", "source": "answers"}}}
 
-    handler = DateHandler(answer, answer_store=answer_store)
+    handler = DateHandler(
+        answer, answer_store=answer_store, schema=QuestionnaireSchema({})
+    )
     maximum_date = handler.get_date_value("maximum")
     maximum_date = handler.transform_date_by_offset(maximum_date, {"months": 1})
 
@@ -130,14 +129,11 @@ def test_get_referenced_offset_value_for_answer_id(app):
 
 
 # pylint: disable=unused-argument
-@patch(
-    "app.utilities.schema.load_schema_from_name", return_value=QuestionnaireSchema({})
-)
 @patch(
     "app.questionnaire.questionnaire_schema.QuestionnaireSchema.get_list_item_id_for_answer_id",
     return_value="abcde",
 )
-def test_get_referenced_offset_value_with_list_item_id(app, schema_mock):
+def test_get_referenced_offset_value_with_list_item_id(schema_mock, app):
     list_item_id = "abcde"
     answer_store = AnswerStore()
 
@@ -156,7 +152,12 @@ def test_get_referenced_offset_value_with_list_item_id(app, schema_mock):
         }
     }
 
-    handler = DateHandler(answer, answer_store=answer_store, location=location)
+    handler = DateHandler(
+        answer,
+        answer_store=answer_store,
+        location=location,
+        schema=QuestionnaireSchema({}),
+    )
     maximum_date = handler.get_date_value("maximum")
 
     assert maximum_date == convert_to_datetime("2018-04-20")
@@ -172,9 +173,6 @@ def test_get_referenced_offset_value_with_no_offset(app):
     assert minimum_date == convert_to_datetime("2017-06-11")
 
 
-@patch(
-    "app.utilities.schema.load_schema_from_name", return_value=QuestionnaireSchema({})
-)
 def test_minimum_and_maximum_offset_dates(app):
     test_metadata = {"date": "2018-02-20"}
     store = AnswerStore()
@@ -195,7 +193,12 @@ def test_minimum_and_maximum_offset_dates(app):
         },
     }
 
-    handler = DateHandler(answer, answer_store=store, metadata=test_metadata)
+    handler = DateHandler(
+        answer,
+        answer_store=store,
+        metadata=test_metadata,
+        schema=QuestionnaireSchema({}),
+    )
     minimum_date = handler.get_date_value("minimum")
     maximum_date = handler.get_date_value("maximum")
 
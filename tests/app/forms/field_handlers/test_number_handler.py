@@ -8,6 +8,7 @@ from app.forms.field_handlers.number_handler import NumberHandler
 from app.forms.fields.decimal_field_with_separator import DecimalFieldWithSeparator
 from app.forms.fields.integer_field_with_separator import IntegerFieldWithSeparator
 from app.forms.error_messages import error_messages
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.settings import MAX_NUMBER
 
 
@@ -345,14 +346,13 @@ def test_get_schema_value_answer_store():
         "maximum": {"value": {"identifier": "set-maximum", "source": "answers"}},
         "minimum": {"value": {"identifier": "set-minimum", "source": "answers"}},
     }
-    mock_metadata = {"schema_name": "test_numbers", "language_code": "en"}
     answer_store = AnswerStore()
 
     answer_store.add_or_update(Answer(answer_id="set-maximum", value=10))
     answer_store.add_or_update(Answer(answer_id="set-minimum", value=1))
 
     number_handler = NumberHandler(
-        answer_schema, answer_store=answer_store, metadata=mock_metadata
+        answer_schema, answer_store=answer_store, schema=QuestionnaireSchema({})
     )
 
     maximum = number_handler.get_schema_value(answer_schema["maximum"])
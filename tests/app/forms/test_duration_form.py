@@ -97,6 +97,17 @@ class TestDurationForm(AppContextTestCase):
         self._test_validation(False, None, "12", True)
         self._test_validation(True, None, "12", True)
 
+    def test_mandatory_disabled(self):
+        form_class = get_duration_form(
+            {"mandatory": True, "units": ["years"]}, error_messages, mandatory=False
+        )
+
+        form = form_class()
+        form.years.raw_data = [""]
+
+        with self.app_request_context("/"):
+            self.assertTrue(form.validate())
+
     def _test_validation(self, mandatory, years, months, valid, error=None):
         units = []
         if years is not None:
@@ -1,4 +1,6 @@
 # pylint: disable=too-many-lines
+import pickle
+from copy import deepcopy
 from decimal import Decimal
 
 from mock import patch
@@ -6,6 +8,7 @@ from mock import patch
 from app.forms.questionnaire_form import generate_form
 from app.utilities.schema import load_schema_from_name
 from app.forms.validators import ResponseRequired
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.data_model.answer_store import AnswerStore, Answer
 
 from tests.app.app_context_test_case import AppContextTestCase
@@ -970,6 +973,40 @@ class TestQuestionnaireForm(
                 schema.error_messages["TOTAL_SUM_NOT_EQUALS"] % dict(total="10"),
             )
 
+    def test_calculation_conditions_are_unchanged_by_validation(self):
+        store = AnswerStore()
+
+        answer_total = Answer(answer_id="total-answer", value=10)
+
+        store.add_or_update(answer_total)
+
+        with self.app_request_context():
+            schema = load_schema_from_name(
+                "test_sum_equal_or_less_validation_against_total"
+            )
+
+            question_schema = schema.get_block("breakdown-block").get("question")
+
+            data = {
+                "breakdown-1": "10",
+                "breakdown-2": "",
+                "breakdown-3": "",
+                "breakdown-4": "",
+            }
+
+            for _ in range(2):
+                form = generate_form(
+                    schema, question_schema, store, metadata=None, formdata=data
+                )
+                form.validate()
+
+                self.assertEqual(len(form.question_errors), 0)
+
+            self.assertEqual(
+                question_schema["calculations"][0]["conditions"],
+                ["less than", "equals"],
+            )
+
     def test_generate_form_with_title_and_no_answer_label(self):
         """
         Checks that the form is still generated when there is no answer label but there is a question title
@@ -1169,3 +1206,202 @@ class TestQuestionnaireForm(
                 form.question_errors["mutually-exclusive-date-question"],
                 "Remove an answer to continue.",
             )
+
+    def test_form_class_is_reused_for_question(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+
+            question_schema = schema.get_block("set-min-max-block").get("question")
+
+            first_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+            second_form = generate_form(
+                schema,
+                question_schema,
+                AnswerStore(),
+                metadata=None,
+                formdata={"set-minimum": "10"},
+            )
+
+            self.assertIs(type(first_form), type(second_form))
+            self.assertEqual(second_form.data["set-minimum"], 10)
+
+    def test_form_class_is_not_reused_when_answers_differ(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+
+            question_schema = schema.get_block("set-min-max-block").get("question")
+            optional_question_schema = deepcopy(question_schema)
+            for answer in optional_question_schema["answers"]:
+                answer["mandatory"] = False
+
+            form = generate_form(schema, question_schema, AnswerStore(), metadata=None)
+            optional_form = generate_form(
+                schema, optional_question_schema, AnswerStore(), metadata=None
+            )
+
+            form.validate()
+            optional_form.validate()
+
+            self.assertIsNot(type(form), type(optional_form))
+            self.assertIn("set-minimum", form.errors)
+            self.assertNotIn("set-minimum", optional_form.errors)
+
+    def test_answer_referenced_validators_are_bound_per_form(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+            metadata = {"schema_name": "test_numbers", "language_code": "en"}
+
+            question_schema = schema.get_block("test-min-max-block").get("question")
+
+            def validate_range(minimum):
+                answer_store = AnswerStore(
+                    [
+                        {"answer_id": "set-minimum", "value": minimum},
+                        {"answer_id": "set-maximum", "value": 2000},
+                    ]
+                )
+                form = generate_form(
+                    schema,
+                    question_schema,
+                    answer_store,
+                    metadata,
+                    formdata={"test-range": "500"},
+                )
+                form.validate()
+                return form.answer_errors("test-range")
+
+            self.assertEqual(validate_range(minimum=10), [])
+            self.assertIn(
+                schema.error_messages["NUMBER_TOO_SMALL"] % dict(min="600"),
+                validate_range(minimum=600),
+            )
+
+    def test_referenced_answers_are_resolved_once_per_form(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+
+            question_schema = schema.get_block("test-min-max-block").get("question")
+            answer_store = AnswerStore(
+                [
+                    {"answer_id": "set-minimum", "value": 10},
+                    {"answer_id": "set-maximum", "value": 2000},
+                ]
+            )
+
+            with patch.object(
+                answer_store,
+                "get_answers_by_answer_id",
+                wraps=answer_store.get_answers_by_answer_id,
+            ) as get_answers_by_answer_id, patch.object(
+                answer_store, "get_answer", wraps=answer_store.get_answer
+            ) as get_answer:
+                form = generate_form(
+                    schema,
+                    question_schema,
+                    answer_store,
+                    metadata=None,
+                    formdata={"test-range": "500"},
+                )
+                form.validate()
+
+            self.assertEqual(
+                form.referenced_answers, {"set-minimum": 10, "set-maximum": 2000}
+            )
+            self.assertEqual(get_answers_by_answer_id.call_count, 1)
+            get_answer.assert_not_called()
+
+    def test_referenced_answers_fall_back_to_default_answers(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_confirmation_question")
+
+            question_schema = schema.get_block("number-of-employees-split-block")[
+                "question"
+            ]
+
+            form = generate_form(schema, question_schema, AnswerStore(), metadata=None)
+
+            self.assertEqual(form.referenced_answers, {"number-of-employees-total": 0})
+
+    def test_form_class_is_not_cached_for_answers_with_placeholders(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_relationships")
+
+            question_schema = schema.get_block("relationships").get("question")
+
+            first_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+            second_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+
+            self.assertIsNot(type(first_form), type(second_form))
+
+    def test_form_class_is_shared_between_copies_of_the_schema(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+
+            forms = []
+            for schema_copy in (pickle.loads(pickle.dumps(schema)) for _ in range(2)):
+                question_schema = schema_copy.get_block("set-min-max-block")["question"]
+                forms.append(
+                    generate_form(
+                        schema_copy, question_schema, AnswerStore(), metadata=None
+                    )
+                )
+
+            self.assertIs(type(forms[0]), type(forms[1]))
+
+    def test_form_class_is_not_cached_for_schema_not_loaded_by_name(self):
+        with self.app_request_context():
+            schema = QuestionnaireSchema(load_schema_from_name("test_numbers").json)
+
+            question_schema = schema.get_block("set-min-max-block")["question"]
+
+            first_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+            second_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+
+            self.assertIsNot(type(first_form), type(second_form))
+
+    def test_date_limits_are_not_shared_between_forms(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_date_validation_single")
+
+            question_schema = schema.get_block("date-range-block")["question"]
+            answer_store = AnswerStore([{"answer_id": "date", "value": "2017-05-01"}])
+            data = {
+                "date-range-from-day": "1",
+                "date-range-from-month": "5",
+                "date-range-from-year": "2017",
+                "date-range-to-day": "1",
+                "date-range-to-month": "7",
+                "date-range-to-year": "2017",
+            }
+
+            def validate_from(ref_p_start_date):
+                form = generate_form(
+                    schema,
+                    question_schema,
+                    answer_store,
+                    {"ref_p_start_date": ref_p_start_date},
+                    formdata=data,
+                )
+                form.validate()
+                return form.errors.get("date-range-from")
+
+            too_early_error = {
+                "year": [
+                    schema.error_messages["SINGLE_DATE_PERIOD_TOO_EARLY"]
+                    % dict(min="12 May 2017")
+                ]
+            }
+
+            self.assertEqual(validate_from("2017-06-01"), too_early_error)
+            self.assertIsNone(validate_from("2017-01-01"))
+            self.assertEqual(validate_from("2017-06-01"), too_early_error)
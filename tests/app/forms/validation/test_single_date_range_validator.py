@@ -1,7 +1,7 @@
 from unittest.mock import Mock
 from wtforms.validators import ValidationError
 
-from app.questionnaire.rules import convert_to_datetime
+from app.utilities.dates import convert_to_datetime
 from app.forms.error_messages import error_messages
 from app.forms.validators import SingleDatePeriodCheck
 from tests.app.app_context_test_case import AppContextTestCase
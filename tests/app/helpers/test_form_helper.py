@@ -1,3 +1,4 @@
+from copy import deepcopy
 from collections import OrderedDict
 from werkzeug.datastructures import MultiDict
 from tests.app.app_context_test_case import AppContextTestCase
@@ -119,6 +120,46 @@ class TestFormHelper(AppContextTestCase):
             self.assertIsInstance(period_from_field.year.validators[0], OptionalForm)
             self.assertIsInstance(period_to_field.year.validators[0], OptionalForm)
 
+    def test_disable_mandatory_does_not_modify_schema(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_date_range")
+            schema_json = deepcopy(schema.json)
+
+            block_json = schema.get_block("date-block")
+            location = Location(section_id="default-section", block_id="date-block")
+
+            get_form_for_location(
+                schema,
+                block_json,
+                location,
+                AnswerStore(),
+                metadata=None,
+                disable_mandatory=True,
+            )
+            post_form_for_block(
+                schema,
+                block_json,
+                AnswerStore(),
+                metadata=None,
+                request_form={},
+                disable_mandatory=True,
+                location=location,
+            )
+
+            self.assertEqual(schema.json, schema_json)
+
+            form = post_form_for_block(
+                schema,
+                block_json,
+                AnswerStore(),
+                metadata=None,
+                request_form={},
+                location=location,
+            )
+
+            period_from_field = getattr(form, "date-range-from-answer")
+            self.assertIsInstance(period_from_field.year.validators[0], DateRequired)
+
     def test_post_form_for_radio_other_not_selected(self):
         with self.app_request_context():
             schema = load_schema_from_name("test_radio_mandatory_with_mandatory_other")
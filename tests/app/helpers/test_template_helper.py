@@ -0,0 +1,9 @@
+from app.helpers.template_helper import safe_content
+
+
+def test_safe_content():
+    assert (
+        safe_content("<em>Does</em> {person_name} live here? - A survey")
+        == "Does … live here? - A survey"
+    )
+    assert safe_content(None) is None
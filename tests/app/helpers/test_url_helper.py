@@ -0,0 +1,80 @@
+import random
+import string
+
+import pytest
+from flask import url_for
+from mock import patch
+
+from app.helpers.url_helper import build_url
+
+ALPHABET = string.ascii_letters + string.digits + "-_.~/:?#&=%+ {}[]'\"" + "éü€日"
+
+ENDPOINT_ARGUMENTS = {
+    "questionnaire.block": ("block_id", "list_name", "list_item_id"),
+    "questionnaire.get_section": ("section_id", "list_item_id"),
+    "questionnaire.relationship": ("block_id", "list_item_id", "to_list_item_id"),
+}
+
+REQUIRED_ARGUMENTS = {
+    "questionnaire.block": {"block_id"},
+    "questionnaire.get_section": {"section_id"},
+    "questionnaire.relationship": {"block_id", "list_item_id", "to_list_item_id"},
+}
+
+
+def random_value(generator):
+    if generator.random() < 0.1:
+        return generator.randint(0, 1000)
+    return "".join(generator.choices(ALPHABET, k=generator.randint(1, 12)))
+
+
+def random_values(generator, endpoint):
+    values = {}
+    for argument in ENDPOINT_ARGUMENTS[endpoint]:
+        if argument in REQUIRED_ARGUMENTS[endpoint] or generator.random() < 0.6:
+            values[argument] = random_value(generator)
+        elif generator.random() < 0.5:
+            values[argument] = None
+
+    for query_argument in ("return_to", "previous"):
+        if generator.random() < 0.3:
+            values[query_argument] = random_value(generator)
+
+    arguments = list(values.items())
+    generator.shuffle(arguments)
+    return dict(arguments)
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINT_ARGUMENTS)
+@pytest.mark.parametrize("base_url", ["http://localhost/", "http://localhost/eq/"])
+def test_build_url_matches_url_for(app, endpoint, base_url):
+    generator = random.Random(endpoint + base_url)
+
+    with app.test_request_context(base_url=base_url):
+        for _ in range(300):
+            values = random_values(generator, endpoint)
+
+            assert build_url(endpoint, **values) == url_for(endpoint, **values)
+
+
+def test_build_url_without_request(app):
+    app.config["SERVER_NAME"] = "test.localdomain"
+
+    with app.app_context():
+        assert build_url("questionnaire.block", block_id="a-block") == url_for(
+            "questionnaire.block", block_id="a-block"
+        )
+
+
+def test_build_url_reuses_template(app):
+    with app.test_request_context():
+        build_url("questionnaire.block", block_id="first-block", return_to="hub")
+
+    with app.test_request_context():
+        with patch("app.helpers.url_helper.url_for") as patched_url_for:
+            url = build_url(
+                "questionnaire.block", block_id="second block", return_to="a b"
+            )
+
+    assert url == "/questionnaire/second%20block/?return_to=a+b"
+    patched_url_for.assert_not_called()
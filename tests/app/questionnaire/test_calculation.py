@@ -0,0 +1,241 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from app.data_model.answer import Answer
+from app.data_model.answer_store import AnswerStore
+from app.questionnaire.calculation import Calculation
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+
+
+def get_schema(answer_type="Currency", **answer_options):
+    def number_block(index):
+        return {
+            "id": f"number-block-{index}",
+            "type": "Question",
+            "question": {
+                "id": f"number-question-{index}",
+                "type": "General",
+                "answers": [
+                    {
+                        "id": f"number-answer-{index}",
+                        "type": answer_type,
+                        **answer_options,
+                    }
+                ],
+            },
+        }
+
+    return QuestionnaireSchema(
+        {
+            "sections": [
+                {
+                    "id": "section",
+                    "groups": [
+                        {
+                            "id": "group",
+                            "blocks": [
+                                number_block(1),
+                                number_block(2),
+                                {
+                                    "id": "breakdown-block",
+                                    "type": "Question",
+                                    "question": {
+                                        "id": "breakdown-question",
+                                        "type": "Calculated",
+                                        "currency": "EUR",
+                                        "calculations": [
+                                            {
+                                                "calculation_type": "sum",
+                                                "value": 10,
+                                                "answers_to_calculate": [
+                                                    "breakdown-1",
+                                                    "breakdown-2",
+                                                ],
+                                                "conditions": [
+                                                    "greater than",
+                                                    "equals",
+                                                ],
+                                            }
+                                        ],
+                                        "answers": [
+                                            {"id": "breakdown-1", "type": "Number"},
+                                            {"id": "breakdown-2", "type": "Number"},
+                                        ],
+                                    },
+                                },
+                                {
+                                    "id": "calculated-summary",
+                                    "type": "CalculatedSummary",
+                                    "calculation": {
+                                        "calculation_type": "sum",
+                                        "answers_to_calculate": [
+                                            "number-answer-2",
+                                            "number-answer-1",
+                                            "number-answer-2",
+                                        ],
+                                        "title": "Total",
+                                    },
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+
+
+def get_summary_calculation(schema):
+    return schema.get_calculation(schema.get_block("calculated-summary")["calculation"])
+
+
+def get_question_calculation(schema):
+    question = schema.get_block("breakdown-block")["question"]
+    return schema.get_calculation(question["calculations"][0], question)
+
+
+def test_evaluate_uses_decimal_arithmetic():
+    calculation = get_summary_calculation(get_schema())
+
+    total = calculation.evaluate([Decimal("0.1"), 0.2, None, "", 3, "1.50"])
+
+    assert total == Decimal("4.80")
+    assert isinstance(total, Decimal)
+
+
+def test_evaluate_without_values():
+    calculation = get_summary_calculation(get_schema())
+
+    assert calculation.evaluate([]) == Decimal(0)
+
+
+def test_compiled_calculation():
+    schema = get_schema()
+    calculation = get_summary_calculation(schema)
+
+    assert calculation.answer_ids == (
+        "number-answer-2",
+        "number-answer-1",
+        "number-answer-2",
+    )
+    assert calculation.block_ids == ("number-block-2", "number-block-1")
+    assert calculation is get_summary_calculation(schema)
+
+
+def test_question_calculation_target():
+    calculation = get_question_calculation(get_schema())
+
+    assert calculation.conditions == ("greater than", "equals")
+    assert calculation.currency == "EUR"
+    assert calculation.get_target_total(AnswerStore()) == 10
+
+
+def test_question_calculation_target_answer():
+    schema = get_schema(currency="GBP")
+    question = schema.get_block("breakdown-block")["question"]
+    calculation = schema.get_calculation(
+        {
+            "calculation_type": "sum",
+            "answer_id": "number-answer-1",
+            "answers_to_calculate": ["breakdown-1", "breakdown-2"],
+            "conditions": ["equals"],
+        },
+        question,
+    )
+    answer_store = AnswerStore()
+    answer_store.add_or_update(Answer("number-answer-1", Decimal("12.5")))
+
+    assert calculation.currency == "GBP"
+    assert calculation.get_target_total(answer_store) == Decimal("12.5")
+
+
+@pytest.mark.parametrize(
+    "answer_type, answer_options, expected_total",
+    [
+        ("Currency", {"currency": "GBP"}, "£1,234.50"),
+        ("Unit", {"unit": "length-meter", "unit_length": "short"}, "1,234.5 m"),
+        ("Percentage", {}, "1234.5%"),
+        ("Number", {}, "1,234.5"),
+    ],
+)
+def test_format_total(app, answer_type, answer_options, expected_total):
+    calculation = get_summary_calculation(get_schema(answer_type, **answer_options))
+
+    with app.test_request_context():
+        assert calculation.format_total(Decimal("1234.5")) == expected_total
+
+
+def test_invalid_calculation_type():
+    with pytest.raises(Exception) as exception:
+        Calculation(
+            {"calculation_type": "subtraction", "answers_to_calculate": []},
+            get_schema(),
+        )
+
+    assert str(exception.value) == "Invalid calculation_type: subtraction"
+
+
+def test_calculations_survive_pickling():
+    schema = pickle.loads(pickle.dumps(get_schema()))
+
+    calculation = get_summary_calculation(schema)
+
+    assert calculation is get_summary_calculation(schema)
+    assert calculation.block_ids == ("number-block-2", "number-block-1")
+
+
+def test_get_reduced_question():
+    schema = QuestionnaireSchema(
+        {
+            "sections": [
+                {
+                    "id": "section",
+                    "groups": [
+                        {
+                            "id": "group",
+                            "blocks": [
+                                {
+                                    "id": "number-block",
+                                    "type": "Question",
+                                    "question": {
+                                        "id": "number-question",
+                                        "type": "General",
+                                        "answers": [
+                                            {"id": "total-answer", "type": "Number"},
+                                            {"id": "other-answer", "type": "Number"},
+                                        ],
+                                    },
+                                },
+                                {
+                                    "id": "calculated-summary",
+                                    "type": "CalculatedSummary",
+                                    "calculation": {
+                                        "calculation_type": "sum",
+                                        "answers_to_calculate": ["total-answer"],
+                                    },
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+    calculation = get_summary_calculation(schema)
+    question = schema.get_block("number-block")["question"]
+
+    reduced_question = calculation.get_reduced_question("number-block", question)
+
+    assert [answer["id"] for answer in reduced_question["answers"]] == ["total-answer"]
+    assert len(question["answers"]) == 2
+    assert calculation.get_reduced_question("number-block", question) is (
+        reduced_question
+    )
+    assert (
+        calculation.get_reduced_question(
+            "number-block", {**question, "answers": question["answers"][1:]}
+        )
+        is None
+    )
@@ -1,6 +1,12 @@
+from mock import patch
+
+from app.data_model.answer import Answer
 from app.data_model.answer_store import AnswerStore
 from app.data_model.list_store import ListStore
-from app.questionnaire.placeholder_parser import PlaceholderParser
+from app.questionnaire.placeholder_parser import (
+    PlaceholderParser,
+    get_request_placeholder_values,
+)
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 
 
@@ -330,3 +336,32 @@ def test_chain_transform_placeholder():
 
     placeholders = parser(placeholder_list)
     assert placeholders["persons_name"] == "Joe Bloggs’"
+
+
+def test_placeholder_values_are_shared_within_a_request(app):
+    placeholder_list = [
+        {
+            "placeholder": "first_name",
+            "value": {"source": "answers", "identifier": "first-name"},
+        }
+    ]
+    answer_store = AnswerStore([{"answer_id": "first-name", "value": "Joe"}])
+
+    with app.test_request_context(), patch.object(
+        answer_store, "get_answer", wraps=answer_store.get_answer
+    ) as get_answer:
+        first_parser = PlaceholderParser(language="en", answer_store=answer_store)
+        second_parser = PlaceholderParser(language="en", answer_store=answer_store)
+
+        assert first_parser(placeholder_list)["first_name"] == "Joe"
+        assert second_parser(placeholder_list)["first_name"] == "Joe"
+        assert get_answer.call_count == 1
+        assert len(get_request_placeholder_values(answer_store, None)) == 1
+
+        answer_store.add_or_update(Answer("first-name", "Jane"))
+        assert not get_request_placeholder_values(answer_store, None)
+
+        third_parser = PlaceholderParser(language="en", answer_store=answer_store)
+
+        assert third_parser(placeholder_list)["first_name"] == "Jane"
+        assert get_answer.call_count == 2
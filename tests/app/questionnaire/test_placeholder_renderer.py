@@ -1,12 +1,11 @@
+from copy import deepcopy
 from unittest.mock import Mock, patch
 
 from app.data_model.answer_store import AnswerStore
 from app.data_model.list_store import ListStore
-from app.questionnaire.placeholder_renderer import (
-    PlaceholderRenderer,
-    find_pointers_containing,
-)
+from app.questionnaire.placeholder_renderer import PlaceholderRenderer
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.questionnaire.schema_utils import find_pointers_containing
 from tests.app.app_context_test_case import AppContextTestCase
 
 
@@ -158,6 +157,35 @@ class TestPlaceholderRenderer(AppContextTestCase):
 
         assert rendered_label == "Alfred Aho’s age is 33 years. Is this correct?"
 
+    def test_render_does_not_modify_schema(self):
+        schema = QuestionnaireSchema({"question": self.question_json})
+        question_json = schema.json["question"]
+        original_json = deepcopy(question_json)
+
+        renderer = PlaceholderRenderer(
+            language="en",
+            schema=schema,
+            answer_store=AnswerStore(
+                [
+                    {"answer_id": "first-name", "value": "Alfred"},
+                    {"answer_id": "last-name", "value": "Aho"},
+                    {"answer_id": "date-of-birth-answer", "value": "1986-01-01"},
+                ]
+            ),
+        )
+
+        rendered_schema = renderer.render(question_json, list_item_id=None)
+
+        assert question_json == original_json
+        assert rendered_schema["answers"][0]["options"][0]["label"].startswith(
+            "Alfred Aho’s age is"
+        )
+        assert rendered_schema["answers"] is not question_json["answers"]
+        assert (
+            rendered_schema["answers"][0]["options"][1]
+            is question_json["answers"][0]["options"][1]
+        )
+
     def test_renders_json_uses_language(self):
         mock_transform = {
             "transform": "calculate_date_difference",
@@ -282,3 +310,57 @@ def test_renders_text_plural_from_metadata():
     )
 
     assert rendered_text == "Yes, 100 people live here"
+
+
+def test_renders_placeholder_text_at_the_root():
+    placeholder_text = {
+        "text": "{person_name}",
+        "placeholders": [
+            {
+                "placeholder": "person_name",
+                "value": {"source": "answers", "identifier": "first-name"},
+            }
+        ],
+    }
+    schema = QuestionnaireSchema(placeholder_text)
+
+    renderer = PlaceholderRenderer(
+        language="en",
+        schema=schema,
+        answer_store=AnswerStore([{"answer_id": "first-name", "value": "Alfred"}]),
+    )
+
+    assert renderer.render(schema.json, list_item_id=None) == "Alfred"
+    assert renderer.render(deepcopy(schema.json), list_item_id=None) == "Alfred"
+
+
+def test_render_title_with_placeholders():
+    renderer = PlaceholderRenderer(
+        language="en",
+        schema=Mock(),
+        answer_store=AnswerStore(
+            [{"answer_id": "first-name", "value": "Alfred", "list_item_id": "abc123"}]
+        ),
+    )
+
+    rendered_title = renderer.render_title(
+        {
+            "text": "About {person_name}",
+            "placeholders": [
+                {
+                    "placeholder": "person_name",
+                    "value": {"source": "answers", "identifier": "first-name"},
+                }
+            ],
+        },
+        "abc123",
+    )
+
+    assert rendered_title == "About Alfred"
+
+
+def test_render_title_without_placeholders():
+    renderer = PlaceholderRenderer(language="en", schema=Mock())
+
+    assert renderer.render_title("About you", None) == "About you"
+    assert renderer.render_title(None, None) is None
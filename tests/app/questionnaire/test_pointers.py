@@ -1,6 +1,6 @@
 import unittest
 
-from app.questionnaire.placeholder_renderer import find_pointers_containing
+from app.questionnaire.schema_utils import find_pointers_containing
 
 
 class TestPointers(unittest.TestCase):
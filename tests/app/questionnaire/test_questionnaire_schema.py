@@ -1,3 +1,7 @@
+import pickle
+
+from mock import patch
+
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.questionnaire_schema import _get_values_for_key
 
@@ -345,3 +349,88 @@ def test_get_list_collectors_for_list(list_collector_variant_schema):
     )
 
     assert len(no_result) == 0
+
+
+def test_get_placeholder_sites():
+    title = {"text": "Hello {name}", "placeholders": []}
+    schema = QuestionnaireSchema(
+        {
+            "question": {
+                "title": title,
+                "answers": [{"label": "No placeholders"}, {"label": title}],
+            }
+        }
+    )
+    question = schema.json["question"]
+
+    assert schema.get_placeholder_sites(question) == (
+        ("title",),
+        ("answers", 1, "label"),
+    )
+    assert schema.get_placeholder_sites(question["answers"][0]) == ()
+    assert schema.get_placeholder_sites({"title": title}) == (("title",),)
+
+
+def test_placeholder_indexes_survive_pickling():
+    def name_placeholder():
+        return {"placeholder": "name", "value": "Joe"}
+
+    schema = pickle.loads(
+        pickle.dumps(
+            QuestionnaireSchema(
+                {
+                    "question": {
+                        "title": {
+                            "text": "{name}",
+                            "placeholders": [name_placeholder()],
+                        },
+                        "description": {
+                            "text": "{name}",
+                            "placeholders": [name_placeholder()],
+                        },
+                    }
+                }
+            )
+        )
+    )
+    question = schema.json["question"]
+
+    with patch(
+        "app.questionnaire.questionnaire_schema._index_placeholder_sites"
+    ) as index_placeholder_sites:
+        assert schema.get_placeholder_sites(question) == (("title",), ("description",))
+
+    index_placeholder_sites.assert_not_called()
+    assert schema.get_placeholder_definition_id(
+        question["title"]["placeholders"][0]
+    ) == schema.get_placeholder_definition_id(
+        question["description"]["placeholders"][0]
+    )
+
+
+def test_get_placeholder_definition_id():
+    def name_placeholder():
+        return {
+            "placeholder": "name",
+            "value": {"source": "answers", "identifier": "first-name"},
+        }
+
+    schema = QuestionnaireSchema(
+        {
+            "question": {
+                "title": {"text": "{name}", "placeholders": [name_placeholder()]},
+                "description": {"text": "{name}", "placeholders": [name_placeholder()]},
+            }
+        }
+    )
+    question = schema.json["question"]
+    title_placeholder = question["title"]["placeholders"][0]
+    description_placeholder = question["description"]["placeholders"][0]
+
+    assert title_placeholder is not description_placeholder
+    assert schema.get_placeholder_definition_id(
+        title_placeholder
+    ) == schema.get_placeholder_definition_id(description_placeholder)
+    assert schema.get_placeholder_definition_id(
+        name_placeholder()
+    ) != schema.get_placeholder_definition_id(title_placeholder)
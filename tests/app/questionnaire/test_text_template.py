@@ -0,0 +1,34 @@
+import pytest
+from jinja2 import Markup
+
+from app.questionnaire.text_template import TextTemplate, get_text_template
+
+VALUES = {"person_name": Markup("Joe &amp; Jane"), "age": 3, "missing": None}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{person_name} is {age}",
+        "{person_name} is {age} years old",
+        "No placeholders",
+        "",
+        "{{escaped}} {person_name} {{",
+        "{missing}",
+        "{age:>3}",
+        "{person_name!r}",
+    ],
+)
+def test_format_matches_str_format(text):
+    assert TextTemplate(text).format(VALUES) == text.format(**VALUES)
+
+
+def test_format_missing_value():
+    with pytest.raises(KeyError):
+        TextTemplate("{unknown}").format(VALUES)
+
+
+def test_template_is_shared():
+    assert get_text_template("{person_name} is {age}") is get_text_template(
+        "{person_name} is {age}"
+    )
@@ -58,6 +58,43 @@ class TestDatastore(AppContextTestCase):
             exception.exception.args[0], "Unique key checking not supported"
         )
 
+    def test_get_by_keys(self):
+        models = [QuestionnaireState(user_id, "data", 1) for user_id in ("1", "2")]
+        entities = []
+        for model in models:
+            entity = google_datastore.Entity()
+            entity.update(QuestionnaireStateSchema().dump(model))
+            entities.append(entity)
+        self.mock_client.get_multi.return_value = entities
+
+        returned_models = self.ds.get_by_keys(QuestionnaireState, ["1", "2", "3"])
+
+        self.assertEqual(self.mock_client.get_multi.call_count, 1)
+        self.assertEqual(len(self.mock_client.get_multi.call_args[0][0]), 3)
+        self.assertEqual(set(returned_models), {"1", "2"})
+        self.assertEqual(returned_models["1"].state_data, "data")
+
+    def test_get_by_keys_is_batched(self):
+        self.mock_client.get_multi.return_value = []
+
+        with mock.patch("app.storage.datastore.MAX_BATCH_SIZE", 2):
+            self.ds.get_by_keys(QuestionnaireState, ["1", "2", "3"])
+
+        self.assertEqual(self.mock_client.get_multi.call_count, 2)
+
+    def test_delete_many(self):
+        models = [QuestionnaireState(user_id, "data", 1) for user_id in ("1", "2")]
+
+        self.ds.delete_many(models)
+
+        self.assertEqual(
+            [key_call[0][1] for key_call in self.mock_client.key.call_args_list],
+            ["1", "2"],
+        )
+        self.mock_client.delete_multi.assert_called_once_with(
+            [self.mock_client.key.return_value] * 2
+        )
+
     def test_delete(self):
         model = QuestionnaireState("someuser", "data", 1)
         self.ds.delete(model)
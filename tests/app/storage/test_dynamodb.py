@@ -59,6 +59,26 @@ class TestDynamo(AppContextTestCase):
         self.ddb.delete(model)
         self._assert_item(None)
 
+    def test_get_by_keys(self):
+        for user_id in ("user-1", "user-2"):
+            self.ddb.put(QuestionnaireState(user_id, "data", 1))
+
+        models = self.ddb.get_by_keys(
+            QuestionnaireState, ["user-1", "user-2", "missing-user"]
+        )
+
+        self.assertEqual(set(models), {"user-1", "user-2"})
+        self.assertEqual(models["user-1"].state_data, "data")
+
+    def test_delete_many(self):
+        models = [QuestionnaireState(user_id, "data", 1) for user_id in ("1", "2")]
+        for model in models:
+            self.ddb.put(model)
+
+        self.ddb.delete_many(models)
+
+        self.assertEqual(self.ddb.get_by_keys(QuestionnaireState, ["1", "2"]), {})
+
     def _assert_item(self, version):
         item = self.ddb.get_by_key(QuestionnaireState, "someuser")
         actual_version = item.version if item else None
@@ -1,4 +1,5 @@
 from flask import current_app
+from mock import patch
 
 from app.data_model.app_models import QuestionnaireState
 from app.data_model.questionnaire_store import QuestionnaireStore
@@ -54,6 +55,22 @@ class TestEncryptedQuestionnaireStorage(AppContextTestCase):
             (data, QuestionnaireStore.LATEST_VERSION), self.storage.get_user_data()
         )
 
+    def test_get_uses_prefetched_questionnaire_state(self):
+        self.storage.save("test")
+        questionnaire_state = current_app.eq["storage"].get_by_key(
+            QuestionnaireState, "user_id"
+        )
+
+        with patch.object(current_app.eq["storage"], "get_by_key") as get_by_key:
+            storage = EncryptedQuestionnaireStorage(
+                "user_id", "user_ik", "pepper", questionnaire_state=questionnaire_state
+            )
+
+            self.assertEqual(
+                ("test", QuestionnaireStore.LATEST_VERSION), storage.get_user_data()
+            )
+            get_by_key.assert_not_called()
+
     def test_delete(self):
         data = "test"
         self.storage.save(data)
@@ -0,0 +1,91 @@
+from collections import defaultdict
+
+from pika.exceptions import AMQPConnectionError, ChannelClosed, NackError
+
+
+class FakeBroker:
+    """
+    An in-process stand-in for a pair of RabbitMQ hosts, shaped like the parts
+    of `pika.BlockingConnection` the submitters use.
+
+    Patch `BlockingConnection` with `broker.connect` and pass URLs for hosts
+    named in `hosts`.
+    """
+
+    def __init__(self, hosts=("host1", "host2")):
+        self.available = set(hosts)
+        self.queues = defaultdict(list)
+        self.connections = []
+        self.declared = []
+        self.nack_after = None
+
+    def connect(self, parameters):
+        if parameters.host not in self.available:
+            raise AMQPConnectionError(f"{parameters.host} unavailable")
+
+        connection = FakeConnection(self, parameters.host)
+        self.connections.append(connection)
+        return connection
+
+    def fail(self, host):
+        self.available.discard(host)
+        for connection in self.connections:
+            if connection.host == host:
+                connection.is_open = False
+
+    def published(self, queue):
+        return [body for _, body, _ in self.queues[queue]]
+
+
+class FakeConnection:
+    def __init__(self, broker, host):
+        self.broker = broker
+        self.host = host
+        self.is_open = True
+        self.channels = []
+
+    def channel(self):
+        channel = FakeChannel(self)
+        self.channels.append(channel)
+        return channel
+
+    def close(self):
+        self.is_open = False
+
+    def process_data_events(self, time_limit=0):  # pylint: disable=unused-argument
+        if not self.is_open:
+            raise AMQPConnectionError("connection closed")
+
+
+class FakeChannel:
+    def __init__(self, connection):
+        self.connection = connection
+        self.confirming = False
+        self._is_open = True
+
+    @property
+    def is_open(self):
+        return self._is_open and self.connection.is_open
+
+    def confirm_delivery(self):
+        self.confirming = True
+
+    def queue_declare(self, queue, durable=False):
+        self.connection.broker.declared.append((self.connection.host, queue, durable))
+
+    def basic_publish(
+        self, exchange, routing_key, body, properties=None, mandatory=False
+    ):  # pylint: disable=unused-argument, too-many-arguments
+        broker = self.connection.broker
+        if not self.is_open:
+            raise ChannelClosed(504, "channel closed")
+
+        if broker.nack_after is not None:
+            if broker.nack_after == 0:
+                raise NackError([body])
+            broker.nack_after -= 1
+
+        broker.queues[routing_key].append((self.connection.host, body, properties))
+
+    def close(self):
+        self._is_open = False
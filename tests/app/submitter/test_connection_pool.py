@@ -0,0 +1,184 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from mock import patch
+from pika.exceptions import AMQPConnectionError, NackError
+
+from app.submitter.connection_pool import (
+    ConnectionPoolExhaustedError,
+    RabbitMQConnectionPool,
+)
+from tests.app.submitter.fake_broker import FakeBroker
+
+QUEUE = "submit_q"
+URLS = ["amqp://host1:5672/%2F", "amqp://host2:5672/%2F"]
+
+
+@pytest.fixture
+def broker():
+    fake_broker = FakeBroker()
+    with patch("app.submitter.connection_pool.BlockingConnection", fake_broker.connect):
+        yield fake_broker
+
+
+@pytest.fixture
+def pool(broker):  # pylint: disable=unused-argument
+    connection_pool = RabbitMQConnectionPool(URLS, QUEUE, size=2, checkout_timeout=0)
+    yield connection_pool
+    connection_pool.close()
+
+
+def publish(channel, body):
+    channel.basic_publish(exchange="", routing_key=QUEUE, body=body)
+
+
+def test_channel_is_reused_between_checkouts(broker, pool):
+    for body in ("first", "second"):
+        with pool.channel() as channel:
+            publish(channel, body)
+
+    assert len(broker.connections) == 1
+    assert broker.published(QUEUE) == ["first", "second"]
+
+
+def test_channel_is_in_confirm_mode(pool):
+    with pool.channel() as channel:
+        assert channel.confirming
+
+
+def test_queue_is_declared_once_per_host(broker, pool):
+    with pool.channel(), pool.channel():
+        pass
+
+    assert len(broker.connections) == 2
+    assert broker.declared == [("host1", QUEUE, True)]
+
+
+def test_concurrent_checkouts_get_separate_channels(pool):
+    with pool.channel() as first, pool.channel() as second:
+        assert first is not second
+
+
+def test_checkout_fails_when_pool_exhausted(pool):
+    with pool.channel(), pool.channel():
+        with pytest.raises(ConnectionPoolExhaustedError):
+            with pool.channel():
+                pass
+
+
+def test_slot_is_released_after_error(broker, pool):
+    broker.nack_after = 0
+
+    for _ in range(3):
+        with pytest.raises(NackError):
+            with pool.channel() as channel:
+                publish(channel, "message")
+
+
+def test_channel_is_discarded_after_error(broker, pool):
+    broker.nack_after = 0
+    with pytest.raises(NackError):
+        with pool.channel() as channel:
+            publish(channel, "message")
+
+    broker.nack_after = None
+    with pool.channel() as channel:
+        publish(channel, "message")
+
+    assert len(broker.connections) == 2
+    assert not broker.connections[0].is_open
+
+
+def test_unhealthy_connection_is_replaced_on_checkout(broker, pool):
+    with pool.channel():
+        pass
+    broker.connections[0].is_open = False
+
+    with pool.channel() as channel:
+        publish(channel, "message")
+
+    assert len(broker.connections) == 2
+    assert broker.published(QUEUE) == ["message"]
+
+
+def test_fails_over_to_secondary(broker, pool):
+    broker.fail("host1")
+
+    with pool.channel() as channel:
+        publish(channel, "message")
+
+    assert broker.queues[QUEUE][0][0] == "host2"
+
+
+def test_returns_to_primary_for_new_connections(broker, pool):
+    broker.fail("host1")
+    with pool.channel():
+        pass
+    broker.available.add("host1")
+
+    with pool.channel(), pool.channel():
+        pass
+
+    assert [connection.host for connection in broker.connections] == ["host2", "host1"]
+
+
+def test_reconnect_backs_off_after_all_hosts_fail(broker, pool):
+    broker.fail("host1")
+    broker.fail("host2")
+
+    with pytest.raises(AMQPConnectionError):
+        with pool.channel():
+            pass
+
+    broker.available.update({"host1", "host2"})
+
+    with pytest.raises(AMQPConnectionError, match="not reconnecting"):
+        with pool.channel():
+            pass
+
+    with patch("app.submitter.connection_pool.time.monotonic", return_value=10 ** 9):
+        with pool.channel():
+            pass
+
+    assert len(broker.connections) == 1
+
+
+def test_backoff_increases_up_to_maximum(broker):
+    broker.fail("host1")
+    broker.fail("host2")
+    pool = RabbitMQConnectionPool(URLS, QUEUE, initial_backoff=1, max_backoff=3)
+
+    backoffs = []
+    for attempt in range(4):
+        with patch(
+            "app.submitter.connection_pool.time.monotonic", return_value=attempt * 100
+        ):
+            with pytest.raises(AMQPConnectionError):
+                with pool.channel():
+                    pass
+        backoffs.append(pool._backoff)  # pylint: disable=protected-access
+
+    assert backoffs == [1, 2, 3, 3]
+
+
+def test_close_closes_idle_connections(broker, pool):
+    with pool.channel(), pool.channel():
+        pass
+
+    pool.close()
+
+    assert not any(connection.is_open for connection in broker.connections)
+
+
+def test_close_logs_error_when_connection_fails_to_close(broker, pool):
+    with pool.channel():
+        pass
+    error = AMQPConnectionError()
+
+    with patch.object(broker.connections[0], "close", side_effect=error), patch(
+        "app.submitter.connection_pool.logger"
+    ) as logger:
+        pool.close()
+
+    logger.error.assert_called_once_with(
+        "unable to close connection", category="rabbitmq", exc_info=error
+    )
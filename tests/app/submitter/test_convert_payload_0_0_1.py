@@ -1,7 +1,10 @@
+from mock import patch
+
 from app.data_model.answer_store import AnswerStore
 from app.data_model.answer import Answer
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.routing_path import RoutingPath
+from app.questionnaire.schema_utils import choose_question_to_display
 from app.submitter.convert_payload_0_0_1 import convert_answers_to_payload_0_0_1
 from app.submitter.converter import convert_answers
 from tests.app.submitter.schema import make_schema
@@ -607,3 +610,69 @@ def test_unit_answer(fake_questionnaire_store):
     # Then
     assert len(answer_object["data"]) == 1
     assert answer_object["data"]["1"] == "10"
+
+
+def test_question_variant_chosen_once_per_block(fake_questionnaire_store):
+    fake_questionnaire_store.answer_store = AnswerStore(
+        [
+            create_answer("variant-answer", "second"),
+            create_answer("first-answer", "1"),
+            create_answer("second-answer", "2"),
+        ]
+    )
+
+    def variant(condition_value, q_codes):
+        return {
+            "question": {
+                "id": "question-1",
+                "answers": [
+                    {"id": "first-answer", "type": "TextField", "q_code": q_codes[0]},
+                    {"id": "second-answer", "type": "TextField", "q_code": q_codes[1]},
+                ],
+            },
+            "when": [
+                {
+                    "id": "variant-answer",
+                    "condition": "equals",
+                    "value": condition_value,
+                }
+            ],
+        }
+
+    questionnaire = make_schema(
+        "0.0.1",
+        "section-1",
+        "group-1",
+        "variant-block",
+        {
+            "id": "variant-question",
+            "answers": [{"id": "variant-answer", "type": "TextField"}],
+        },
+    )
+    questionnaire["sections"][0]["groups"][0]["blocks"].append(
+        {
+            "id": "block-1",
+            "type": "Question",
+            "question_variants": [
+                variant("first", ("001", "002")),
+                variant("second", ("003", "004")),
+            ],
+        }
+    )
+
+    routing_path = RoutingPath(["variant-block", "block-1"], section_id="section-1")
+
+    with patch(
+        "app.submitter.convert_payload_0_0_1.choose_question_to_display",
+        wraps=choose_question_to_display,
+    ) as choose_question:
+        answer_object = convert_answers_to_payload_0_0_1(
+            fake_questionnaire_store.metadata,
+            fake_questionnaire_store.answer_store,
+            fake_questionnaire_store.list_store,
+            QuestionnaireSchema(questionnaire),
+            routing_path,
+        )
+
+    assert answer_object == {"003": "1", "004": "2"}
+    assert choose_question.call_count == 2
@@ -2,9 +2,19 @@ from datetime import datetime, timedelta
 
 import dateutil.parser
 import pytest
+import simplejson as json
+from mock import patch
 
+from app.data_model.answer_store import AnswerStore
+from app.data_model.list_store import ListStore
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
-from app.submitter.converter import convert_answers, DataVersionError
+from app.questionnaire.routing_path import RoutingPath
+from app.submitter.converter import (
+    convert_answers,
+    convert_answers_to_json,
+    DataVersionError,
+)
+from tests.app.submitter.schema import load_schema, make_schema
 
 
 def test_convert_answers_flushed_flag_default_is_false(
@@ -146,3 +156,93 @@ def test_converter_raises_runtime_error_for_unsupported_version(
         )
 
     assert "Data version -0.0.1 not supported" in str(err.value)
+
+
+def test_convert_answers_to_json_matches_convert_answers(
+    fake_questionnaire_store, monkeypatch
+):
+    monkeypatch.setattr("app.submitter.converter.ANSWERS_PER_JSON_CHUNK", 2)
+    routing_path = [
+        RoutingPath(
+            ["list-collector", "next-interstitial", "another-list-collector-block"],
+            section_id="section-1",
+        )
+    ]
+    fake_questionnaire_store.answer_store = AnswerStore(
+        [
+            {"answer_id": "first-name", "value": "1", "list_item_id": "xJlKBy"},
+            {"answer_id": "last-name", "value": "1", "list_item_id": "xJlKBy"},
+            {"answer_id": "first-name", "value": "2", "list_item_id": "RfAGDc"},
+            {"answer_id": "anyone-else", "value": "No"},
+            {"answer_id": "another-anyone-else", "value": "No"},
+            {"answer_id": "extraneous-answer", "value": "Bad", "list_item_id": "123"},
+        ]
+    )
+    fake_questionnaire_store.list_store = ListStore(
+        existing_items=[{"name": "people", "items": ["xJlKBy", "RfAGDc"]}]
+    )
+    schema = load_schema("test_list_collector")
+
+    with patch("app.submitter.converter.datetime") as mock_datetime:
+        mock_datetime.utcnow.return_value = datetime(2020, 3, 22, 12)
+        expected = json.dumps(
+            convert_answers(schema, fake_questionnaire_store, routing_path),
+            for_json=True,
+        )
+        message = convert_answers_to_json(
+            schema, fake_questionnaire_store, routing_path
+        )
+
+    assert message == expected
+    message = json.loads(message)
+    assert [answer["answer_id"] for answer in message["data"]["answers"]] == [
+        "first-name",
+        "last-name",
+        "first-name",
+        "anyone-else",
+        "another-anyone-else",
+    ]
+
+
+def test_convert_answers_to_json_for_0_0_1(fake_questionnaire_store):
+    routing_path = RoutingPath(["crisps"], section_id="food")
+    fake_questionnaire_store.answer_store = AnswerStore(
+        [{"answer_id": "crisps-answer", "value": "Ready salted"}]
+    )
+    question = {
+        "id": "crisps-question",
+        "answers": [{"id": "crisps-answer", "type": "TextField", "q_code": "1"}],
+    }
+    schema = QuestionnaireSchema(
+        make_schema("0.0.1", "section-1", "favourite-food", "crisps", question)
+    )
+
+    message = json.loads(
+        convert_answers_to_json(
+            schema, fake_questionnaire_store, routing_path, flushed=True
+        )
+    )
+
+    assert message["data"] == {"1": "Ready salted"}
+    assert message["flushed"]
+
+
+def test_convert_answers_to_json_raises_error_for_unsupported_version(
+    fake_questionnaire_store
+):
+    questionnaire = {"survey_id": "021", "data_version": "-0.0.1"}
+
+    with pytest.raises(DataVersionError):
+        convert_answers_to_json(
+            QuestionnaireSchema(questionnaire), fake_questionnaire_store, {}
+        )
+
+
+def test_convert_answers_to_json_without_answers(
+    fake_questionnaire_schema, fake_questionnaire_store
+):
+    message = json.loads(
+        convert_answers_to_json(fake_questionnaire_schema, fake_questionnaire_store, [])
+    )
+
+    assert message["data"] == {"answers": [], "lists": []}
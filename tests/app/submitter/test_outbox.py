@@ -0,0 +1,247 @@
+# pylint: disable=redefined-outer-name
+import os
+
+import pytest
+from mock import patch
+
+from app.submitter.connection_pool import RabbitMQConnectionPool
+from app.submitter.outbox import FileSystemOutbox, OutboxSender, OutboxSubmitter
+from tests.app.submitter.fake_broker import FakeBroker
+
+QUEUE = "submit_q"
+PRIMARY_URL = "amqp://host1:5672/%2F"
+SECONDARY_URL = "amqp://host2:5672/%2F"
+
+
+def create_pool():
+    return RabbitMQConnectionPool(
+        [PRIMARY_URL, SECONDARY_URL], QUEUE, size=1, initial_backoff=0
+    )
+
+
+@pytest.fixture
+def outbox(tmpdir):
+    return FileSystemOutbox(str(tmpdir))
+
+
+@pytest.fixture
+def broker():
+    fake_broker = FakeBroker()
+    with patch("app.submitter.connection_pool.BlockingConnection", fake_broker.connect):
+        yield fake_broker
+
+
+@pytest.fixture
+def sender(outbox, broker):  # pylint: disable=unused-argument
+    outbox_sender = OutboxSender(outbox, create_pool(), batch_size=2)
+    yield outbox_sender
+    outbox_sender.stop()
+
+
+def test_submitter_queues_message(outbox):
+    submitter = OutboxSubmitter(outbox)
+
+    assert submitter.send_message("message", tx_id="123", questionnaire_id="0123")
+    assert len(outbox) == 1
+
+    entry = outbox.claim(1)[0]
+    assert entry.message == "message"
+    assert entry.headers == {"tx_id": "123", "questionnaire_id": "0123"}
+
+
+def test_submitter_returns_false_when_outbox_unwritable(outbox):
+    submitter = OutboxSubmitter(outbox)
+
+    with patch("app.submitter.outbox.open", side_effect=OSError):
+        assert not submitter.send_message("message", "123", "0123", "456")
+
+    assert not outbox
+
+
+def test_claim_returns_records_in_enqueue_order(outbox):
+    for tx_id in ("1", "2", "3"):
+        outbox.put(f"message-{tx_id}", tx_id, "0123", case_id="456")
+
+    entries = outbox.claim(2)
+
+    assert [entry.headers["tx_id"] for entry in entries] == ["1", "2"]
+    assert entries[0].headers["case_id"] == "456"
+    assert len(outbox) == 1
+
+
+def test_unacknowledged_claims_are_reclaimed_first(outbox):
+    outbox.put("first", "1", "0123")
+    outbox.put("second", "2", "0123")
+
+    outbox.claim(1)
+    entries = outbox.claim(2)
+
+    assert [entry.message for entry in entries] == ["first", "second"]
+
+
+def test_unreadable_records_are_moved_to_failed(outbox):
+    outbox.put("first", "1", "0123")
+    with open(os.path.join(outbox.pending_directory, "1-bad.json"), "w") as bad:
+        bad.write("{not json")
+    outbox.put("second", "2", "0123")
+
+    entries = outbox.claim(3)
+
+    assert [entry.message for entry in entries] == ["first", "second"]
+    assert os.listdir(outbox.failed_directory) == ["1-bad.json"]
+    assert not outbox
+
+
+def test_recover_returns_records_claimed_by_stopped_process(outbox):
+    outbox.put("message", "1", "0123")
+
+    with patch("app.submitter.outbox.os.getpid", return_value=999999999):
+        outbox.claim(1)
+        stopped_worker_claim_directory = outbox.claim_directory
+    assert not outbox
+
+    assert outbox.recover() == 1
+    assert len(outbox) == 1
+    assert not os.path.exists(stopped_worker_claim_directory)
+
+
+def test_recover_leaves_records_claimed_by_running_process(outbox):
+    outbox.put("message", "1", "0123")
+
+    with patch("app.submitter.outbox.os.getpid", return_value=1):
+        outbox.claim(1)
+
+    assert outbox.recover() == 0
+    assert not outbox
+
+
+def test_drain_publishes_all_records_in_batches(outbox, broker, sender):
+    for tx_id in ("1", "2", "3"):
+        outbox.put(f"message-{tx_id}", tx_id, "0123")
+
+    assert sender.drain() == 3
+
+    assert broker.published(QUEUE) == ["message-1", "message-2", "message-3"]
+    assert not outbox
+    assert not outbox.claim(10)
+
+
+def test_drain_reuses_connection_and_declares_queue_once(outbox, broker, sender):
+    outbox.put("first", "1", "0123")
+    sender.drain()
+    outbox.put("second", "2", "0123")
+    sender.drain()
+
+    assert len(broker.connections) == 1
+    assert broker.declared == [("host1", QUEUE, True)]
+    assert broker.connections[0].channels[0].confirming
+
+
+def test_drain_sets_message_headers(outbox, broker, sender):
+    outbox.put("message", "123", "0123", case_id="456")
+
+    sender.drain()
+
+    _, _, properties = broker.queues[QUEUE][0]
+    assert properties.delivery_mode == 2
+    assert properties.headers == {
+        "tx_id": "123",
+        "questionnaire_id": "0123",
+        "case_id": "456",
+    }
+
+
+def test_drain_fails_over_to_secondary(outbox, broker, sender):
+    broker.fail("host1")
+    outbox.put("message", "1", "0123")
+
+    assert sender.drain() == 1
+    assert broker.queues[QUEUE][0][0] == "host2"
+
+
+def test_drain_fails_over_when_connection_lost(outbox, broker, sender):
+    outbox.put("first", "1", "0123")
+    sender.drain()
+
+    broker.fail("host1")
+    outbox.put("second", "2", "0123")
+
+    assert sender.drain() == 1
+    assert [host for host, _, _ in broker.queues[QUEUE]] == ["host1", "host2"]
+
+
+def test_nacked_records_stay_in_outbox(outbox, broker, sender):
+    for tx_id in ("1", "2"):
+        outbox.put(f"message-{tx_id}", tx_id, "0123")
+    broker.nack_after = 1
+
+    assert sender.drain() == 1
+    assert broker.published(QUEUE) == ["message-1"]
+
+    broker.nack_after = None
+    assert sender.drain() == 1
+    assert broker.published(QUEUE) == ["message-1", "message-2"]
+
+
+def test_drain_keeps_records_when_no_host_available(outbox, broker, sender):
+    broker.fail("host1")
+    broker.fail("host2")
+    outbox.put("message", "1", "0123")
+
+    assert sender.drain() == 0
+    assert outbox.claim(1)[0].message == "message"
+
+
+def test_sender_is_started_once_in_each_process(outbox):
+    sender = OutboxSender(outbox, create_pool())
+
+    with patch.object(sender, "start") as start:
+        sender.ensure_started()
+        sender.ensure_started()
+        assert start.call_count == 1
+
+        with patch("app.submitter.outbox.os.getpid", return_value=1):
+            sender.ensure_started()
+        assert start.call_count == 2
+
+
+def test_background_sender_drains_outbox(outbox, broker):
+    sender = OutboxSender(outbox, create_pool(), poll_interval=0.01)
+    outbox.put("message", "1", "0123")
+
+    sender.start()
+    try:
+        for _ in range(500):
+            if broker.published(QUEUE):
+                break
+            sender._stopped.wait(0.01)  # pylint: disable=protected-access
+    finally:
+        sender.stop(timeout=1)
+
+    assert broker.published(QUEUE) == ["message"]
+
+
+def test_background_sender_survives_unexpected_errors(outbox, broker):
+    sender = OutboxSender(outbox, create_pool(), poll_interval=0.01)
+    outbox.put("message", "1", "0123")
+
+    claim = outbox.claim
+    claims = []
+
+    def claim_failing_once(limit):
+        claims.append(limit)
+        if len(claims) == 1:
+            raise RuntimeError()
+        return claim(limit)
+
+    with patch.object(outbox, "claim", side_effect=claim_failing_once):
+        sender.start()
+        try:
+            for _ in range(500):
+                if broker.published(QUEUE):
+                    break
+                sender._stopped.wait(0.01)  # pylint: disable=protected-access
+        finally:
+            sender.stop(timeout=1)
+
+    assert broker.published(QUEUE) == ["message"]
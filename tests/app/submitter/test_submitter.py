@@ -2,7 +2,7 @@ import uuid
 from unittest import TestCase
 
 from mock import patch, Mock, call
-from pika.exceptions import AMQPError
+from pika.exceptions import AMQPError, NackError
 
 from app.submitter.submitter import RabbitMQSubmitter, GCSSubmitter
 
@@ -20,7 +20,7 @@ class TestRabbitMQSubmitter(TestCase):
 
     def test_when_fail_to_connect_to_queue_then_published_false(self):
         # Given
-        with patch("app.submitter.submitter.BlockingConnection") as connection:
+        with patch("app.submitter.connection_pool.BlockingConnection") as connection:
             connection.side_effect = AMQPError()
 
             # When
@@ -36,7 +36,7 @@ class TestRabbitMQSubmitter(TestCase):
 
     def test_when_message_sent_then_published_true(self):
         # Given
-        with patch("app.submitter.submitter.BlockingConnection"):
+        with patch("app.submitter.connection_pool.BlockingConnection"):
             published = self.submitter.send_message(
                 message={},
                 tx_id="123",
@@ -51,8 +51,10 @@ class TestRabbitMQSubmitter(TestCase):
 
     def test_when_first_connection_fails_then_secondary_succeeds(self):
         # Given
-        with patch("app.submitter.submitter.BlockingConnection") as connection, patch(
-            "app.submitter.submitter.URLParameters"
+        with patch(
+            "app.submitter.connection_pool.BlockingConnection"
+        ) as connection, patch(
+            "app.submitter.connection_pool.URLParameters"
         ) as url_parameters:
             secondary_connection = Mock()
             connection.side_effect = [AMQPError(), secondary_connection]
@@ -78,8 +80,10 @@ class TestRabbitMQSubmitter(TestCase):
 
     def test_url_generation_with_credentials(self):
         # Given
-        with patch("app.submitter.submitter.BlockingConnection") as connection, patch(
-            "app.submitter.submitter.URLParameters"
+        with patch(
+            "app.submitter.connection_pool.BlockingConnection"
+        ) as connection, patch(
+            "app.submitter.connection_pool.URLParameters"
         ) as url_parameters:
             secondary_connection = Mock()
             connection.side_effect = [AMQPError(), secondary_connection]
@@ -123,37 +127,32 @@ class TestRabbitMQSubmitter(TestCase):
             # Check we create connection twice, failing first then with self.url2
             self.assertEqual(connection.call_count, 2)
 
-    def test_when_fail_to_disconnect_then_log_warning_message(self):
+    def test_when_messages_sent_then_connection_is_reused(self):
         # Given
-        connection = Mock()
-        error = AMQPError()
-        connection.close.side_effect = [error]
-
-        with patch(
-            "app.submitter.submitter.BlockingConnection", return_value=connection
-        ), patch("app.submitter.submitter.logger") as logger:
+        with patch("app.submitter.connection_pool.BlockingConnection") as connection:
             # When
-            published = self.submitter.send_message(
-                message={},
-                tx_id="123",
-                questionnaire_id="0123456789000000",
-                case_id="456",
-            )
+            for tx_id in ("123", "456"):
+                self.submitter.send_message(
+                    message={}, tx_id=tx_id, questionnaire_id="0123456789000000"
+                )
 
             # Then
-            self.assertTrue(published)
-            logger.error.assert_called_once_with(
-                "unable to close connection", category="rabbitmq", exc_info=error
+            self.assertEqual(connection.call_count, 1)
+            channel = connection.return_value.channel.return_value
+            channel.confirm_delivery.assert_called_once()
+            channel.queue_declare.assert_called_once_with(
+                queue=self.queue, durable=True
             )
+            self.assertEqual(channel.basic_publish.call_count, 2)
 
     def test_when_fail_to_publish_message_then_returns_false(self):
         # Given
         channel = Mock()
-        channel.basic_publish = Mock(return_value=False)
+        channel.basic_publish = Mock(side_effect=NackError([]))
         connection = Mock()
         connection.channel.side_effect = Mock(return_value=channel)
         with patch(
-            "app.submitter.submitter.BlockingConnection", return_value=connection
+            "app.submitter.connection_pool.BlockingConnection", return_value=connection
         ):
             # When
             published = self.submitter.send_message(
@@ -172,7 +171,7 @@ class TestRabbitMQSubmitter(TestCase):
         connection = Mock()
         connection.channel.side_effect = Mock(return_value=channel)
         with patch(
-            "app.submitter.submitter.BlockingConnection", return_value=connection
+            "app.submitter.connection_pool.BlockingConnection", return_value=connection
         ):
             # When
             self.submitter.send_message(
@@ -196,7 +195,7 @@ class TestRabbitMQSubmitter(TestCase):
         connection = Mock()
         connection.channel.side_effect = Mock(return_value=channel)
         with patch(
-            "app.submitter.submitter.BlockingConnection", return_value=connection
+            "app.submitter.connection_pool.BlockingConnection", return_value=connection
         ):
             # When
             self.submitter.send_message(
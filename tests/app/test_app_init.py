@@ -1,6 +1,14 @@
+import os
+import tempfile
 import unittest
-from app.setup import get_minimized_asset
+
+from jinja2 import Environment
+from jinja2.bccache import Bucket
+from mock import patch
+
+from app.setup import TemplateBytecodeCache, create_app, get_minimized_asset
 from app import settings
+from scripts.precompile_templates import create_template_app
 
 
 class TestAppInit(unittest.TestCase):
@@ -19,5 +27,64 @@ class TestAppInit(unittest.TestCase):
         self.assertEqual(filename, get_minimized_asset(filename))
 
 
+class TestTemplates(unittest.TestCase):
+    def test_warm_up_fills_bytecode_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            application = create_app(
+                {"EQ_JINJA_BYTECODE_CACHE_DIR": cache_dir, "EQ_WARM_UP_TEMPLATES": True}
+            )
+
+            # pylint: disable=no-member
+            template_count = len(application.jinja_env.list_templates())
+            self.assertEqual(len(application.jinja_env.cache), template_count)
+            self.assertEqual(len(os.listdir(cache_dir)), template_count)
+
+    def test_bytecode_cache_is_keyed_on_environment(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TemplateBytecodeCache(cache_dir)
+            environment = Environment()
+
+            bucket = cache.get_bucket(environment, "template", None, "{{ greeting }}")
+            bucket.code = compile("", "template", "exec")
+            cache.set_bucket(bucket)
+
+            same_bucket = cache.get_bucket(
+                environment, "template", None, "{{ greeting }}"
+            )
+            self.assertIsNotNone(same_bucket.code)
+
+            environment.add_extension("jinja2.ext.do")
+            changed_bucket = cache.get_bucket(
+                environment, "template", None, "{{ greeting }}"
+            )
+            self.assertIsNone(changed_bucket.code)
+
+    def test_bytecode_cache_key_includes_jinja_version(self):
+        environment = Environment()
+        key = TemplateBytecodeCache.get_environment_key(environment)
+
+        with patch("app.setup.jinja2.__version__", "0.0.0"):
+            self.assertNotEqual(
+                key, TemplateBytecodeCache.get_environment_key(environment)
+            )
+
+    def test_precompiled_templates_are_compiled_in_the_app_environment(self):
+        application = create_app()
+        template_application = create_template_app()
+
+        # pylint: disable=no-member
+        self.assertEqual(
+            TemplateBytecodeCache.get_environment_key(application.jinja_env),
+            TemplateBytecodeCache.get_environment_key(template_application.jinja_env),
+        )
+
+    def test_bytecode_cache_directory_not_writable(self):
+        cache = TemplateBytecodeCache("/does-not-exist")
+        bucket = Bucket(None, "key", "checksum")
+        bucket.code = compile("", "template", "exec")
+
+        self.assertIsNone(cache.dump_bytecode(bucket))
+
+
 if __name__ == "__main__":
     unittest.main()
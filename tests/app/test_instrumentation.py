@@ -0,0 +1,137 @@
+import pytest
+from mock import patch
+
+from app.instrumentation import (
+    Histogram,
+    get_metrics,
+    get_request_durations,
+    request_durations,
+    span,
+    span_durations,
+    start_request_timer,
+    stop_request_timer,
+    timed,
+)
+from app.setup import create_app
+
+
+def test_histogram_snapshot():
+    histogram = Histogram()
+    for duration in (0.0001, 0.0005, 0.003, 0.2, 30):
+        histogram.observe(duration)
+
+    buckets, total, count = histogram.snapshot()
+
+    assert dict(buckets) == {
+        "0.0005": 2,
+        "0.001": 2,
+        "0.0025": 2,
+        "0.005": 3,
+        "0.01": 3,
+        "0.025": 3,
+        "0.05": 3,
+        "0.1": 3,
+        "0.25": 4,
+        "0.5": 4,
+        "1": 4,
+        "2.5": 4,
+        "5": 4,
+        "10": 4,
+        "+Inf": 5,
+    }
+    assert list(buckets)[-1] == ("+Inf", 5)
+    assert round(total, 4) == 30.2036
+    assert count == 5
+
+
+def test_spans_are_totalled_for_the_request():
+    @timed("test_timed")
+    def timed_function():
+        return "result"
+
+    start_request_timer()
+
+    with span("test_span"):
+        assert timed_function() == "result"
+    assert timed_function() == "result"
+
+    durations = get_request_durations("questionnaire.block")
+
+    assert durations["duration"] >= durations["span_durations"]["test_span"] >= 0
+    assert set(durations["span_durations"]) == {"test_span", "test_timed"}
+    assert span_durations["test_timed"].count == 1
+    assert request_durations["questionnaire.block"].count >= 1
+
+
+def test_span_is_recorded_when_it_raises():
+    start_request_timer()
+
+    with pytest.raises(ValueError):
+        with span("test_raising_span"):
+            raise ValueError()
+
+    assert (
+        "test_raising_span" in get_request_durations("test.endpoint")["span_durations"]
+    )
+
+
+def test_span_outside_a_request():
+    with span("test_span_outside_request"):
+        pass
+
+    assert "test_span_outside_request" not in span_durations
+
+
+def test_request_durations_once_stopped():
+    start_request_timer()
+    stop_request_timer()
+
+    assert not get_request_durations("test.endpoint")
+
+
+def test_get_metrics():
+    start_request_timer()
+    with span("test_metrics_span"):
+        pass
+    get_request_durations("test.metrics_endpoint")
+
+    metrics = get_metrics().splitlines()
+
+    assert "# TYPE eq_request_duration_seconds histogram" in metrics
+    assert "# TYPE eq_span_duration_seconds histogram" in metrics
+    assert (
+        'eq_span_duration_seconds_bucket{span="test_metrics_span",le="+Inf"} 1'
+        in metrics
+    )
+    assert 'eq_span_duration_seconds_count{span="test_metrics_span"} 1' in metrics
+    assert (
+        'eq_request_duration_seconds_count{endpoint="test.metrics_endpoint"} 1'
+        in metrics
+    )
+
+
+def test_response_is_logged_with_durations(app):
+    with patch("app.setup.logger") as logger:
+        app.test_client().get("/status")
+
+    response_call = [
+        call for call in logger.info.call_args_list if call[0] == ("response",)
+    ][0]
+    assert response_call[1]["duration"] >= 0
+    assert "span_durations" in response_call[1]
+
+
+def test_metrics_endpoint_disabled_by_default(app):
+    assert "metrics.metrics" not in app.view_functions
+
+
+def test_metrics_endpoint():
+    application = create_app({"EQ_ENABLE_METRICS_ENDPOINT": True})
+
+    response = application.test_client().get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert "# TYPE eq_span_duration_seconds histogram" in response.get_data(
+        as_text=True
+    )
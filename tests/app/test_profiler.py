@@ -0,0 +1,110 @@
+import signal
+import sys
+import time
+
+from app.profiler import OTHER_STACKS, SamplingProfiler
+from app.setup import create_app
+
+
+def get_profiler(sample_rate=1, max_stacks=100):
+    profiler = SamplingProfiler(
+        sample_rate=sample_rate, interval_seconds=0.001, max_stacks=max_stacks
+    )
+    profiler.install()
+    return profiler
+
+
+def busy_loop(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def test_profiled_request_is_sampled():
+    profiler = get_profiler()
+
+    profiler.start_request("questionnaire.block")
+    busy_loop(0.1)
+    profiler.stop_request()
+
+    profile = profiler.get_profiles()["questionnaire.block"]
+    assert profile["requests"] == 1
+    assert profile["samples"] > 0
+    assert sum(profile["stacks"].values()) == profile["samples"]
+    assert any(
+        stack.endswith("tests.app.test_profiler:busy_loop")
+        for stack in profile["stacks"]
+    )
+
+
+def test_timer_only_runs_while_profiling():
+    profiler = get_profiler()
+
+    profiler.start_request("questionnaire.block")
+    assert signal.getitimer(signal.ITIMER_PROF)[0] > 0
+
+    profiler.stop_request()
+    assert signal.getitimer(signal.ITIMER_PROF) == (0, 0)
+
+
+def test_unsampled_request_is_not_profiled():
+    profiler = get_profiler(sample_rate=0)
+
+    profiler.start_request("questionnaire.block")
+    busy_loop(0.05)
+    profiler.stop_request()
+
+    assert profiler.get_profiles() == {}
+    assert signal.getitimer(signal.ITIMER_PROF) == (0, 0)
+
+
+def test_request_without_endpoint_is_not_profiled():
+    profiler = get_profiler()
+
+    profiler.start_request(None)
+    profiler.stop_request()
+
+    assert profiler.get_profiles() == {}
+
+
+def test_stacks_are_bounded():
+    profiler = get_profiler(max_stacks=1)
+    frame = sys._getframe()  # pylint: disable=protected-access
+
+    for sampled_frame in (frame, frame.f_back, frame):
+        profiler._record(  # pylint: disable=protected-access
+            "questionnaire.block", sampled_frame
+        )
+
+    profile = profiler.get_profiles()["questionnaire.block"]
+    assert profile["samples"] == 3
+    assert profile["stacks"] == {OTHER_STACKS: 1, next(iter(profile["stacks"])): 2}
+    assert list(profile["stacks"])[0].endswith(
+        "tests.app.test_profiler:test_stacks_are_bounded"
+    )
+
+
+def test_clear():
+    profiler = get_profiler()
+    profiler.start_request("questionnaire.block")
+    profiler.stop_request()
+
+    profiler.clear()
+
+    assert profiler.get_profiles() == {}
+
+
+def test_create_app_with_profiling():
+    application = create_app({"EQ_PROFILING": True, "EQ_PROFILING_SAMPLE_RATE": 1})
+    profiler = application.eq["profiler"]
+
+    with application.test_request_context("/session"):
+        application.preprocess_request()
+        application.do_teardown_request()
+
+    assert profiler.get_profiles()["session.login"]["requests"] == 1
+    assert signal.getitimer(signal.ITIMER_PROF) == (0, 0)
+
+
+def test_create_app_without_profiling(app):
+    assert "profiler" not in app.eq
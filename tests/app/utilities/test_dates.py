@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from mock import patch
+
+from app.utilities.dates import convert_to_datetime, get_today, parse_date
+from tests.app.app_context_test_case import AppContextTestCase
+
+
+class TestDates(AppContextTestCase):
+    def test_parse_date_formats(self):
+        self.assertEqual(parse_date("2020-03-01"), datetime(2020, 3, 1))
+        self.assertEqual(parse_date("2020-03"), datetime(2020, 3, 1))
+        self.assertEqual(parse_date("2020"), datetime(2020, 1, 1))
+
+    def test_parse_date_is_cached(self):
+        self.assertIs(parse_date("2019-12-25"), parse_date("2019-12-25"))
+
+    def test_invalid_date_raises(self):
+        with self.assertRaises(ValueError):
+            parse_date("2020-13-01")
+
+    def test_convert_to_datetime_without_value(self):
+        self.assertIsNone(convert_to_datetime(None))
+        self.assertIsNone(convert_to_datetime(""))
+
+    def test_today_is_resolved_once_per_request(self):
+        with patch("app.utilities.dates.datetime") as mock_datetime:
+            mock_datetime.utcnow.side_effect = [
+                datetime(2020, 3, 1, 23, 59, 59),
+                datetime(2020, 3, 2),
+                datetime(2020, 3, 3),
+            ]
+
+            with self._app.app_context(), self.app_request_context():
+                self.assertEqual(get_today(), "2020-03-01")
+                self.assertEqual(get_today(), "2020-03-01")
+
+            with self._app.app_context(), self.app_request_context():
+                self.assertEqual(get_today(), "2020-03-02")
+
+    def test_today_outside_request(self):
+        with patch("app.utilities.dates.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2020, 3, 1)
+
+            self.assertEqual(get_today(), "2020-03-01")
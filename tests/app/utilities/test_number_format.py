@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+from babel import Locale, numbers
+from mock import patch
+
+from app.utilities.number_format import get_locale_number_format, get_number_format
+from tests.app.app_context_test_case import AppContextTestCase
+
+
+class TestNumberFormat(AppContextTestCase):
+    def test_number_format_is_shared_per_locale(self):
+        self.assertIs(get_number_format("en_GB"), get_number_format("en_GB"))
+        self.assertIsNot(get_number_format("en_GB"), get_number_format("de"))
+
+    def test_symbols(self):
+        number_format = get_number_format("de")
+
+        self.assertEqual(number_format.group_symbol, ".")
+        self.assertEqual(number_format.decimal_symbol, ",")
+        self.assertEqual(number_format.strip_group_symbols("1.234,5"), "1234,5")
+
+    def test_formats_match_babel(self):
+        for locale in ("en_GB", "cy", "de"):
+            number_format = get_number_format(locale)
+
+            for number in (0, 1234567, Decimal("-1234.5678")):
+                self.assertEqual(
+                    number_format.format_decimal(number),
+                    numbers.format_decimal(number, locale=locale),
+                )
+                self.assertEqual(
+                    number_format.format_currency(number, "EUR"),
+                    numbers.format_currency(number, "EUR", locale=locale),
+                )
+
+            self.assertEqual(
+                number_format.get_currency_symbol("GBP"),
+                numbers.get_currency_symbol("GBP", locale=locale),
+            )
+
+    def test_locale_number_format_uses_request_locale(self):
+        with self.app_request_context(), patch(
+            "app.utilities.number_format.flask_babel.get_locale",
+            return_value=Locale("de"),
+        ):
+            number_format = get_locale_number_format()
+
+        self.assertEqual(number_format.locale, Locale("de"))
+        self.assertEqual(number_format.group_symbol, ".")
@@ -27,6 +27,8 @@ class TestSection(TestCase):
         self.list_store = MagicMock()
         self.metadata = MagicMock()
         self.schema = MagicMock()
+        self.placeholder_renderer = MagicMock()
+        self.placeholder_renderer.render_title.side_effect = lambda title, _: title
 
     def test_create_block(self):
         # Given
@@ -38,7 +40,7 @@ class TestSection(TestCase):
             "app.views.contexts.summary.block.Question",
             return_value=get_mock_question("A Question"),
         ), patch(
-            "app.views.contexts.summary.block.url_for", return_value="http://a.url/"
+            "app.views.contexts.summary.block.build_url", return_value="http://a.url/"
         ):
             block = Block(
                 block_schema,
@@ -47,10 +49,14 @@ class TestSection(TestCase):
                 self.metadata,
                 self.schema,
                 location,
+                self.placeholder_renderer,
             )
 
         # Then
         self.assertEqual(block.id, "block_id")
         self.assertEqual(block.title, "A section title")
+        self.placeholder_renderer.render_title.assert_called_once_with(
+            "A section title", None
+        )
         self.assertEqual(block.number, "1")
         self.assertEqual(block.question, "A Question")
@@ -1,6 +1,8 @@
 import pytest
 
 from app.questionnaire.location import Location
+from app.questionnaire.placeholder_renderer import PlaceholderRenderer
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.views.contexts.summary.group import Group
 from app.data_model.answer_store import AnswerStore
 from app.data_model.list_store import ListStore
@@ -72,9 +74,9 @@ def test_group_serialize_show_on_summary_false(
         answer_store,
         list_store,
         metadata,
-        None,
+        QuestionnaireSchema({}),
         Location("test", "test"),
-        "en",
+        PlaceholderRenderer("en", schema=QuestionnaireSchema({})),
     )
 
     assert len(group.blocks) == 1
@@ -97,9 +99,9 @@ def test_group_serialize_show_on_summary_not_set(
         answer_store,
         list_store,
         metadata,
-        None,
+        QuestionnaireSchema({}),
         Location("test", "test"),
-        "en",
+        PlaceholderRenderer("en", schema=QuestionnaireSchema({})),
     )
 
     assert len(group.blocks) == 2
@@ -122,9 +124,9 @@ def test_group_serialize_show_on_summary_true(
         answer_store,
         list_store,
         metadata,
-        None,
+        QuestionnaireSchema({}),
         Location("test", "test"),
-        "en",
+        PlaceholderRenderer("en", schema=QuestionnaireSchema({})),
     )
 
     assert len(group.blocks) == 2
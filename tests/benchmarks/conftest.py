@@ -0,0 +1,206 @@
+"""
+Benchmarks of the runner's engines, each timed at several sizes of synthetic
+questionnaire so that how its time grows with the size can be compared between
+changes. They are skipped unless run with `--run-benchmarks`, for example:
+
+    pipenv run py.test tests/benchmarks --run-benchmarks --answers 10,100,1000
+
+Run them without `-n`, as benchmarks on parallel workers slow each other and
+their results aren't reported. Results are only comparable between runs on the
+same machine.
+"""
+import os
+import statistics
+import tracemalloc
+from collections import defaultdict
+from time import perf_counter
+
+import simplejson as json
+import structlog
+from pytest import fixture, mark
+
+from app.setup import create_app
+
+BENCHMARKS_DIRECTORY = os.path.dirname(__file__)
+
+# The number of answers in each section, the number of items in the list a
+# section repeats for, and the number of sections, in the synthetic
+# questionnaires, as the option and fixture each is set by
+SCALES = {
+    "answer_count": ("--answers", "10,100,1000"),
+    "list_item_count": ("--list-items", "1,10,100"),
+    "section_count": ("--sections", "1,10,100"),
+}
+
+MIN_ROUNDS = 5
+MAX_ROUNDS = 100_000
+
+results = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--run-benchmarks", action="store_true", help="Run the benchmarks.")
+    for option, default in SCALES.values():
+        group.addoption(
+            option,
+            default=default,
+            help=f"The comma separated sizes to benchmark at (default {default}).",
+        )
+    group.addoption(
+        "--benchmark-time",
+        type=float,
+        default=0.2,
+        help="The least time in seconds to spend timing each benchmark.",
+    )
+    group.addoption(
+        "--benchmark-results", help="Save the results as JSON to this file."
+    )
+
+
+def pytest_generate_tests(metafunc):
+    for fixture_name, (option, default) in SCALES.items():
+        if fixture_name in metafunc.fixturenames:
+            sizes = metafunc.config.getoption(option, default)
+            metafunc.parametrize(
+                fixture_name,
+                [int(size) for size in sizes.split(",")],
+                ids=lambda size, option=option: f"{option[2:]}={size}",
+            )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks", False):
+        return
+
+    skip = mark.skip(reason="Benchmarks only run with --run-benchmarks")
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARKS_DIRECTORY):
+            item.add_marker(skip)
+
+
+class Benchmark:
+    """
+    Times calls of a function, like the fixture of the same name from
+    pytest-benchmark. Calls it once to warm up, then for at least `min_time`
+    seconds and `MIN_ROUNDS` calls, and records the fastest, median and mean
+    time of a call. Also records the peak memory allocated by a call, from
+    another call traced on its own so that tracing doesn't slow the timings.
+    """
+
+    def __init__(self, name, sizes, min_time):
+        self.name = name
+        self.sizes = sizes
+        self.min_time = min_time
+
+    def __call__(self, func, *args, **kwargs):
+        result = func(*args, **kwargs)
+
+        timings = []
+        deadline = perf_counter() + self.min_time
+        while len(timings) < MIN_ROUNDS or (
+            perf_counter() < deadline and len(timings) < MAX_ROUNDS
+        ):
+            start = perf_counter()
+            func(*args, **kwargs)
+            timings.append(perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        results.append(
+            {
+                "name": self.name,
+                "sizes": self.sizes,
+                "rounds": len(timings),
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.mean(timings),
+                "peak": peak,
+            }
+        )
+        return result
+
+
+def _drop_event(*_):
+    raise structlog.DropEvent
+
+
+@fixture(scope="session", autouse=True)
+def silence_application_logging():
+    structlog.configure(processors=[_drop_event])
+    yield
+    structlog.reset_defaults()
+
+
+@fixture
+def benchmark(request):
+    params = request.node.callspec.params if hasattr(request.node, "callspec") else {}
+    sizes = {name: value for name, value in params.items() if name in SCALES}
+    other_params = [str(value) for name, value in params.items() if name not in SCALES]
+
+    name = request.node.originalname or request.node.name
+    if other_params:
+        name += f"[{'-'.join(other_params)}]"
+
+    return Benchmark(name, sizes, request.config.getoption("--benchmark-time", 0.2))
+
+
+@fixture(scope="session")
+def app():
+    return create_app({"LOGIN_DISABLED": True, "WTF_CSRF_ENABLED": False})
+
+
+def _format_duration(seconds):
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.1f} µs"
+    return f"{seconds * 1000:.2f} ms"
+
+
+def _format_size(size):
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / 1024 / 1024:.1f} MiB"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not results:
+        return
+
+    by_name = defaultdict(list)
+    for result in results:
+        result["size_ids"] = ", ".join(
+            f"{SCALES[fixture_name][0][2:]}={size}"
+            for fixture_name, size in result["sizes"].items()
+        )
+        by_name[result["name"]].append(result)
+
+    name_width = max(len(name) for name in by_name)
+    sizes_width = max(len("sizes"), *(len(result["size_ids"]) for result in results))
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<{name_width}} {'sizes':<{sizes_width}} {'min':>10} "
+        f"{'median':>10} {'growth':>8} {'peak':>10} {'rounds':>7}"
+    )
+    for name, name_results in by_name.items():
+        # How many times slower each size is than the first, to show the curve
+        # of the time against the size
+        first_median = name_results[0]["median"]
+        for result in name_results:
+            terminalreporter.write_line(
+                f"{name:<{name_width}} {result.pop('size_ids'):<{sizes_width}} "
+                f"{_format_duration(result['min']):>10} "
+                f"{_format_duration(result['median']):>10} "
+                f"{result['median'] / first_median:>7.1f}x "
+                f"{_format_size(result['peak']):>10} {result['rounds']:>7}"
+            )
+
+    results_path = config.getoption("--benchmark-results", None)
+    if results_path:
+        with open(results_path, "w") as results_file:
+            json.dump(results, results_file, indent=4)
@@ -0,0 +1,352 @@
+"""
+Synthetic questionnaires of any size, with every question answered.
+
+Each section is a run of Number questions, where every question after the
+first is skipped or routed on the answer to the question before it, so that
+finding the routing path checks every answer. A 0.0.3 questionnaire also has a
+section that repeats for each item in the `people` list.
+
+A household is the stored data of `test_repeating_sections_with_hub_and_spoke`
+for any number of people, each of whom has completed their personal details.
+"""
+import uuid
+
+import simplejson as json
+
+from app.data_model.answer import Answer
+from app.data_model.answer_store import AnswerStore
+from app.data_model.list_store import ListStore
+from app.data_model.progress_store import CompletionStatus, ProgressStore
+from app.data_model.questionnaire_store import QuestionnaireStore
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+
+LIST_NAME = "people"
+REPEATING_SECTION_ID = "person-section"
+
+HOUSEHOLD_SCHEMA_NAME = "test_repeating_sections_with_hub_and_spoke"
+
+FORM_BLOCK_ID = "form-block"
+
+METADATA = {
+    "tx_id": str(uuid.uuid4()),
+    "user_id": "benchmark",
+    "ru_ref": "123456789012A",
+    "response_id": "1234567890123456",
+    "questionnaire_id": "0123456789000000",
+    "collection_exercise_sid": str(uuid.uuid4()),
+    "schema_name": "benchmark",
+    "period_id": "2020",
+    "case_id": str(uuid.uuid4()),
+    "channel": "RH",
+}
+
+
+def get_section_id(section_index):
+    return f"section-{section_index}"
+
+
+def get_answer_id(section_id, index):
+    return f"{section_id}-answer-{index}"
+
+
+def get_block(section_id, index, answer_count):
+    block = {
+        "id": f"{section_id}-block-{index}",
+        "type": "Question",
+        "question": {
+            "id": f"{section_id}-question-{index}",
+            "type": "General",
+            "title": f"Question {index}",
+            "answers": [
+                {
+                    "id": get_answer_id(section_id, index),
+                    "type": "Number",
+                    "label": f"Answer {index}",
+                    "mandatory": False,
+                    "q_code": f"{section_id}-{index}",
+                }
+            ],
+        },
+    }
+    if not index:
+        return block
+
+    when = [
+        {"id": get_answer_id(section_id, index - 1), "condition": "equals", "value": -1}
+    ]
+    if index % 2 or index == answer_count - 1:
+        block["skip_conditions"] = [{"when": when}]
+    else:
+        block["routing_rules"] = [
+            {"goto": {"block": f"{section_id}-block-0", "when": when}},
+            {"goto": {"block": f"{section_id}-block-{index + 1}"}},
+        ]
+    return block
+
+
+def get_section(section_id, answer_count):
+    return {
+        "id": section_id,
+        "groups": [
+            {
+                "id": f"{section_id}-group",
+                "blocks": [
+                    get_block(section_id, index, answer_count)
+                    for index in range(answer_count)
+                ],
+            }
+        ],
+    }
+
+
+def get_schema_json(answer_count, section_count, data_version="0.0.3"):
+    sections = [
+        get_section(get_section_id(section_index), answer_count)
+        for section_index in range(section_count)
+    ]
+    if data_version == "0.0.3":
+        repeating_section = get_section(REPEATING_SECTION_ID, answer_count)
+        repeating_section["repeat"] = {
+            "for_list": LIST_NAME,
+            "title": {
+                "text": "{person}",
+                "placeholders": [
+                    {
+                        "placeholder": "person",
+                        "value": {
+                            "source": "answers",
+                            "identifier": get_answer_id(REPEATING_SECTION_ID, 0),
+                        },
+                    }
+                ],
+            },
+        }
+        sections.append(repeating_section)
+
+    return {
+        "survey_id": "0",
+        "data_version": data_version,
+        "title": "Benchmark",
+        "sections": sections,
+    }
+
+
+class SyntheticQuestionnaire:
+    """
+    A synthetic schema with a questionnaire store's stores, for a respondent who
+    has answered every question and completed every section.
+    """
+
+    def __init__(
+        self, answer_count=10, section_count=1, list_item_count=0, data_version="0.0.3"
+    ):
+        self.schema = QuestionnaireSchema(
+            get_schema_json(answer_count, section_count, data_version)
+        )
+        self.metadata = METADATA
+        self.collection_metadata = {"started_at": "2020-03-01T09:00:00.000000"}
+        self.answer_store = AnswerStore()
+        self.list_store = ListStore()
+        progress = []
+
+        section_ids = [
+            (get_section_id(section_index), None)
+            for section_index in range(section_count)
+        ]
+        if data_version == "0.0.3":
+            section_ids += [
+                (REPEATING_SECTION_ID, self.list_store.add_list_item(LIST_NAME))
+                for _ in range(list_item_count)
+            ]
+
+        for section_id, list_item_id in section_ids:
+            for index in range(answer_count):
+                self.answer_store.add_or_update(
+                    Answer(get_answer_id(section_id, index), index, list_item_id)
+                )
+            progress.append(
+                {
+                    "section_id": section_id,
+                    "list_item_id": list_item_id,
+                    "status": CompletionStatus.COMPLETED,
+                    "block_ids": [
+                        f"{section_id}-block-{index}" for index in range(answer_count)
+                    ],
+                }
+            )
+
+        self.progress_store = ProgressStore(progress)
+
+    def get_questionnaire_store(self):
+        """ A questionnaire store holding the questionnaire's answers, lists and progress. """
+        questionnaire_store = QuestionnaireStore(MemoryStorage())
+        questionnaire_store.set_metadata(dict(self.metadata))
+        questionnaire_store.collection_metadata = self.collection_metadata
+        questionnaire_store.answer_store = self.answer_store
+        questionnaire_store.list_store = self.list_store
+        questionnaire_store.progress_store = self.progress_store
+        return questionnaire_store
+
+
+class MemoryStorage:
+    """ Storage for a questionnaire store, which keeps the data it is given. """
+
+    def __init__(self, data=None):
+        self.data = data
+
+    def get_user_data(self):
+        return self.data, QuestionnaireStore.LATEST_VERSION
+
+    def save(self, data):
+        self.data = data
+
+    def delete(self):
+        self.data = None
+
+
+def get_household_data(list_item_count):
+    """ The stored data of a household of `list_item_count` people. """
+    list_item_ids = [f"person{index}" for index in range(list_item_count)]
+
+    answers = [
+        {"answer_id": answer_id, "value": value}
+        for answer_id, value in (
+            ("you-live-here", "Yes"),
+            ("anyone-else", "No"),
+            ("another-anyone-else", "No"),
+            ("visitors-anyone-else", "No"),
+        )
+    ]
+    progress = [
+        {
+            "section_id": "section",
+            "list_item_id": None,
+            "status": CompletionStatus.COMPLETED,
+            "block_ids": [
+                "primary-person-list-collector",
+                "list-collector",
+                "next-interstitial",
+                "another-list-collector-block",
+                "visitors-block",
+            ],
+        }
+    ]
+
+    for index, list_item_id in enumerate(list_item_ids):
+        answers += [
+            {"answer_id": answer_id, "value": value, "list_item_id": list_item_id}
+            for answer_id, value in (
+                ("first-name", "Person"),
+                ("last-name", str(index)),
+                ("proxy-answer", "Yes"),
+                ("date-of-birth-answer", "1980-01-01"),
+                ("confirm-date-of-birth-answer", "Yes"),
+                ("sex-answer", "Female"),
+            )
+        ]
+        progress.append(
+            {
+                "section_id": "personal-details-section",
+                "list_item_id": list_item_id,
+                "status": CompletionStatus.COMPLETED,
+                "block_ids": [
+                    "proxy",
+                    "date-of-birth",
+                    "confirm-dob",
+                    "sex",
+                    "personal-summary",
+                ],
+            }
+        )
+
+    return json.dumps(
+        {
+            "METADATA": dict(METADATA, schema_name=HOUSEHOLD_SCHEMA_NAME),
+            "COLLECTION_METADATA": {"started_at": "2020-03-01T09:00:00.000000"},
+            "ANSWERS": answers,
+            "LISTS": [
+                {
+                    "name": LIST_NAME,
+                    "items": list_item_ids,
+                    "primary_person": list_item_ids[0] if list_item_ids else None,
+                }
+            ],
+            "PROGRESS": progress,
+        }
+    )
+
+
+def get_household_store(list_item_count):
+    """ A questionnaire store loaded from the stored data of a household. """
+    return QuestionnaireStore(MemoryStorage(get_household_data(list_item_count)))
+
+
+def get_form_schema(answer_count):
+    """
+    A schema with a question of `answer_count` mandatory Number answers, where
+    the label of each answer after the first has a placeholder for the answer
+    before it.
+    """
+    answers = []
+    for index in range(answer_count):
+        answer = {
+            "id": f"form-answer-{index}",
+            "type": "Number",
+            "label": f"Answer {index}",
+            "mandatory": True,
+        }
+        if index:
+            answer["label"] = {
+                "text": f"Answer {index}, after {{previous}}",
+                "placeholders": [
+                    {
+                        "placeholder": "previous",
+                        "transforms": [
+                            {
+                                "transform": "format_number",
+                                "arguments": {
+                                    "number": {
+                                        "source": "answers",
+                                        "identifier": f"form-answer-{index - 1}",
+                                    }
+                                },
+                            }
+                        ],
+                    }
+                ],
+            }
+        answers.append(answer)
+
+    return get_question_schema(answers)
+
+
+def get_question_schema(answers):
+    """ A schema with a single question of the given answers, on `FORM_BLOCK_ID`. """
+    return QuestionnaireSchema(
+        {
+            "survey_id": "0",
+            "data_version": "0.0.3",
+            "sections": [
+                {
+                    "id": "form-section",
+                    "groups": [
+                        {
+                            "id": "form-group",
+                            "blocks": [
+                                {
+                                    "id": FORM_BLOCK_ID,
+                                    "type": "Question",
+                                    "question": {
+                                        "id": "form-question",
+                                        "type": "General",
+                                        "title": "Form question",
+                                        "answers": answers,
+                                    },
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
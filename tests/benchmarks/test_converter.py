@@ -0,0 +1,199 @@
+from copy import deepcopy
+from itertools import chain
+
+import pytest
+import simplejson as json
+from sdc.crypto.encrypter import encrypt
+
+from app.data_model.answer import Answer
+from app.data_model.answer_store import AnswerStore
+from app.data_model.list_store import ListStore
+from app.keys import KEY_PURPOSE_SUBMISSION
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.questionnaire.router import Router
+from app.questionnaire.routing_path import RoutingPath
+from app.submitter.convert_payload_0_0_1 import convert_answers_to_payload_0_0_1
+from app.submitter.converter import convert_answers, convert_answers_to_json
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import SyntheticQuestionnaire, get_section_id
+
+# An answer to every question of `test_variants_question` and its variants
+VARIANT_ANSWER_VALUES = {
+    "first-name-answer": "Joe",
+    "last-name-answer": "Bloggs",
+    "proxy-answer": "Yes, I am",
+    "age-answer": 30,
+    "age-confirm-answer": "Yes",
+    "currency-answer": "Sterling",
+    "first-number-answer": 100,
+    "second-number-answer": 200,
+}
+
+
+def get_full_routing_path(questionnaire):
+    return Router(
+        questionnaire.schema,
+        questionnaire.answer_store,
+        questionnaire.list_store,
+        questionnaire.progress_store,
+        questionnaire.metadata,
+    ).full_routing_path()
+
+
+def test_convert_answers_0_0_3(benchmark, answer_count, list_item_count):
+    questionnaire = SyntheticQuestionnaire(
+        answer_count=answer_count, list_item_count=list_item_count
+    )
+    full_routing_path = get_full_routing_path(questionnaire)
+
+    payload = benchmark(
+        convert_answers, questionnaire.schema, questionnaire, full_routing_path
+    )
+
+    assert len(payload["data"]["answers"]) == answer_count * (1 + list_item_count)
+
+
+def test_convert_answers_0_0_1(benchmark, answer_count, section_count):
+    questionnaire = SyntheticQuestionnaire(
+        answer_count=answer_count, section_count=section_count, data_version="0.0.1"
+    )
+    # 0.0.1 answers are converted along a single routing path
+    routing_path = RoutingPath(
+        chain.from_iterable(get_full_routing_path(questionnaire)),
+        section_id=get_section_id(0),
+    )
+
+    payload = benchmark(
+        convert_answers, questionnaire.schema, questionnaire, routing_path
+    )
+
+    assert len(payload["data"]) == answer_count * section_count
+
+
+def build_with_dict(schema, questionnaire, routing_path):
+    return json.dumps(
+        convert_answers(schema, questionnaire, routing_path), for_json=True
+    )
+
+
+def build_with_stream(schema, questionnaire, routing_path):
+    return convert_answers_to_json(schema, questionnaire, routing_path)
+
+
+SUBMISSION_BUILDERS = {"dict": build_with_dict, "stream": build_with_stream}
+
+
+def build_and_encrypt(build, key_store, *args):
+    return encrypt(build(*args), key_store, KEY_PURPOSE_SUBMISSION)
+
+
+@pytest.mark.parametrize("builder", list(SUBMISSION_BUILDERS))
+def test_build_submission(benchmark, answer_count, list_item_count, builder):
+    """
+    Compares serialising the payload built by `convert_answers` with streaming
+    the answers into the encoder, whose peak memory is lower.
+    """
+    questionnaire = SyntheticQuestionnaire(
+        answer_count=answer_count, list_item_count=list_item_count
+    )
+    full_routing_path = get_full_routing_path(questionnaire)
+
+    message = benchmark(
+        SUBMISSION_BUILDERS[builder],
+        questionnaire.schema,
+        questionnaire,
+        full_routing_path,
+    )
+
+    assert json.loads(message)["data"]["answers"]
+
+
+@pytest.mark.parametrize("builder", list(SUBMISSION_BUILDERS))
+def test_build_and_encrypt_submission(
+    app, benchmark, answer_count, list_item_count, builder
+):
+    """
+    The JWE encryption holds several encoded copies of the message, so it sets
+    the peak memory of the whole submission.
+    """
+    questionnaire = SyntheticQuestionnaire(
+        answer_count=answer_count, list_item_count=list_item_count
+    )
+    full_routing_path = get_full_routing_path(questionnaire)
+
+    assert benchmark(
+        build_and_encrypt,
+        SUBMISSION_BUILDERS[builder],
+        app.eq["key_store"],
+        questionnaire.schema,
+        questionnaire,
+        full_routing_path,
+    )
+
+
+def answer_copy_id(answer_id, copy):
+    return answer_id if copy == 0 else f"{answer_id}-{copy}"
+
+
+def get_variants_schema(answer_count):
+    """
+    `test_variants_question` as a 0.0.1 schema with q_codes, with `answer_count`
+    copies of each answer on every question and its variants, as business
+    surveys often have many answers on a question.
+    """
+    schema_json = deepcopy(load_schema_from_name("test_variants_question").json)
+    schema_json["data_version"] = "0.0.1"
+
+    q_codes = {}
+    for section in schema_json["sections"]:
+        for block in QuestionnaireSchema.get_blocks_for_section(section):
+            questions = [block["question"]] if "question" in block else []
+            questions += [
+                variant["question"] for variant in block.get("question_variants", [])
+            ]
+            for question in questions:
+                question["answers"] = [
+                    dict(
+                        answer,
+                        id=answer_copy_id(answer["id"], copy),
+                        q_code=q_codes.setdefault(
+                            answer_copy_id(answer["id"], copy), str(len(q_codes))
+                        ),
+                    )
+                    for answer in question["answers"]
+                    for copy in range(answer_count)
+                ]
+
+    return QuestionnaireSchema(schema_json)
+
+
+def convert_variant_answers(schema, answer_store, routing_paths):
+    return [
+        convert_answers_to_payload_0_0_1(
+            {}, answer_store, ListStore(), schema, routing_path
+        )
+        for routing_path in routing_paths
+    ]
+
+
+def test_convert_variant_answers_0_0_1(app, benchmark, answer_count):
+    with app.app_context():
+        schema = get_variants_schema(answer_count)
+    answer_store = AnswerStore(
+        [
+            Answer(answer_copy_id(answer_id, copy), value).to_dict()
+            for answer_id, value in VARIANT_ANSWER_VALUES.items()
+            for copy in range(answer_count)
+        ]
+    )
+    routing_paths = [
+        RoutingPath(
+            [block["id"] for block in schema.get_blocks_for_section(section)],
+            section["id"],
+        )
+        for section in schema.get_sections()
+    ]
+
+    payloads = benchmark(convert_variant_answers, schema, answer_store, routing_paths)
+
+    assert sum(len(payload) for payload in payloads) == len(answer_store)
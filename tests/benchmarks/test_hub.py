@@ -0,0 +1,34 @@
+from app.routes.questionnaire import _build_hub, _get_hub_cache_key
+from app.setup import hub_cache
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import HOUSEHOLD_SCHEMA_NAME, get_household_store
+
+USER_ID = "benchmark-user"
+
+
+def test_build_hub(app, benchmark, list_item_count):
+    questionnaire_store = get_household_store(list_item_count)
+
+    with app.test_request_context():
+        schema = load_schema_from_name(HOUSEHOLD_SCHEMA_NAME)
+        hub = benchmark(_build_hub, schema, questionnaire_store, "en")
+
+    assert hub["context"]
+
+
+def get_cached_hub(questionnaire_store):
+    return hub_cache.get(_get_hub_cache_key(USER_ID, "en", questionnaire_store))
+
+
+def test_get_cached_hub(app, benchmark, list_item_count):
+    """ A revisit to the hub with no changes, which is served from the cache. """
+    questionnaire_store = get_household_store(list_item_count)
+
+    with app.test_request_context():
+        schema = load_schema_from_name(HOUSEHOLD_SCHEMA_NAME)
+        hub_cache.set(
+            _get_hub_cache_key(USER_ID, "en", questionnaire_store),
+            _build_hub(schema, questionnaire_store, "en"),
+        )
+
+        assert benchmark(get_cached_hub, questionnaire_store)
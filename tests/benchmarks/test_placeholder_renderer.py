@@ -0,0 +1,103 @@
+from app.data_model.answer import Answer
+from app.data_model.answer_store import AnswerStore
+from app.data_model.list_store import ListStore
+from app.questionnaire.location import Location
+from app.questionnaire.placeholder_renderer import PlaceholderRenderer
+from app.questionnaire.relationship_location import RelationshipLocation
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import (
+    FORM_BLOCK_ID,
+    METADATA,
+    get_form_schema,
+    get_household_store,
+)
+
+
+def test_render_question(benchmark, answer_count):
+    schema = get_form_schema(answer_count)
+    question = schema.get_block(FORM_BLOCK_ID)["question"]
+    answer_store = AnswerStore(
+        [
+            Answer(f"form-answer-{index}", index * 1000).to_dict()
+            for index in range(answer_count)
+        ]
+    )
+    renderer = PlaceholderRenderer(
+        "en",
+        schema=schema,
+        answer_store=answer_store,
+        list_store=ListStore(),
+        metadata=METADATA,
+    )
+
+    rendered_question = benchmark(renderer.render, question, None)
+
+    assert all(
+        isinstance(answer["label"], str) for answer in rendered_question["answers"]
+    )
+
+
+def render_relationships(schema, questionnaire_store):
+    """ Render the relationship question for every pair of people, as the
+    relationship collector does. """
+    question = schema.get_block("relationships")["question"]
+    people = questionnaire_store.list_store["people"].items
+
+    return [
+        PlaceholderRenderer(
+            "en",
+            schema=schema,
+            answer_store=questionnaire_store.answer_store,
+            list_store=questionnaire_store.list_store,
+            location=RelationshipLocation(
+                section_id="section",
+                block_id="relationships",
+                list_item_id=list_item_id,
+                to_list_item_id=to_list_item_id,
+            ),
+        ).render(question, list_item_id)
+        for list_item_id in people
+        for to_list_item_id in people
+    ]
+
+
+def test_render_relationships(app, benchmark, list_item_count):
+    questionnaire_store = get_household_store(list_item_count)
+
+    with app.test_request_context():
+        schema = load_schema_from_name("test_relationships")
+        rendered_questions = benchmark(
+            render_relationships, schema, questionnaire_store
+        )
+
+    assert len(rendered_questions) == list_item_count ** 2
+
+
+def render_confirm_dob(schema, questionnaire_store):
+    """ Render the question confirming a person's age for every person. """
+    question = schema.get_block("confirm-dob-proxy")["question"]
+
+    return [
+        PlaceholderRenderer(
+            "en",
+            schema=schema,
+            answer_store=questionnaire_store.answer_store,
+            list_store=questionnaire_store.list_store,
+            location=Location(
+                section_id="age-confirmation-section",
+                block_id="confirm-dob-proxy",
+                list_item_id=list_item_id,
+            ),
+        ).render(question, list_item_id)
+        for list_item_id in questionnaire_store.list_store["people"].items
+    ]
+
+
+def test_render_confirm_dob(app, benchmark, list_item_count):
+    questionnaire_store = get_household_store(list_item_count)
+
+    with app.test_request_context():
+        schema = load_schema_from_name("test_placeholder_full")
+        rendered_questions = benchmark(render_confirm_dob, schema, questionnaire_store)
+
+    assert len(rendered_questions) == list_item_count
@@ -0,0 +1,183 @@
+from copy import deepcopy
+from itertools import cycle, islice
+
+import pytest
+
+from app.data_model.answer_store import AnswerStore
+from app.forms.questionnaire_form import generate_form
+from app.jinja_filters import format_number, get_formatted_currency
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import (
+    FORM_BLOCK_ID,
+    METADATA,
+    get_form_schema,
+    get_question_schema,
+)
+
+# Values that pass validation for every answer of a question in a test schema
+TEST_SCHEMA_FORMDATA = {
+    ("test_numbers", "set-min-max-block"): {"set-minimum": "10", "set-maximum": "2000"},
+    ("test_numbers", "test-min-max-block"): {
+        "test-range": "500",
+        "test-range-exclusive": "500",
+        "test-min": "500",
+        "test-max": "500",
+        "test-min-exclusive": "500",
+        "test-max-exclusive": "500",
+        "test-percent": "50",
+        "test-decimal": "500.50",
+    },
+    ("test_date_range", "date-block"): {
+        "date-range-from-answer-day": "1",
+        "date-range-from-answer-month": "3",
+        "date-range-from-answer-year": "2016",
+        "date-range-to-answer-day": "31",
+        "date-range-to-answer-month": "3",
+        "date-range-to-answer-year": "2016",
+    },
+}
+
+# The answers the limits on `test-min-max-block` of `test_numbers` reference
+REFERENCED_ANSWER_STORE = AnswerStore(
+    [
+        {"answer_id": "set-minimum", "value": 10},
+        {"answer_id": "set-maximum", "value": 2000},
+    ]
+)
+
+NUMERIC_ANSWER_TYPES = ("Number", "Currency", "Percentage")
+
+
+def post_form(schema, question, formdata, answer_store=None):
+    form = generate_form(
+        schema, question, answer_store or AnswerStore(), METADATA, formdata=formdata
+    )
+    return form.validate()
+
+
+def test_generate_and_validate_form(app, benchmark, answer_count):
+    schema = get_form_schema(answer_count)
+    question = schema.get_block(FORM_BLOCK_ID)["question"]
+    formdata = {f"form-answer-{index}": str(index) for index in range(answer_count)}
+
+    with app.test_request_context(method="POST", data=formdata):
+        assert benchmark(post_form, schema, question, formdata)
+
+
+@pytest.mark.parametrize("schema_name, block_id", list(TEST_SCHEMA_FORMDATA))
+@pytest.mark.parametrize("form_class", ["cached", "per-request"])
+def test_generate_and_validate_test_schema_form(
+    app, benchmark, schema_name, block_id, form_class
+):
+    """
+    Compares reusing the form class cached for a schema loaded by name with
+    building a new class for every request, as for a schema that wasn't.
+    """
+    formdata = TEST_SCHEMA_FORMDATA[schema_name, block_id]
+
+    with app.test_request_context(method="POST", data=formdata):
+        schema = load_schema_from_name(schema_name)
+        if form_class == "per-request":
+            schema = QuestionnaireSchema(schema.json, schema.language_code)
+        question = schema.get_block(block_id)["question"]
+
+        assert benchmark(post_form, schema, question, formdata, REFERENCED_ANSWER_STORE)
+
+
+def get_referencing_schema(answer_count):
+    """
+    `test_numbers` with `answer_count` answers on `test-min-max-block`, copied
+    from its answers, whose limits reference the answers to `set-min-max-block`.
+    """
+    schema_json = deepcopy(load_schema_from_name("test_numbers").json)
+
+    for section in schema_json["sections"]:
+        for block in QuestionnaireSchema.get_blocks_for_section(section):
+            if block["id"] == "test-min-max-block":
+                answers = block["question"]["answers"]
+                block["question"]["answers"] = [
+                    dict(answer, id=f"{answer['id']}-{index}")
+                    for index, answer in enumerate(islice(cycle(answers), answer_count))
+                ]
+
+    return QuestionnaireSchema(schema_json)
+
+
+def test_generate_and_validate_referencing_form(app, benchmark, answer_count):
+    with app.app_context():
+        schema = get_referencing_schema(answer_count)
+    question = schema.get_block("test-min-max-block")["question"]
+    values = TEST_SCHEMA_FORMDATA["test_numbers", "test-min-max-block"]
+    formdata = {
+        answer["id"]: values[answer["id"].rsplit("-", 1)[0]]
+        for answer in question["answers"]
+    }
+
+    with app.test_request_context(method="POST", data=formdata):
+        assert benchmark(post_form, schema, question, formdata, REFERENCED_ANSWER_STORE)
+
+
+def get_numeric_answer(index):
+    """ A number, currency or percentage answer, half of them with decimal places. """
+    answer = {
+        "id": f"number-answer-{index}",
+        "label": f"Number {index}",
+        "mandatory": False,
+        "type": NUMERIC_ANSWER_TYPES[index % len(NUMERIC_ANSWER_TYPES)],
+        "decimal_places": 2 if index % 2 else 0,
+    }
+    if answer["type"] == "Currency":
+        answer["currency"] = "GBP"
+    if answer["type"] == "Percentage":
+        answer["maximum"] = {"value": 100}
+    return answer
+
+
+def get_posted_number(answer):
+    """ A value for a numeric answer as it is posted, with group separators. """
+    if answer["type"] == "Percentage":
+        return "12.5" if answer["decimal_places"] else "12"
+    return "1,234.56" if answer["decimal_places"] else "1,234"
+
+
+def format_answers(question, values):
+    return [
+        get_formatted_currency(values[answer["id"]], answer["currency"])
+        if answer["type"] == "Currency"
+        else format_number(values[answer["id"]])
+        for answer in question["answers"]
+    ]
+
+
+def get_numeric_schema(answer_count):
+    return get_question_schema(
+        [get_numeric_answer(index) for index in range(answer_count)]
+    )
+
+
+def test_validate_numeric_answers(app, benchmark, answer_count):
+    schema = get_numeric_schema(answer_count)
+    question = schema.get_block(FORM_BLOCK_ID)["question"]
+    formdata = {
+        answer["id"]: get_posted_number(answer) for answer in question["answers"]
+    }
+
+    with app.test_request_context(method="POST", data=formdata):
+        assert benchmark(post_form, schema, question, formdata)
+
+
+def test_format_numeric_answers(app, benchmark, answer_count):
+    schema = get_numeric_schema(answer_count)
+    question = schema.get_block(FORM_BLOCK_ID)["question"]
+    formdata = {
+        answer["id"]: get_posted_number(answer) for answer in question["answers"]
+    }
+
+    with app.test_request_context(method="POST", data=formdata):
+        values = generate_form(
+            schema, question, AnswerStore(), METADATA, formdata=formdata
+        ).data
+        formatted_answers = benchmark(format_answers, question, values)
+
+    assert len(formatted_answers) == answer_count
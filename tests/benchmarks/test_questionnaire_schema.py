@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+import simplejson as json
+
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from tests.benchmarks.questionnaire import get_schema_json
+
+TEST_SCHEMAS_DIRECTORY = Path("test_schemas")
+
+# The path of each test schema within the directory, starting with its language
+SCHEMA_PATHS = sorted(
+    str(path.relative_to(TEST_SCHEMAS_DIRECTORY))
+    for path in TEST_SCHEMAS_DIRECTORY.glob("*/*.json")
+)
+
+
+@pytest.mark.parametrize("schema_path", SCHEMA_PATHS)
+def test_build_test_schema(benchmark, schema_path):
+    with open(TEST_SCHEMAS_DIRECTORY / schema_path, encoding="utf8") as schema_file:
+        schema_json = json.load(schema_file, use_decimal=True)
+
+    benchmark(QuestionnaireSchema, schema_json, Path(schema_path).parent.name)
+
+
+def test_build_synthetic_schema(benchmark, answer_count, section_count):
+    schema_json = get_schema_json(answer_count, section_count)
+
+    schema = benchmark(QuestionnaireSchema, schema_json)
+
+    assert len(schema.get_sections()) == section_count + 1
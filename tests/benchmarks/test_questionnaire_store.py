@@ -0,0 +1,24 @@
+from app.data_model.questionnaire_store import QuestionnaireStore
+from tests.benchmarks.questionnaire import MemoryStorage, SyntheticQuestionnaire
+
+
+def test_serialise(benchmark, answer_count, list_item_count):
+    questionnaire_store = SyntheticQuestionnaire(
+        answer_count=answer_count, list_item_count=list_item_count
+    ).get_questionnaire_store()
+
+    benchmark(questionnaire_store.serialise)
+
+
+def test_deserialise(benchmark, answer_count, list_item_count):
+    data = (
+        SyntheticQuestionnaire(
+            answer_count=answer_count, list_item_count=list_item_count
+        )
+        .get_questionnaire_store()
+        .serialise()
+    )
+
+    questionnaire_store = benchmark(QuestionnaireStore, MemoryStorage(data))
+
+    assert len(questionnaire_store.answer_store) == answer_count * (1 + list_item_count)
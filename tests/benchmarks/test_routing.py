@@ -0,0 +1,97 @@
+from app.questionnaire.location import Location
+from app.questionnaire.path_finder import PathFinder
+from app.questionnaire.router import Router
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import (
+    HOUSEHOLD_SCHEMA_NAME,
+    SyntheticQuestionnaire,
+    get_household_store,
+    get_section_id,
+)
+
+
+def get_router(schema, questionnaire):
+    return Router(
+        schema,
+        questionnaire.answer_store,
+        questionnaire.list_store,
+        questionnaire.progress_store,
+        questionnaire.metadata,
+    )
+
+
+def test_routing_path(benchmark, answer_count):
+    questionnaire = SyntheticQuestionnaire(answer_count=answer_count)
+    path_finder = PathFinder(
+        questionnaire.schema,
+        questionnaire.answer_store,
+        questionnaire.list_store,
+        questionnaire.progress_store,
+        questionnaire.metadata,
+    )
+
+    routing_path = benchmark(path_finder.routing_path, get_section_id(0))
+
+    assert len(routing_path) == answer_count
+
+
+def test_full_routing_path(benchmark, section_count, list_item_count):
+    questionnaire = SyntheticQuestionnaire(
+        section_count=section_count, list_item_count=list_item_count
+    )
+    router = get_router(questionnaire.schema, questionnaire)
+
+    full_routing_path = benchmark(router.full_routing_path)
+
+    assert len(full_routing_path) == section_count + list_item_count
+
+
+def test_can_access_last_block(benchmark, answer_count):
+    questionnaire = SyntheticQuestionnaire(answer_count=answer_count)
+    router = get_router(questionnaire.schema, questionnaire)
+    routing_path = router.routing_path(get_section_id(0))
+    location = Location(section_id=get_section_id(0), block_id=routing_path[-1])
+
+    assert benchmark(router.can_access_location, location, routing_path)
+
+
+def index_blocks(routing_path):
+    return [routing_path.index(block_id) for block_id in routing_path]
+
+
+def test_index_routing_path(benchmark, answer_count):
+    questionnaire = SyntheticQuestionnaire(answer_count=answer_count)
+    routing_path = get_router(questionnaire.schema, questionnaire).routing_path(
+        get_section_id(0)
+    )
+
+    assert benchmark(index_blocks, routing_path) == list(range(answer_count))
+
+
+def get_survey_progress(router):
+    return (
+        router.can_access_hub(),
+        router.is_survey_complete(),
+        router.get_first_incomplete_location_in_survey(),
+    )
+
+
+def test_survey_progress(app, benchmark, list_item_count):
+    with app.app_context():
+        schema = load_schema_from_name(HOUSEHOLD_SCHEMA_NAME)
+    router = get_router(schema, get_household_store(list_item_count))
+
+    assert benchmark(get_survey_progress, router)[:2] == (True, True)
+
+
+def are_paths_complete(router, routing_paths):
+    return [router.is_path_complete(routing_path) for routing_path in routing_paths]
+
+
+def test_sections_complete(app, benchmark, list_item_count):
+    with app.app_context():
+        schema = load_schema_from_name(HOUSEHOLD_SCHEMA_NAME)
+    router = get_router(schema, get_household_store(list_item_count))
+    routing_paths = router.full_routing_path()
+
+    assert all(benchmark(are_paths_complete, router, routing_paths))
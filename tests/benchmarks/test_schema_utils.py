@@ -0,0 +1,42 @@
+from app.data_model.answer import Answer
+from app.questionnaire.location import Location
+from app.questionnaire.schema_utils import transform_variants
+from app.utilities.schema import load_schema_from_name
+from tests.benchmarks.questionnaire import HOUSEHOLD_SCHEMA_NAME, get_household_store
+
+# The blocks of each person's section with variants chosen on their answers,
+# such as whether they are at least 16 years old
+BLOCK_IDS = ("date-of-birth", "confirm-dob", "sex")
+
+
+def transform_household_variants(schema, questionnaire_store):
+    return [
+        transform_variants(
+            schema.get_block(block_id),
+            schema,
+            questionnaire_store.metadata,
+            questionnaire_store.answer_store,
+            questionnaire_store.list_store,
+            Location(
+                section_id="personal-details-section",
+                list_name="people",
+                list_item_id=list_item_id,
+            ),
+        )
+        for list_item_id in questionnaire_store.list_store["people"].items
+        for block_id in BLOCK_IDS
+    ]
+
+
+def test_transform_variants(app, benchmark, list_item_count):
+    with app.app_context():
+        schema = load_schema_from_name(HOUSEHOLD_SCHEMA_NAME)
+    questionnaire_store = get_household_store(list_item_count)
+    for list_item_id in questionnaire_store.list_store["people"].items:
+        questionnaire_store.answer_store.add_or_update(
+            Answer("proxy-answer", "Yes", list_item_id)
+        )
+
+    blocks = benchmark(transform_household_variants, schema, questionnaire_store)
+
+    assert all("question" in block for block in blocks)
@@ -0,0 +1,19 @@
+from app.storage.storage_encryption import StorageEncryption
+from tests.benchmarks.questionnaire import SyntheticQuestionnaire
+
+
+def encrypt_and_decrypt(encryption, data):
+    return encryption.decrypt_data(encryption.encrypt_data(data))
+
+
+def test_encryption_round_trip(benchmark, answer_count, list_item_count):
+    data = (
+        SyntheticQuestionnaire(
+            answer_count=answer_count, list_item_count=list_item_count
+        )
+        .get_questionnaire_store()
+        .serialise()
+    )
+    encryption = StorageEncryption("user_id", "user_ik", "pepper")
+
+    assert benchmark(encrypt_and_decrypt, encryption, data).decode() == data
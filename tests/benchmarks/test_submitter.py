@@ -0,0 +1,44 @@
+import time
+
+import pytest
+from mock import patch
+
+from app.submitter.submitter import RabbitMQSubmitter
+from tests.app.submitter.fake_broker import FakeBroker
+
+MESSAGE = "x" * 20000
+
+QUEUE = "benchmark_submit_q"
+
+# The simulated time to open a connection to the in-process broker
+HANDSHAKE_TIME = 0.003
+
+
+def submit(submitter, broker, reconnect):
+    sent = submitter.send_message(MESSAGE, "tx_id", "0123456789000000")
+    broker.queues[QUEUE].clear()
+    if reconnect:
+        submitter.pool.close()
+    return sent
+
+
+@pytest.mark.parametrize("connection", ["pooled", "per-submission"])
+def test_submit(benchmark, connection):
+    """
+    Compares reusing pooled connections with opening a connection for every
+    submission, against a broker whose connections take `HANDSHAKE_TIME` to open.
+    """
+    broker = FakeBroker(hosts=("localhost",))
+
+    def connect(parameters):
+        time.sleep(HANDSHAKE_TIME)
+        return broker.connect(parameters)
+
+    with patch("app.submitter.connection_pool.BlockingConnection", connect):
+        submitter = RabbitMQSubmitter(
+            host="localhost", secondary_host="localhost", port=5672, queue=QUEUE
+        )
+        try:
+            assert benchmark(submit, submitter, broker, connection == "per-submission")
+        finally:
+            submitter.pool.close()
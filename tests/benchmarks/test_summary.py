@@ -0,0 +1,266 @@
+from decimal import Decimal
+
+from app.data_model.answer import Answer
+from app.data_model.answer_store import AnswerStore
+from app.data_model.list_store import ListStore
+from app.data_model.progress_store import CompletionStatus, ProgressStore
+from app.questionnaire.location import Location
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.views.contexts import CalculatedSummaryContext, QuestionnaireSummaryContext
+
+# The number of questions in each section of the questionnaire summary
+SUMMARY_BLOCK_COUNT = 10
+
+OPTIONS = ["Yes", "No", "Prefer not to say"]
+
+PROXY_WHEN = {
+    "Yes": [{"id": "proxy-answer", "condition": "equals", "value": "Yes"}],
+    "No": [{"id": "proxy-answer", "condition": "equals", "value": "No"}],
+}
+
+PERSON_NAME_POSSESSIVE = {
+    "placeholder": "person_name_possessive",
+    "transforms": [
+        {
+            "transform": "concatenate_list",
+            "arguments": {
+                "list_to_concatenate": {
+                    "source": "answers",
+                    "identifier": ["first-name", "last-name"],
+                },
+                "delimiter": " ",
+            },
+        },
+        {
+            "transform": "format_possessive",
+            "arguments": {"string_to_format": {"source": "previous_transform"}},
+        },
+    ],
+}
+
+
+def get_block(block_id, index, get_question):
+    """ A block of the question `get_question` returns for a title, where every
+    third block has variants chosen on whether the respondent is a proxy. """
+    block = {"id": block_id, "type": "Question"}
+    if index % 3:
+        block["question"] = get_question("Question")
+    else:
+        block["question_variants"] = [
+            {
+                "question": get_question("Question for a proxy"),
+                "when": PROXY_WHEN["No"],
+            },
+            {"question": get_question("Question"), "when": PROXY_WHEN["Yes"]},
+        ]
+    return block
+
+
+def get_calculated_summary_schema(answer_count):
+    """
+    A section of `answer_count` questions of two currency answers, followed by
+    a calculated summary totalling the first answer of every question.
+    """
+
+    def get_block_for_index(index):
+        def get_question(title):
+            return {
+                "id": f"question-{index}",
+                "type": "General",
+                "title": f"{title} {index}",
+                "answers": [
+                    {
+                        "id": f"{answer_id}-{index}",
+                        "type": "Currency",
+                        "currency": "GBP",
+                        "label": f"Answer {index}",
+                        "mandatory": False,
+                    }
+                    for answer_id in ("total-answer", "other-answer")
+                ],
+            }
+
+        return get_block(f"block-{index}", index, get_question)
+
+    blocks = [
+        {
+            "id": "proxy-block",
+            "type": "Question",
+            "question": {
+                "id": "proxy-question",
+                "type": "General",
+                "title": "Are you answering for yourself?",
+                "answers": [{"id": "proxy-answer", "type": "TextField"}],
+            },
+        }
+    ]
+    blocks += [get_block_for_index(index) for index in range(answer_count)]
+    blocks.append(
+        {
+            "id": "calculated-summary",
+            "type": "CalculatedSummary",
+            "title": "We calculate the total to be %(total)s. Is this correct?",
+            "calculation": {
+                "calculation_type": "sum",
+                "answers_to_calculate": [
+                    f"total-answer-{index}" for index in range(answer_count)
+                ],
+                "title": "Total",
+            },
+        }
+    )
+
+    return QuestionnaireSchema(
+        {"sections": [{"id": "section", "groups": [{"id": "group", "blocks": blocks}]}]}
+    )
+
+
+def test_calculated_summary(app, benchmark, answer_count):
+    schema = get_calculated_summary_schema(answer_count)
+    answer_store = AnswerStore([Answer("proxy-answer", "Yes").to_dict()])
+    for index in range(answer_count):
+        answer_store.add_or_update(Answer(f"total-answer-{index}", Decimal("12.34")))
+        answer_store.add_or_update(Answer(f"other-answer-{index}", Decimal("1")))
+    progress_store = ProgressStore(
+        [
+            {
+                "section_id": "section",
+                "list_item_id": None,
+                "status": CompletionStatus.IN_PROGRESS,
+                "block_ids": ["proxy-block"]
+                + [f"block-{index}" for index in range(answer_count)],
+            }
+        ]
+    )
+    context = CalculatedSummaryContext(
+        "en", schema, answer_store, ListStore(), progress_store, {}
+    )
+    location = Location(section_id="section", block_id="calculated-summary")
+
+    with app.test_request_context():
+        view_context = benchmark(
+            context.build_view_context_for_calculated_summary, location
+        )
+
+    assert view_context
+
+
+def get_questionnaire_summary_schema(section_count):
+    """
+    A section asking the respondent's name, then `section_count` sections of
+    radio questions, each with a placeholder for their name in its title.
+    """
+
+    def get_block_for_index(section_index, block_index):
+        block_id = f"block-{section_index}-{block_index}"
+
+        def get_question(title):
+            return {
+                "id": f"question-{block_id}",
+                "type": "General",
+                "title": {
+                    "text": f"{title} {block_index} about {{person_name_possessive}} answers",
+                    "placeholders": [PERSON_NAME_POSSESSIVE],
+                },
+                "answers": [
+                    {
+                        "id": f"answer-{section_index}-{block_index}",
+                        "type": "Radio",
+                        "mandatory": False,
+                        "options": [
+                            {"label": option, "value": option} for option in OPTIONS
+                        ],
+                    }
+                ],
+            }
+
+        return get_block(block_id, block_index, get_question)
+
+    sections = [
+        {
+            "id": "name-section",
+            "groups": [
+                {
+                    "id": "name-group",
+                    "blocks": [
+                        {
+                            "id": "name-block",
+                            "type": "Question",
+                            "question": {
+                                "id": "name-question",
+                                "type": "General",
+                                "title": "What is your name?",
+                                "answers": [
+                                    {"id": answer_id, "type": "TextField"}
+                                    for answer_id in (
+                                        "first-name",
+                                        "last-name",
+                                        "proxy-answer",
+                                    )
+                                ],
+                            },
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+    sections += [
+        {
+            "id": f"section-{section_index}",
+            "title": f"Section {section_index}",
+            "groups": [
+                {
+                    "id": f"group-{section_index}",
+                    "title": f"Group {section_index}",
+                    "blocks": [
+                        get_block_for_index(section_index, block_index)
+                        for block_index in range(SUMMARY_BLOCK_COUNT)
+                    ],
+                }
+            ],
+        }
+        for section_index in range(section_count)
+    ]
+    sections[-1]["groups"][0]["blocks"].append({"id": "summary", "type": "Summary"})
+
+    return QuestionnaireSchema({"sections": sections})
+
+
+def test_questionnaire_summary(app, benchmark, section_count):
+    schema = get_questionnaire_summary_schema(section_count)
+    answer_store = AnswerStore(
+        [
+            Answer(answer_id, value).to_dict()
+            for answer_id, value in (
+                ("first-name", "Joe"),
+                ("last-name", "Bloggs"),
+                ("proxy-answer", "Yes"),
+            )
+        ]
+    )
+    progress = []
+    for section in schema.get_sections():
+        block_ids = [
+            block["id"] for block in QuestionnaireSchema.get_blocks_for_section(section)
+        ]
+        for block_id in block_ids:
+            for answer_id in schema.get_answer_ids_for_block(block_id):
+                if answer_id.startswith("answer-"):
+                    answer_store.add_or_update(Answer(answer_id, OPTIONS[0]))
+        progress.append(
+            {
+                "section_id": section["id"],
+                "list_item_id": None,
+                "status": CompletionStatus.COMPLETED,
+                "block_ids": block_ids,
+            }
+        )
+    context = QuestionnaireSummaryContext(
+        "en", schema, answer_store, ListStore(), ProgressStore(progress), {}
+    )
+
+    with app.test_request_context():
+        summary = benchmark(context)
+
+    assert len(summary["summary"]["groups"]) == section_count + 1
@@ -0,0 +1,71 @@
+import pytest
+from jinja2 import Markup
+
+from app.questionnaire.plural_forms import get_plural_form_key
+from app.questionnaire.text_template import get_text_template
+from app.utilities.schema import get_schema_path_map_for_language, load_schema_from_name
+
+LANGUAGE_CODES = ("en", "cy")
+
+COUNTS = range(11)
+
+
+def get_placeholder_texts(language_code):
+    """ Every placeholder text and plural form in the test schemas, with values
+    for its placeholders. """
+    texts = []
+
+    for schema_name in get_schema_path_map_for_language(language_code):
+        if not schema_name.startswith("test_"):
+            continue
+
+        schema = load_schema_from_name(schema_name, language_code)
+        for site in schema.get_placeholder_sites(schema.json):
+            placeholder_data = schema.json
+            for key in site:
+                placeholder_data = placeholder_data[key]
+
+            values = {
+                placeholder["placeholder"]: Markup(placeholder["placeholder"])
+                for placeholder in placeholder_data["placeholders"]
+            }
+            if "text_plural" in placeholder_data:
+                texts += [
+                    (text, values)
+                    for text in placeholder_data["text_plural"]["forms"].values()
+                ]
+            else:
+                texts.append((placeholder_data["text"], values))
+
+    return texts
+
+
+def format_texts(texts):
+    return [text.format(**values) for text, values in texts]
+
+
+def format_templates(texts):
+    return [get_text_template(text).format(values) for text, values in texts]
+
+
+FORMATTERS = {"str.format": format_texts, "template": format_templates}
+
+
+@pytest.mark.parametrize("language_code", LANGUAGE_CODES)
+@pytest.mark.parametrize("formatter", list(FORMATTERS))
+def test_format_test_schema_texts(app, benchmark, language_code, formatter):
+    with app.app_context():
+        texts = get_placeholder_texts(language_code)
+
+    formatted_texts = benchmark(FORMATTERS[formatter], texts)
+
+    assert formatted_texts == format_texts(texts)
+
+
+def choose_plural_forms(language_code):
+    return [get_plural_form_key(count, language_code) for count in COUNTS]
+
+
+@pytest.mark.parametrize("language_code", LANGUAGE_CODES)
+def test_choose_plural_forms(benchmark, language_code):
+    assert len(benchmark(choose_plural_forms, language_code)) == len(COUNTS)
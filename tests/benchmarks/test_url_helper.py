@@ -0,0 +1,47 @@
+import pytest
+from flask import url_for
+
+from app.helpers.url_helper import build_url
+
+# The links a list collector summary or the hub builds for each list item
+LINKS = (
+    ("questionnaire.block", {"block_id": "block-{index}"}),
+    (
+        "questionnaire.block",
+        {
+            "list_name": "people",
+            "list_item_id": "item{index}",
+            "block_id": "edit-person",
+            "return_to": "section-summary",
+        },
+    ),
+    ("questionnaire.get_section", {"section_id": "section-{index}"}),
+    (
+        "questionnaire.relationship",
+        {
+            "block_id": "relationships",
+            "list_item_id": "item{index}",
+            "to_list_item_id": "item{index}-to",
+        },
+    ),
+)
+
+BUILDERS = {"url_for": url_for, "build_url": build_url}
+
+
+def build_links(build, links):
+    return [build(endpoint, **values) for endpoint, values in links]
+
+
+@pytest.mark.parametrize("builder", list(BUILDERS))
+def test_build_links(app, benchmark, list_item_count, builder):
+    links = [
+        (endpoint, {key: value.format(index=index) for key, value in values.items()})
+        for index in range(list_item_count)
+        for endpoint, values in LINKS
+    ]
+
+    with app.test_request_context():
+        urls = benchmark(build_links, BUILDERS[builder], links)
+
+    assert len(urls) == len(LINKS) * list_item_count
@@ -0,0 +1,102 @@
+from mock import PropertyMock, patch
+
+from app.data_model.questionnaire_store import QuestionnaireStore
+from app.routes.questionnaire import _build_hub
+from tests.integration.integration_test_case import IntegrationTestCase
+
+HUB_URL = "/questionnaire/"
+
+
+class TestQuestionnaireHubCache(IntegrationTestCase):
+    def setUp(self):
+        super().setUp()
+        self._build_hub = patch(
+            "app.routes.questionnaire._build_hub", wraps=_build_hub
+        ).start()
+
+    def tearDown(self):
+        patch.stopall()
+        super().tearDown()
+
+    def test_revisit_is_served_from_cache(self):
+        # Given I have visited the hub
+        self.launchSurvey("test_hub_and_spoke")
+        self.assertEqualUrl(HUB_URL)
+        self.assertEqual(self._build_hub.call_count, 1)
+
+        # When I visit it again without changing anything
+        self.get(HUB_URL)
+
+        # Then the hub is served from the cache
+        self.assertStatusOK()
+        self.assertInBody("Choose another section to complete")
+        self.assertEqual(self._build_hub.call_count, 1)
+
+    def test_cache_not_used_after_progress_changes(self):
+        # Given I have visited the hub
+        self.launchSurvey("test_hub_and_spoke")
+        self.assertNotInBody("Partially completed")
+
+        # When I start a section and return to the hub
+        self.post(action="submit")
+        self.post({"employment-status-answer-exclusive": "None of these apply"})
+        self.get(HUB_URL)
+
+        # Then the hub is built again, showing the section in progress
+        self.assertEqual(self._build_hub.call_count, 2)
+        self.assertInBody("Partially completed")
+
+    def test_cache_not_used_after_answers_change(self):
+        # Given I have completed a section and visited the hub
+        self.launchSurvey("test_hub_and_spoke")
+        self.post(action="submit")
+        self.post({"employment-status-answer": "Working as an employee"})
+        self.assertEqualUrl(HUB_URL)
+        build_count = self._build_hub.call_count
+
+        # When I change an answer in the section and return to the hub
+        self.get("/questionnaire/employment-status/")
+        self.post({"employment-status-answer": "Self-employed or freelance"})
+        self.get(HUB_URL)
+
+        # Then the hub is built again
+        self.assertEqualUrl(HUB_URL)
+        self.assertEqual(self._build_hub.call_count, build_count + 1)
+
+    def test_cache_not_used_after_list_changes(self):
+        # Given I have added a person and visited the hub
+        self.launchSurvey("test_repeating_sections_with_hub_and_spoke")
+        self.post(action="submit")
+        self.post({"you-live-here": "Yes"})
+        self.post({"first-name": "John", "last-name": "Doe"})
+        self.post({"anyone-else": "No"})
+        self.post(action="submit")
+        self.post({"another-anyone-else": "No"})
+        self.post({"visitors-anyone-else": "No"})
+        self.assertEqualUrl(HUB_URL)
+        self.assertNotInBody("Anna Doe")
+
+        # When I add another person and return to the hub
+        self.get("/questionnaire/list-collector/")
+        self.post({"anyone-else": "Yes"})
+        self.post({"first-name": "Anna", "last-name": "Doe"})
+        self.get(HUB_URL)
+
+        # Then the hub is built again, with a section for the new person
+        self.assertInBody("Anna Doe")
+
+    def test_users_with_the_same_stored_data_do_not_share_the_cache(self):
+        # Given the stored data of every user is treated as the same
+        with patch.object(
+            QuestionnaireStore,
+            "state_key",
+            new_callable=PropertyMock,
+            return_value="same-state",
+        ):
+            # When two users visit the hub
+            self.launchSurvey("test_hub_and_spoke", response_id="1111111111111111")
+            self.launchSurvey("test_hub_and_spoke", response_id="2222222222222222")
+
+        # Then the hub is built for each of them
+        self.assertEqualUrl(HUB_URL)
+        self.assertEqual(self._build_hub.call_count, 2)
@@ -1,5 +1,6 @@
 import json
 
+from app.profiler import SamplingProfiler
 from tests.integration.integration_test_case import IntegrationTestCase
 
 
@@ -292,3 +293,60 @@ class TestDumpRoute(IntegrationTestCase):
             }
         ]
         assert actual == expected
+
+
+class TestDumpProfile(IntegrationTestCase):
+    def test_dump_profile_not_authenticated(self):
+        # Given I am not an authenticated user
+        # When I attempt to dump the profiles
+        self.get("/dump/profile")
+
+        # Then I receive a 401 Unauthorised response code
+        self.assertStatusUnauthorised()
+
+    def test_dump_profile_authenticated_missing_role(self):
+        # Given I am an authenticated user who has launched a survey
+        # but does not have the 'dumper' role in my metadata
+        self.launchSurvey("test_radio_mandatory")
+
+        # When I attempt to dump the profiles
+        self.get("/dump/profile")
+
+        # Then I receive a 403 Forbidden response code
+        self.assertStatusForbidden()
+
+    def test_dump_profile_profiling_disabled(self):
+        # Given I am an authenticated user with the 'dumper' role
+        # and profiling is disabled
+        self.launchSurvey("test_radio_mandatory", roles=["dumper"])
+
+        # When I attempt to dump the profiles
+        self.get("/dump/profile")
+
+        # Then I receive a 404 Not Found response code
+        self.assertStatusNotFound()
+
+    def test_dump_profile_authenticated_with_role(self):
+        # Given profiling is enabled for every request
+        profiler = SamplingProfiler(
+            sample_rate=1, interval_seconds=0.001, max_stacks=100
+        )
+        profiler.start_request("questionnaire.block")
+        profiler.stop_request()
+        self._application.eq["profiler"] = profiler
+
+        # And I am an authenticated user with the 'dumper' role
+        self.launchSurvey("test_radio_mandatory", roles=["dumper"])
+
+        # When I dump the profiles and clear them
+        self.get("/dump/profile?clear")
+
+        # Then I get a 200 OK response
+        self.assertStatusOK()
+
+        # And the JSON response contains the profiled endpoints
+        actual = json.loads(self.getResponseData())
+        assert actual["questionnaire.block"]["requests"] == 1
+
+        # And the profiles have been cleared
+        assert profiler.get_profiles() == {}
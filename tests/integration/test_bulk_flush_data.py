@@ -0,0 +1,254 @@
+import json
+import time
+import uuid
+
+from mock import patch
+
+from app.data_model.answer import Answer
+from app.data_model.questionnaire_store import QuestionnaireStore
+from app.routes.flush import _get_user
+from app.storage.encrypted_questionnaire_storage import EncryptedQuestionnaireStorage
+from tests.integration.create_token import PAYLOAD
+from tests.integration.integration_test_case import IntegrationTestCase
+
+
+class TestBulkFlushData(IntegrationTestCase):
+    def setUp(self):
+        self.submitter_patcher = patch("app.setup.LogSubmitter")
+        mock_submitter_class = self.submitter_patcher.start()
+        self.submitter_instance = mock_submitter_class.return_value
+        self.submitter_instance.send_message.return_value = True
+
+        self.encrypter_patcher = patch("app.routes.flush.encrypt")
+        self.encrypt_instance = self.encrypter_patcher.start()
+
+        super().setUp()
+
+    def tearDown(self):
+        self.submitter_patcher.stop()
+        self.encrypter_patcher.stop()
+
+        super().tearDown()
+
+    def test_bulk_flush_flushes_each_questionnaire(self):
+        response_ids = ["1234567890123456", "1234567890123457"]
+        for response_id in response_ids:
+            self.save_questionnaire(response_id)
+
+        results = self.bulk_flush(
+            [self.flush_token(response_id) for response_id in response_ids]
+        )
+
+        self.assertStatusOK()
+        self.assertEqual(
+            results, [{"index": 0, "status": 200}, {"index": 1, "status": 200}]
+        )
+        self.assertEqual(self.submitter_instance.send_message.call_count, 2)
+        self.assertTrue('"flushed": true' in self.encrypt_instance.call_args[0][0])
+        self.assertEqual(self.count_questionnaire_states(), 0)
+
+    def test_bulk_flush_reports_each_item(self):
+        self.save_questionnaire("1234567890123456")
+        self.save_questionnaire("1234567890123457", answers=[])
+
+        results = self.bulk_flush(
+            [
+                self.flush_token("1234567890123456"),
+                self.flush_token("0000000000000000"),
+                self.flush_token("1234567890123457"),
+                self.flush_token("1234567890123456", roles=["test"]),
+                "not a token",
+            ]
+        )
+
+        self.assertEqual(
+            results,
+            [
+                {"index": 0, "status": 200},
+                {"index": 1, "status": 404},
+                {"index": 2, "status": 404},
+                {"index": 3, "status": 403},
+                {"index": 4, "status": 403},
+            ],
+        )
+        self.assertEqual(self.submitter_instance.send_message.call_count, 1)
+
+    def test_bulk_flush_keeps_questionnaire_when_submission_fails(self):
+        self.save_questionnaire("1234567890123456")
+        self.submitter_instance.send_message.return_value = False
+
+        results = self.bulk_flush([self.flush_token("1234567890123456")])
+
+        self.assertEqual(results, [{"index": 0, "status": 500}])
+        self.assertEqual(self.count_questionnaire_states(), 1)
+
+    def test_bulk_flush_submits_duplicate_tokens_once(self):
+        self.save_questionnaire("1234567890123456")
+
+        results = self.bulk_flush(
+            [self.flush_token("1234567890123456"), self.flush_token("1234567890123456")]
+        )
+
+        self.assertEqual(
+            results, [{"index": 0, "status": 200}, {"index": 1, "status": 200}]
+        )
+        self.assertEqual(self.submitter_instance.send_message.call_count, 1)
+        self.assertEqual(self.count_questionnaire_states(), 0)
+
+    def test_bulk_flush_reports_failed_items(self):
+        self.save_questionnaire("1234567890123456")
+        token_without_response_id = self.token_generator.generate_token(
+            {
+                "jti": str(uuid.uuid4()),
+                "iat": time.time(),
+                "exp": time.time() + 1000,
+                "roles": ["flusher"],
+            }
+        )
+
+        results = self.bulk_flush(
+            [token_without_response_id, 123, self.flush_token("1234567890123456")]
+        )
+
+        self.assertEqual(
+            results,
+            [
+                {"index": 0, "status": 500},
+                {"index": 1, "status": 500},
+                {"index": 2, "status": 200},
+            ],
+        )
+
+    def test_bulk_flush_reports_items_when_delete_fails(self):
+        self.save_questionnaire("1234567890123456")
+
+        with patch.object(
+            self._application.eq["storage"],
+            "delete_many",
+            side_effect=Exception("unable to delete"),
+        ):
+            results = self.bulk_flush([self.flush_token("1234567890123456")])
+
+        self.assertEqual(results, [{"index": 0, "status": 200, "deleted": False}])
+        self.assertEqual(self.submitter_instance.send_message.call_count, 1)
+        self.assertEqual(self.count_questionnaire_states(), 1)
+
+    def test_bulk_flush_continues_after_chunk_cannot_be_read(self):
+        response_ids = [str(1234567890123456 + offset) for offset in range(4)]
+        for response_id in response_ids:
+            self.save_questionnaire(response_id)
+
+        storage = self._application.eq["storage"]
+        get_by_keys = storage.get_by_keys
+        reads = []
+
+        def get_by_keys_failing_once(model_type, keys):
+            reads.append(keys)
+            if len(reads) == 1:
+                raise Exception("unable to read")
+            return get_by_keys(model_type, keys)
+
+        with patch("app.routes.flush.BULK_FLUSH_CHUNK_SIZE", 2), patch.object(
+            storage, "get_by_keys", side_effect=get_by_keys_failing_once
+        ):
+            results = self.bulk_flush(
+                [self.flush_token(response_id) for response_id in response_ids]
+                + ["not a token"]
+            )
+
+        self.assertEqual(
+            results,
+            [
+                {"index": 0, "status": 500},
+                {"index": 1, "status": 500},
+                {"index": 2, "status": 200},
+                {"index": 3, "status": 200},
+                {"index": 4, "status": 403},
+            ],
+        )
+        self.assertEqual(self.count_questionnaire_states(), 2)
+
+    def test_double_bulk_flush(self):
+        self.save_questionnaire("1234567890123456")
+        self.bulk_flush([self.flush_token("1234567890123456")])
+
+        results = self.bulk_flush([self.flush_token("1234567890123456")])
+
+        self.assertEqual(results, [{"index": 0, "status": 404}])
+
+    def test_bulk_flush_processes_chunks(self):
+        response_ids = [str(1234567890123456 + offset) for offset in range(5)]
+        for response_id in response_ids:
+            self.save_questionnaire(response_id)
+
+        with patch("app.routes.flush.BULK_FLUSH_CHUNK_SIZE", 2):
+            results = self.bulk_flush(
+                [self.flush_token(response_id) for response_id in response_ids]
+            )
+
+        self.assertEqual([result["index"] for result in results], list(range(5)))
+        self.assertTrue(all(result["status"] == 200 for result in results))
+
+    def test_bulk_flush_without_tokens(self):
+        self.post_json({"tokens": []})
+        self.assertStatusCode(400)
+
+        self.post_json(["token"])
+        self.assertStatusCode(400)
+
+    def test_bulk_flush_too_many_tokens(self):
+        self._application.config["EQ_BULK_FLUSH_MAX_BATCH_SIZE"] = 1
+
+        self.post_json({"tokens": ["token-1", "token-2"]})
+
+        self.assertStatusCode(413)
+
+    def post_json(self, payload):
+        environ, response = self._client.post(
+            "/flush/bulk", json=payload, as_tuple=True
+        )
+        self._cache_response(environ, response)
+
+    def bulk_flush(self, tokens):
+        self.post_json({"tokens": tokens})
+        return [
+            json.loads(line) for line in self.getResponseData().splitlines() if line
+        ]
+
+    def flush_token(self, response_id, roles=None):
+        return self.token_generator.generate_token(
+            {
+                "jti": str(uuid.uuid4()),
+                "iat": time.time(),
+                "exp": time.time() + 1000,
+                "response_id": response_id,
+                "roles": ["flusher"] if roles is None else roles,
+            }
+        )
+
+    def save_questionnaire(self, response_id, answers=None):
+        if answers is None:
+            answers = [Answer("name-answer", "Joe Bloggs")]
+
+        with self._application.app_context():
+            user = _get_user(response_id)
+            pepper = self._application.eq["secret_store"].get_secret_by_name(
+                "EQ_SERVER_SIDE_STORAGE_ENCRYPTION_USER_PEPPER"
+            )
+            questionnaire_store = QuestionnaireStore(
+                EncryptedQuestionnaireStorage(user.user_id, user.user_ik, pepper)
+            )
+            questionnaire_store.set_metadata(
+                {
+                    **PAYLOAD,
+                    "response_id": response_id,
+                    "tx_id": str(uuid.uuid4()),
+                    "schema_name": "test_textfield",
+                }
+            )
+            for answer in answers:
+                questionnaire_store.answer_store.add_or_update(answer)
+            questionnaire_store.save()
+
+    def count_questionnaire_states(self):
+        return len(self._application.eq["storage"].client.storage)